@@ -2,8 +2,9 @@ import discord
 from redbot.core import commands, Config
 from datetime import datetime, timezone, timedelta
 import json
-from typing import Literal, Union
+from typing import Dict, List, Literal, Optional, Set, Tuple, Union
 import asyncio
+import heapq
 from discord.ext import tasks
 
 class ChannelNavigatorView(discord.ui.View):
@@ -113,6 +114,131 @@ class ChannelNavigatorView(discord.ui.View):
         await interaction.response.edit_message(embed=embed, view=self)
 
 
+class RoleChangeQueue:
+    """
+    Per-guild queue for reward role changes.
+    Pending adds/removes for the same member are folded into a single member.edit(roles=...).
+    Pacing is left to discord.py's HTTP client, which waits on the X-RateLimit-* bucket headers;
+    a 429 that still escapes is retried after its Retry-After instead of a fixed sleep.
+
+    The role list is computed from the live member cache. The roles returned by our last edit are only
+    used until the next on_member_update for that member (see member_updated), so changes made by
+    moderators or other bots are never overwritten with an older snapshot.
+    """
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, guild: discord.Guild):
+        self.guild = guild
+        self._pending: Dict[int, dict] = {}
+        self._last_written: Dict[int, Set[int]] = {}
+        self._writing: Optional[int] = None # Member whose edit is in flight
+        self._write_superseded = False # A gateway update for _writing arrived while the edit was in flight
+        self._worker: Optional[asyncio.Task] = None
+
+    def submit(self, member: discord.Member, add, remove, reason: str = None) -> asyncio.Future:
+        """Queue role changes for a member. The future resolves to True once they are applied."""
+        entry = self._pending.get(member.id)
+        if entry is None:
+            entry = self._pending[member.id] = {"add": set(), "remove": set(), "reasons": [], "futures": []}
+        for role in add:
+            entry["remove"].discard(role.id)
+            entry["add"].add(role.id)
+        for role in remove:
+            entry["add"].discard(role.id)
+            entry["remove"].add(role.id)
+        if reason and reason not in entry["reasons"]:
+            entry["reasons"].append(reason)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        entry["futures"].append(future)
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        return future
+
+    def cancel(self):
+        if self._worker:
+            self._worker.cancel()
+        for entry in self._pending.values():
+            self._resolve(entry, False)
+        self._pending.clear()
+
+    def member_updated(self, member_id: int):
+        """The gateway refreshed this member, so the cache is at least as new as our last write."""
+        self._last_written.pop(member_id, None)
+        if member_id == self._writing:
+            self._write_superseded = True
+
+    @staticmethod
+    def _resolve(entry: dict, result: bool):
+        for future in entry["futures"]:
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self):
+        while self._pending:
+            member_id = next(iter(self._pending))
+            entry = self._pending.pop(member_id)
+            try:
+                result = await self._apply(member_id, entry)
+            except asyncio.CancelledError:
+                self._resolve(entry, False)
+                raise
+            except Exception as e:
+                print(f"Error applying reward roles for {member_id}: {e}")
+                result = False
+            self._resolve(entry, result)
+
+    def _current_role_ids(self, member: discord.Member) -> Set[int]:
+        cached = {r.id for r in member.roles if not r.is_default()}
+        written = self._last_written.get(member.id)
+        if written is None or written == cached:
+            self._last_written.pop(member.id, None)
+            return cached
+        return written
+
+    async def _apply(self, member_id: int, entry: dict) -> bool:
+        member = self.guild.get_member(member_id)
+        if member is None:
+            return False
+        reason = ", ".join(entry["reasons"]) or None
+
+        for attempt in range(self.MAX_ATTEMPTS):
+            # Recomputed per attempt so changes made while backing off are kept
+            current = self._current_role_ids(member)
+            target = (current - entry["remove"]) | entry["add"]
+            if target == current:
+                return True
+            roles = [r for r in map(self.guild.get_role, target) if r is not None]
+
+            self._writing, self._write_superseded = member_id, False
+            try:
+                updated = await member.edit(roles=roles, reason=reason)
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt + 1 == self.MAX_ATTEMPTS:
+                    return False
+                await asyncio.sleep(self._retry_after(e))
+            else:
+                if not self._write_superseded:
+                    # Discord's response reflects every change made up to our write
+                    written = {r.id for r in updated.roles if not r.is_default()} if updated else target
+                    self._last_written[member_id] = written
+                return True
+            finally:
+                self._writing = None
+        return False
+
+    @staticmethod
+    def _retry_after(error: discord.HTTPException) -> float:
+        headers = getattr(error.response, "headers", None) or {}
+        for key in ("Retry-After", "X-RateLimit-Reset-After"):
+            try:
+                return max(float(headers[key]), 0.0)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return 1.0
+
+
 class About(commands.Cog):
     """A cog to show you information about yourself, the server, its channels and users.."""
 
@@ -147,11 +273,25 @@ class About(commands.Cog):
         }
         self.config.register_guild(**default_guild)
         self.config.register_member(role_start_times={}) 
+
+        # Compiled reward plans per guild, dropped whenever aboutset edits the reward config
+        self._reward_plans: Dict[int, dict] = {}
+        # (guild_id, member_id) -> earliest timestamp a tenure threshold is crossed
+        self._reward_due: Dict[Tuple[int, int], float] = {}
+        self._reward_due_heap: List[Tuple[float, int, int]] = []
+        # Guilds whose members all need re-evaluating on the next pass
+        self._reward_sweep_guilds: Set[int] = set()
+        self._reward_index_ready = False
+        # Per-guild role mutation queues used by the reward checks
+        self._role_queues: Dict[int, RoleChangeQueue] = {}
         
         self.check_rewards.start()
 
     def cog_unload(self):
         self.check_rewards.cancel()
+        for queue in self._role_queues.values():
+            queue.cancel()
+        self._role_queues.clear()
 
     async def _process_member_status(self, ctx, member: discord.Member):
         """Helper function to generate the member status embed."""
@@ -472,11 +612,102 @@ class About(commands.Cog):
 
         return embed
 
+    # --- REWARD PLAN CACHE ---
+    def _compile_reward_plan(self, guild: discord.Guild, guild_data: dict) -> dict:
+        """
+        Resolves a guild's reward configuration into role objects once.
+        The result is cached until an aboutset command or a role deletion changes it.
+        """
+        rewards = []
+        for rid, data in guild_data.get("reward_roles", {}).items():
+            r = guild.get_role(int(rid))
+            if r:
+                rewards.append((r, data['days'], data['level'], data.get('message'), data.get('channel_id'), False)) # False = Not Secret
+
+        for rid, data in guild_data.get("secret_rewards", {}).items():
+            r = guild.get_role(int(rid))
+            if r:
+                rewards.append((r, data['days'], data['level'], None, data.get('channel_id'), True)) # True = Secret
+
+        advanced = []
+        for req_id, data in guild_data.get("advanced_rewards", {}).items():
+            req_role = guild.get_role(int(req_id))
+            r1 = guild.get_role(int(data['role1_id']))
+            r2 = guild.get_role(int(data['role2_id']))
+            if req_role and r1 and r2:
+                advanced.append((req_role, r1, r2, data['level'], data['days_min'], data['duration']))
+
+        optin = []
+        for base_id, data in guild_data.get("optin_roles", {}).items():
+            base_role = guild.get_role(int(base_id))
+            target_role = guild.get_role(int(data.get("target_id", 0)))
+            if base_role and target_role:
+                optin.append((base_role, target_role, data.get("days", 0), data.get("level", 0)))
+
+        # Roles whose manual assignment can make a member eligible for something
+        trigger_ids = {req_role.id for req_role, *_ in advanced}
+        trigger_ids.update(r1.id for _, r1, *_ in advanced)
+        trigger_ids.update(base_role.id for base_role, *_ in optin)
+
+        return {
+            "rewards": rewards,
+            "advanced": advanced,
+            "optin": optin,
+            "trigger_ids": trigger_ids,
+            "empty": not (rewards or advanced or optin),
+        }
+
+    async def _get_reward_plan(self, guild: discord.Guild) -> dict:
+        plan = self._reward_plans.get(guild.id)
+        if plan is None:
+            guild_data = await self.config.guild(guild).all()
+            plan = self._compile_reward_plan(guild, guild_data)
+            self._reward_plans[guild.id] = plan
+        return plan
+
+    def _invalidate_reward_plan(self, guild: discord.Guild, resweep: bool = True):
+        """Drops the cached plan. With resweep, every member is re-evaluated on the next pass."""
+        self._reward_plans.pop(guild.id, None)
+        if resweep:
+            self._reward_sweep_guilds.add(guild.id)
+
+    def _role_queue(self, guild: discord.Guild) -> RoleChangeQueue:
+        queue = self._role_queues.get(guild.id)
+        if queue is None:
+            queue = self._role_queues[guild.id] = RoleChangeQueue(guild)
+        return queue
+
+    # --- TENURE DUE-DATE INDEX ---
+    def _schedule_reward_check(self, member: discord.Member, due_ts: Optional[float]):
+        """Records the earliest time a member could newly qualify by tenure (None clears it)."""
+        key = (member.guild.id, member.id)
+        if due_ts is None:
+            self._reward_due.pop(key, None)
+            return
+        if self._reward_due.get(key) == due_ts:
+            return
+        self._reward_due[key] = due_ts
+        heapq.heappush(self._reward_due_heap, (due_ts, member.guild.id, member.id))
+
+    def _pop_due_reward_checks(self, now_ts: float) -> List[Tuple[int, int]]:
+        due = []
+        heap = self._reward_due_heap
+        while heap and heap[0][0] <= now_ts:
+            due_ts, guild_id, member_id = heapq.heappop(heap)
+            key = (guild_id, member_id)
+            # Stale heap entries are skipped; the dict holds the live due date.
+            if self._reward_due.get(key) != due_ts:
+                continue
+            del self._reward_due[key]
+            due.append(key)
+        return due
+
     # --- SHARED REWARD LOGIC ---
     async def _grant_rewards_for_member(self, member: discord.Member, level_override: int = None):
         """
         Shared logic to check and grant rewards for a single member.
         Used by both the loop (periodic check) and the event listener (instant check).
+        Afterwards the member is re-indexed under the next tenure threshold they have yet to reach.
         """
         if member.bot: 
             return
@@ -486,165 +717,180 @@ class About(commands.Cog):
         if not levelup_cog:
             return
 
-        # Load Configs
-        reward_roles_config = await self.config.guild(guild).reward_roles()
-        secret_rewards_config = await self.config.guild(guild).secret_rewards()
-        advanced_config = await self.config.guild(guild).advanced_rewards()
-        optin_config = await self.config.guild(guild).optin_roles()
-
-        # Cache basic rewards
-        active_rewards = []
-        if reward_roles_config:
-            for rid, data in reward_roles_config.items():
-                r = guild.get_role(int(rid))
-                if r:
-                    active_rewards.append((r, data['days'], data['level'], data.get('message'), data.get('channel_id'), False)) # False = Not Secret
-        
-        if secret_rewards_config:
-            for rid, data in secret_rewards_config.items():
-                r = guild.get_role(int(rid))
-                if r:
-                    active_rewards.append((r, data['days'], data['level'], None, data.get('channel_id'), True)) # True = Secret
-
-        # Cache advanced rewards
-        active_advanced = []
-        if advanced_config:
-            for req_id, data in advanced_config.items():
-                req_role = guild.get_role(int(req_id))
-                r1 = guild.get_role(int(data['role1_id']))
-                r2 = guild.get_role(int(data['role2_id']))
-                if req_role and r1 and r2:
-                    active_advanced.append((req_role, r1, r2, data['level'], data['days_min'], data['duration']))
-
-        if not active_rewards and not active_advanced and not optin_config:
+        plan = await self._get_reward_plan(guild)
+        if plan["empty"]:
+            self._schedule_reward_check(member, None)
             return
 
+        next_due = None
+
+        def track_due(ts):
+            nonlocal next_due
+            if next_due is None or ts < next_due:
+                next_due = ts
+
         try:
-            # Use override if provided (from listener), otherwise fetch
-            if level_override is not None:
-                level = level_override
-            else:
-                level = await levelup_cog.get_level(member)
-            
+            # Use override if provided (from listener), otherwise fetch lazily
+            # once a tenure requirement is actually met.
+            level = level_override
+
+            async def current_level():
+                nonlocal level
+                if level is None:
+                    level = await levelup_cog.get_level(member)
+                return level
+
+            now = datetime.now(timezone.utc)
+            current_ts = now.timestamp()
             if member.joined_at:
-                now = datetime.now(timezone.utc)
-                diff = now - member.joined_at
-                days_in = diff.days
+                joined_ts = member.joined_at.timestamp()
+                days_in = (now - member.joined_at).days
             else:
+                joined_ts = None
                 days_in = 0
 
+            def tenure_met(req_days):
+                if days_in >= req_days:
+                    return True
+                if joined_ts is not None:
+                    track_due(joined_ts + req_days * 86400)
+                return False
+
+            held = {r.id for r in member.roles}
+            adds, removes, reasons = [], [], []
+            alerts = []          # (channel, content, is_ghost_ping) sent once the roles stick
+            start_times = {}     # role1 id -> start timestamp, or None to clear
+
+            def queue_change(add=(), remove=(), reason=None):
+                for role in add:
+                    adds.append(role)
+                    held.add(role.id)
+                for role in remove:
+                    removes.append(role)
+                    held.discard(role.id)
+                if reason not in reasons:
+                    reasons.append(reason)
+
             # 1. Standard & Secret Rewards
-            for role, req_days, req_level, msg, ch_id, is_secret in active_rewards:
-                if role in member.roles:
+            for role, req_days, req_level, msg, ch_id, is_secret in plan["rewards"]:
+                if role.id in held:
                     continue
 
-                if days_in >= req_days and level >= req_level:
-                    try:
-                        await member.add_roles(role, reason="About Cog: Auto-Reward")
-                        if ch_id:
-                            alert_channel = guild.get_channel(ch_id)
-                            if alert_channel:
-                                if is_secret:
-                                    # Ghost Ping
-                                    try:
-                                        ping = await alert_channel.send(member.mention)
-                                        await asyncio.sleep(5)
-                                        await ping.delete()
-                                    except (discord.Forbidden, discord.HTTPException):
-                                        pass
-                                elif msg:
-                                    # Standard Message
-                                    try:
-                                        final_message = msg.replace("{mention}", member.mention)
-                                        await alert_channel.send(final_message)
-                                    except (discord.Forbidden, discord.HTTPException):
-                                        pass
-                        await asyncio.sleep(2)
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
+                if tenure_met(req_days) and await current_level() >= req_level:
+                    queue_change(add=[role], reason="About Cog: Auto-Reward")
+                    alert_channel = guild.get_channel(ch_id) if ch_id else None
+                    if alert_channel:
+                        if is_secret:
+                            alerts.append((alert_channel, member.mention, True))
+                        elif msg:
+                            alerts.append((alert_channel, msg.replace("{mention}", member.mention), False))
 
             # 2. Advanced Rewards
-            for req_role, r1, r2, req_lvl, d_min, duration in active_advanced:
+            member_timestamps = None
+            for req_role, r1, r2, req_lvl, d_min, duration in plan["advanced"]:
                 
-                if r2 in member.roles:
+                if r2.id in held:
                     continue
 
-                if r1 in member.roles:
-                    member_timestamps = await self.config.member(member).role_start_times()
+                if r1.id in held:
+                    if member_timestamps is None:
+                        member_timestamps = await self.config.member(member).role_start_times()
                     start_ts = member_timestamps.get(str(r1.id))
-                    current_ts = now.timestamp()
                     
                     if start_ts is None:
-                        async with self.config.member(member).role_start_times() as times:
-                            times[str(r1.id)] = current_ts
+                        start_times[str(r1.id)] = current_ts
+                        track_due(current_ts + duration * 86400)
                     else:
                         start_dt = datetime.fromtimestamp(start_ts, timezone.utc)
                         days_held = (now - start_dt).days
                         
                         if days_held >= duration:
-                            try:
-                                await member.remove_roles(r1, reason="About Cog: Adv Upgrade Remove")
-                                await asyncio.sleep(1)
-                                await member.add_roles(r2, reason="About Cog: Adv Upgrade Add")
-                                
-                                async with self.config.member(member).role_start_times() as times:
-                                    if str(r1.id) in times:
-                                        del times[str(r1.id)]
-                                
-                                await asyncio.sleep(2)
-                            except (discord.Forbidden, discord.HTTPException):
-                                pass
-                elif req_role in member.roles:
-                    if days_in >= d_min and level >= req_lvl:
-                        try:
-                            await member.add_roles(r1, reason="About Cog: Adv Initial Grant")
-                            await asyncio.sleep(1)
-                            await member.remove_roles(req_role, reason="About Cog: Adv Req Remove")
-                            
-                            async with self.config.member(member).role_start_times() as times:
-                                times[str(r1.id)] = now.timestamp()
-                                
-                            await asyncio.sleep(2)
-                        except (discord.Forbidden, discord.HTTPException):
-                            pass
+                            queue_change(add=[r2], remove=[r1], reason="About Cog: Adv Upgrade")
+                            start_times[str(r1.id)] = None
+                        else:
+                            track_due(start_ts + duration * 86400)
+                elif req_role.id in held:
+                    if tenure_met(d_min) and await current_level() >= req_lvl:
+                        queue_change(add=[r1], remove=[req_role], reason="About Cog: Adv Initial Grant")
+                        start_times[str(r1.id)] = current_ts
+                        track_due(current_ts + duration * 86400)
 
             # 3. Opt-in Rewards (Auto-Grant if base role held and reqs met)
-            for base_id, data in optin_config.items():
-                base_role = guild.get_role(int(base_id))
-                target_role = guild.get_role(int(data.get("target_id", 0)))
-                
-                if not base_role or not target_role:
-                    continue
-
+            for base_role, target_role, req_days, req_level in plan["optin"]:
                 # If member has target already, skip
-                if target_role in member.roles:
+                if target_role.id in held:
                     continue
 
                 # If member has base role, check requirements
-                if base_role in member.roles:
-                    req_days = data.get("days", 0)
-                    req_level = data.get("level", 0)
-
-                    if days_in >= req_days and level >= req_level:
-                        try:
-                            await member.add_roles(target_role, reason="About Cog: Auto-Optin")
-                            await asyncio.sleep(2)
-                        except (discord.Forbidden, discord.HTTPException):
-                            pass
+                if base_role.id in held:
+                    if tenure_met(req_days) and await current_level() >= req_level:
+                        queue_change(add=[target_role], reason="About Cog: Auto-Optin")
+
+            # One member.edit for everything this member earned
+            applied = True
+            if adds or removes:
+                applied = await self._role_queue(guild).submit(member, adds, removes, ", ".join(reasons))
+
+            if not applied:
+                # Forbidden or still rate limited; retry on the next pass.
+                track_due(current_ts)
+                return
+
+            if start_times:
+                async with self.config.member(member).role_start_times() as times:
+                    for r1_id, ts in start_times.items():
+                        if ts is None:
+                            times.pop(r1_id, None)
+                        else:
+                            times[r1_id] = ts
+
+            for alert_channel, content, ghost in alerts:
+                try:
+                    sent = await alert_channel.send(content)
+                    if ghost:
+                        # Ghost Ping: deletion is scheduled, not awaited
+                        await sent.delete(delay=5)
+                except (discord.Forbidden, discord.HTTPException):
+                    pass
 
         except Exception as e:
             print(f"Error checking rewards for {member}: {e}")
+        finally:
+            self._schedule_reward_check(member, next_due)
 
     # --- Background Loop for Time-Based Checks ---
     @tasks.loop(minutes=15)
     async def check_rewards(self):
-        """Periodically checks all members (mostly for 'days in server' requirements)."""
+        """
+        Periodically grants tenure-based rewards.
+        Guilds whose reward plan changed (or every guild, on the first pass) get a full sweep;
+        otherwise only members whose next tenure threshold has passed are re-evaluated.
+        """
         await self.bot.wait_until_ready()
-        
-        for guild in self.bot.guilds:
+
+        if not self.bot.get_cog("LevelUp"):
+            # Nothing can be granted; sweep everyone once LevelUp is back.
+            self._reward_index_ready = False
+            return
+
+        if not self._reward_index_ready:
+            self._reward_sweep_guilds.update(g.id for g in self.bot.guilds)
+            self._reward_index_ready = True
+
+        while self._reward_sweep_guilds:
+            guild = self.bot.get_guild(self._reward_sweep_guilds.pop())
+            if not guild:
+                continue
             for member in guild.members:
                 await self._grant_rewards_for_member(member)
 
+        now_ts = datetime.now(timezone.utc).timestamp()
+        for guild_id, member_id in self._pop_due_reward_checks(now_ts):
+            guild = self.bot.get_guild(guild_id)
+            member = guild.get_member(member_id) if guild else None
+            if member:
+                await self._grant_rewards_for_member(member)
+
     @check_rewards.before_loop
     async def before_check_rewards(self):
         await self.bot.wait_until_ready()
@@ -655,6 +901,47 @@ class About(commands.Cog):
         """Listens for Vertyco's LevelUp event to grant rewards instantly."""
         await self._grant_rewards_for_member(member, level_override=new_level)
 
+    # --- Listeners keeping the reward index current ---
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if not member.bot:
+            # Picked up by the next pass, same as the old full sweep.
+            self._schedule_reward_check(member, datetime.now(timezone.utc).timestamp())
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._schedule_reward_check(member, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        queue = self._role_queues.get(after.guild.id)
+        if queue:
+            queue.member_updated(after.id)
+        if after.bot or before.roles == after.roles:
+            return
+        plan = await self._get_reward_plan(after.guild)
+        added = {r.id for r in after.roles} - {r.id for r in before.roles}
+        if added & plan["trigger_ids"]:
+            self._schedule_reward_check(after, datetime.now(timezone.utc).timestamp())
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._invalidate_reward_plan(role.guild, resweep=False)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self._reward_sweep_guilds.add(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._reward_plans.pop(guild.id, None)
+        self._reward_sweep_guilds.discard(guild.id)
+        queue = self._role_queues.pop(guild.id, None)
+        if queue:
+            queue.cancel()
+        for key in [k for k in self._reward_due if k[0] == guild.id]:
+            del self._reward_due[key]
+
     async def _display_server_info(self, ctx):
         """Displays detailed server information embed."""
         guild = ctx.guild
@@ -1259,6 +1546,7 @@ class About(commands.Cog):
                 "days": days,
                 "level": level
             }
+        self._invalidate_reward_plan(ctx.guild)
         
         await ctx.send(
             f"Configured Opt-in Path:\n"
@@ -1274,6 +1562,7 @@ class About(commands.Cog):
                 await ctx.send(f"Removed opt-in configuration for **{base_role.name}**.")
             else:
                 await ctx.send("That base role is not configured.")
+        self._invalidate_reward_plan(ctx.guild)
 
     @aboutset.command(name="optin_list")
     async def aboutset_optin_list(self, ctx):
@@ -1310,6 +1599,7 @@ class About(commands.Cog):
                 "days": days,
                 "level": level
             }
+        self._invalidate_reward_plan(ctx.guild)
         
         await ctx.send(
             f"Configured Reward Role:\n"
@@ -1329,6 +1619,7 @@ class About(commands.Cog):
             
             rewards[rid]["message"] = message
             rewards[rid]["channel_id"] = channel.id
+        self._invalidate_reward_plan(ctx.guild, resweep=False)
             
         await ctx.send(f"Updated reward message for **{reward_role.name}** in {channel.mention}.")
 
@@ -1341,6 +1632,7 @@ class About(commands.Cog):
                 await ctx.send(f"Removed reward configuration for **{reward_role.name}**.")
             else:
                 await ctx.send("That reward role is not configured.")
+        self._invalidate_reward_plan(ctx.guild)
 
     @aboutset.command(name="reward_list")
     async def aboutset_reward_list(self, ctx):
@@ -1388,6 +1680,7 @@ class About(commands.Cog):
                 "role2_id": str(role2.id),
                 "duration": duration
             }
+        self._invalidate_reward_plan(ctx.guild)
         
         await ctx.send(
             f"Configured Advanced Reward:\n"
@@ -1404,6 +1697,7 @@ class About(commands.Cog):
                 await ctx.send(f"Removed advanced reward configuration starting with **{request_role.name}**.")
             else:
                 await ctx.send("That role is not configured as the start of an advanced reward path.")
+        self._invalidate_reward_plan(ctx.guild)
 
     @aboutset.command(name="advancedreward_list")
     async def aboutset_advancedreward_list(self, ctx):
@@ -1445,6 +1739,7 @@ class About(commands.Cog):
                 "days": days,
                 "channel_id": channel.id
             }
+        self._invalidate_reward_plan(ctx.guild)
         
         await ctx.send(f"Configured Secret Reward: **{role.name}** (Level {level}, {days} days) with ghost ping in {channel.mention}.")
 
@@ -1457,6 +1752,7 @@ class About(commands.Cog):
                 await ctx.send(f"Removed secret reward configuration for **{role.name}**.")
             else:
                 await ctx.send("That secret reward role is not configured.")
+        self._invalidate_reward_plan(ctx.guild)
 
     @aboutset.command(name="secretreward_list")
     async def aboutset_secretreward_list(self, ctx):
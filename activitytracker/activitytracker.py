@@ -8,7 +8,13 @@ import re
 import logging
 import json
 import io
-from typing import Union, List, Tuple, Dict, Optional
+import asyncio
+import time
+import zlib
+from array import array
+from typing import Union, List, Tuple, Dict, Optional, NamedTuple, FrozenSet
+
+from .index import TimestampIndex
 
 # Pydantic is used for structured configuration in modern Red cogs
 try:
@@ -86,6 +92,71 @@ class ActivitySettings(BaseModel):
     # Auto Poke Settings
     auto_channel_id: Optional[int] = Field(default=None, description="Channel ID for automatic pokes/summons.")
 
+class CachedGuildSettings(NamedTuple):
+    """Pre-parsed per-guild settings used by the hot event listeners."""
+    settings: ActivitySettings
+    excluded_channels: FrozenSet[int]
+    excluded_roles: FrozenSet[int]
+
+class BurstCounter:
+    """
+    Counts one user's messages inside a sliding window using a fixed ring of epoch-second buckets.
+    Memory per user is constant regardless of how many messages they send.
+    """
+    BUCKETS = 12
+    __slots__ = ("width", "last_event", "_slots", "_counts")
+
+    def __init__(self, width: float):
+        self.width = width # Seconds covered by each bucket (window / BUCKETS)
+        self.last_event = 0.0
+        self._slots = array("q", [-1] * self.BUCKETS) # Absolute bucket number held by each ring position
+        self._counts = array("I", [0] * self.BUCKETS)
+
+    def add(self, now: float) -> int:
+        """Records a message at `now` (epoch seconds) and returns the count inside the window."""
+        current = int(now // self.width)
+        pos = current % self.BUCKETS
+        if self._slots[pos] != current:
+            self._slots[pos] = current
+            self._counts[pos] = 0
+        self._counts[pos] += 1
+        self.last_event = now
+
+        oldest = current - self.BUCKETS
+        return sum(count for slot, count in zip(self._slots, self._counts) if slot > oldest)
+
+    def is_idle(self, now: float) -> bool:
+        """True once every bucket has fallen out of the window."""
+        return now - self.last_event > self.width * self.BUCKETS
+
+    @classmethod
+    def size_bytes(cls) -> int:
+        """Approximate payload size of one counter (the two arrays)."""
+        return cls.BUCKETS * (array("q").itemsize + array("I").itemsize)
+
+class VoiceSession:
+    """
+    One member's stay in one voice channel.
+    
+    A session is "qualifying" while the member is unmuted/undeafened and the channel is populated enough.
+    A timer fires each time a qualifying stretch reaches another multiple of the required minutes, and a
+    credited stretch is credited once more when it ends, mirroring the old connect/leave accounting.
+    """
+    __slots__ = ("channel_id", "qualifying_since", "credited", "timer")
+
+    def __init__(self, channel_id: int):
+        self.channel_id = channel_id
+        self.qualifying_since: Optional[float] = None
+        self.credited = False
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def stop_qualifying(self):
+        """Cancels the pending credit and resets the qualifying stretch."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.qualifying_since = None
+
 # --- View Classes for Pagination ---
 
 class ActivityEligibleView(discord.ui.View):
@@ -179,10 +250,11 @@ class ActivityEligibleView(discord.ui.View):
                 pass
 
 class ActivityStatusView(discord.ui.View):
-    def __init__(self, ctx, pages: List[str]):
+    def __init__(self, ctx, pages: List[str], stats: str = ""):
         super().__init__(timeout=120)
         self.ctx = ctx
         self.pages = pages
+        self.stats = stats
         self.page_index = 0
         self.message: Optional[discord.Message] = None
         self._update_buttons()
@@ -199,7 +271,10 @@ class ActivityStatusView(discord.ui.View):
             description=self.pages[self.page_index],
             color=discord.Color.gold()
         )
-        embed.set_footer(text=f"✅ Active | 👉 Poke | 👻 Summon | 💤 Hibernating")
+        footer = "✅ Active | 👉 Poke | 👻 Summon | 💤 Hibernating"
+        if self.stats:
+            footer += f"\n{self.stats}"
+        embed.set_footer(text=footer)
         return embed
 
     @discord.ui.button(label="◀️", style=discord.ButtonStyle.grey, row=0)
@@ -232,32 +307,126 @@ class ActivityStatusView(discord.ui.View):
 class ActivityTracker(commands.Cog):
     """Tracks user activity and allows 'poking' or 'summoning' inactive members."""
 
+    LEVEL_CACHE_TTL = 300 # Seconds a LevelUp level lookup is reused
+    LEVEL_LOOKUP_CONCURRENCY = 25 # Max concurrent get_level calls when LevelUp data can't be snapshotted
+    GUILD_RUN_INTERVAL = 300 # Seconds between scheduled passes for a single guild
+    GUILD_RUN_CONCURRENCY = 5 # Max guilds processed at the same time by auto_poke_loop
+
     def __init__(self, bot):
         self.bot = bot
         # Config setup:
         self.config = Config.get_conf(self, identifier=148000552390, force_registration=True)
         self.config.register_guild(
-            last_seen={}, # {user_id: "ISO_DATETIME_STRING"}
-            last_poked={}, # {user_id: "ISO_DATETIME_STRING"}
-            last_summoned={}, # {user_id: "ISO_DATETIME_STRING"}
-            warned_users={}, # {user_id: {"level1": ts, "level3": ts, "nointro": ts, "level0_warn": ts, "level0_kick": ts}}
+            last_seen={}, # {user_id: EPOCH_SECONDS}
+            last_poked={}, # {user_id: EPOCH_SECONDS}
+            last_summoned={}, # {user_id: EPOCH_SECONDS}
+            warned_users={}, # {user_id: {"level1": ts, "level3": ts, "nointro": ts, "level0_warn": ts, "level0_kick": ts}} (EPOCH_SECONDS)
             last_level0_warn_time=None, # ISO_DATETIME_STRING - Tracks the last time a Level 0 warning OR KICK was sent
             excluded_roles=[], # [role_id, ...] -> "Hibernating Roles"
             excluded_channels=[], # [channel_id, ...]
             activity_settings=ActivitySettings().model_dump(),
             next_auto_event=None, # ISO_DATETIME_STRING for the next scheduled auto run
         )
-        # In-memory tracker for voice channel connections
-        self.voice_connect_times = {} # {member_id: datetime_object}
-        
-        # In-memory cache for message bursts: {user_id: [timestamp1, timestamp2, ...]}
-        self.recent_activity_cache: Dict[int, List[datetime]] = {}
-        
-        # Start the loop
+        self.config.register_global(
+            flush_interval_seconds=60, # How often queued last_seen updates are written to Config
+            max_pending_updates=500, # Per-guild queue size that forces an immediate flush
+            schema_version=0, # 1 = timestamps stored as integer epoch seconds instead of ISO strings
+        )
+        # Write-behind queue for activity updates: {guild_id: {user_id_str: EPOCH_SECONDS}}
+        # At most `flush_interval_seconds` or `max_pending_updates` worth of updates can be lost on a crash.
+        self._pending_last_seen: Dict[int, Dict[str, int]] = {}
+        self._max_pending_updates = 500
+        
+        # Ordered timestamp indexes, built lazily from Config: {guild_id: {"last_seen"|"last_poked"|"last_summoned": TimestampIndex}}
+        self._activity_index: Dict[int, Dict[str, TimestampIndex]] = {}
+        
+        # Short-lived LevelUp level cache: {guild_id: {member_id: (expires_at, level)}}
+        self._level_cache: Dict[int, Dict[int, Tuple[float, int]]] = {}
+        
+        # Staggered scheduler state: {guild_id: next_run_epoch} and {guild_id: (finished_at_epoch, duration_seconds)}
+        self._guild_next_run: Dict[int, float] = {}
+        self._guild_run_stats: Dict[int, Tuple[float, float]] = {}
+        self._next_auto_event: Dict[int, datetime] = {} # Parsed copy of next_auto_event per guild
+        
+        # Parsed settings for listeners, invalidated by the activityset commands: {guild_id: CachedGuildSettings}
+        self._settings_cache: Dict[int, CachedGuildSettings] = {}
+        
+        # Event-driven voice session state: {guild_id: {member_id: VoiceSession}}
+        self.voice_sessions: Dict[int, Dict[int, VoiceSession]] = {}
+        self._voice_recovery_task: Optional[asyncio.Task] = None # Startup scan of already-connected members
+        
+        # In-memory counters for message bursts: {guild_id: {user_id: BurstCounter}}
+        # Idle users are evicted by burst_sweep_loop so memory tracks recent talkers, not member count.
+        self.recent_activity_cache: Dict[int, Dict[int, BurstCounter]] = {}
+        self._last_sweep_evicted = 0
+
+    async def cog_load(self):
+        await self._migrate_epoch_timestamps()
+        interval = await self.config.flush_interval_seconds()
+        self._max_pending_updates = await self.config.max_pending_updates()
+        self.activity_flush_loop.change_interval(seconds=interval)
+        self._voice_recovery_task = self.bot.loop.create_task(self._recover_voice_sessions())
+        
+        # Start the loops once stored timestamps are guaranteed to be epoch seconds
         self.auto_poke_loop.start()
+        self.activity_flush_loop.start()
+        self.burst_sweep_loop.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.auto_poke_loop.cancel()
+        self.activity_flush_loop.cancel()
+        self.burst_sweep_loop.cancel()
+        if self._voice_recovery_task:
+            self._voice_recovery_task.cancel()
+        for sessions in self.voice_sessions.values():
+            for session in sessions.values():
+                session.stop_qualifying()
+        await self._flush_all_activity()
+
+    # --- Storage Migration ---
+
+    @staticmethod
+    def _to_epoch(value) -> Optional[int]:
+        """Converts a stored timestamp (epoch int or legacy ISO string) to epoch seconds. Returns None if invalid."""
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, str):
+            try:
+                return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+            except ValueError:
+                return None
+        return None
+
+    @classmethod
+    def _normalize_timestamps(cls, data: dict) -> dict:
+        """Converts the per-user timestamp maps of a guild data blob to epoch seconds, dropping invalid entries."""
+        for key in ("last_seen", "last_poked", "last_summoned"):
+            if key in data:
+                converted = {uid: cls._to_epoch(ts) for uid, ts in data[key].items()}
+                data[key] = {uid: ts for uid, ts in converted.items() if ts is not None}
+        
+        if "warned_users" in data:
+            for uid, warnings in data["warned_users"].items():
+                converted = {flag: cls._to_epoch(ts) for flag, ts in warnings.items()}
+                data["warned_users"][uid] = {flag: ts for flag, ts in converted.items() if ts is not None}
+        return data
+
+    async def _migrate_epoch_timestamps(self):
+        """One-time migration of ISO string timestamps to integer epoch seconds."""
+        if await self.config.schema_version() >= 1:
+            return
+        
+        all_guilds = await self.config.all_guilds()
+        for guild_id, data in all_guilds.items():
+            self._normalize_timestamps(data)
+            group = self.config.guild_from_id(guild_id)
+            await group.last_seen.set(data["last_seen"])
+            await group.last_poked.set(data["last_poked"])
+            await group.last_summoned.set(data["last_summoned"])
+            await group.warned_users.set(data["warned_users"])
+        
+        await self.config.schema_version.set(1)
+        log.info(f"ActivityTracker: Migrated timestamps to epoch seconds for {len(all_guilds)} guilds.")
 
     # --- Utility Methods ---
 
@@ -270,30 +439,95 @@ class ActivityTracker(commands.Cog):
     async def _set_settings(self, guild: discord.Guild, settings: ActivitySettings):
         """Saves the updated guild settings."""
         await self.config.guild(guild).activity_settings.set(settings.model_dump())
+        self._invalidate_settings_cache(guild)
+
+    async def _get_cached_settings(self, guild: discord.Guild) -> CachedGuildSettings:
+        """Returns the parsed settings and exclusions for a guild, loading them from Config only on a cache miss."""
+        cached = self._settings_cache.get(guild.id)
+        if cached is None:
+            data = await self.config.guild(guild).all()
+            cached = CachedGuildSettings(
+                settings=ActivitySettings(**data["activity_settings"]),
+                excluded_channels=frozenset(data["excluded_channels"]),
+                excluded_roles=frozenset(data["excluded_roles"]),
+            )
+            self._settings_cache[guild.id] = cached
+        return cached
+
+    def _invalidate_settings_cache(self, guild: discord.Guild):
+        """Drops the cached settings for a guild so the next event re-reads Config."""
+        self._settings_cache.pop(guild.id, None)
     
     async def _update_last_seen(self, guild: discord.Guild, user_id: int):
-        """Updates the last_seen time and clears Inactivity warning flags for a user."""
-        user_id_str = str(user_id)
-        current_time_utc = datetime.now(timezone.utc).isoformat()
+        """
+        Queues a last_seen update for a user. 
+        The write (and the clearing of their Inactivity warning flags) happens on the next flush.
+        """
+        pending = self._pending_last_seen.setdefault(guild.id, {})
+        pending[str(user_id)] = int(time.time())
         
-        async with self.config.guild(guild).all() as data:
-            data["last_seen"][user_id_str] = current_time_utc
-            
-            # If they were warned for inactivity, clear those specific flags now that they are active.
-            # NOTE: We do NOT clear "nointro" or "level0" flags here, as those are state-based, not just activity-based.
-            if user_id_str in data["warned_users"]:
-                user_warnings = data["warned_users"][user_id_str]
-                if "level1" in user_warnings: del user_warnings["level1"]
-                if "level3" in user_warnings: del user_warnings["level3"]
-                data["warned_users"][user_id_str] = user_warnings
+        # Bound the number of updates that can be lost if the bot dies before the next timed flush
+        if len(pending) >= self._max_pending_updates:
+            await self._flush_guild_activity(guild.id)
+
+    async def _flush_guild_activity(self, guild_id: int):
+        """Writes all queued last_seen updates for a guild in a single Config transaction."""
+        pending = self._pending_last_seen.pop(guild_id, None)
+        if not pending:
+            return
         
+        try:
+            async with self.config.guild_from_id(guild_id).all() as data:
+                for user_id_str, seen_ts in pending.items():
+                    data["last_seen"][user_id_str] = seen_ts
+                    
+                    # If they were warned for inactivity, clear those specific flags now that they are active.
+                    # NOTE: We do NOT clear "nointro" or "level0" flags here, as those are state-based, not just activity-based.
+                    user_warnings = data["warned_users"].get(user_id_str)
+                    if user_warnings:
+                        user_warnings.pop("level1", None)
+                        user_warnings.pop("level3", None)
+            
+            index = self._activity_index.get(guild_id)
+            if index is not None:
+                for user_id_str, seen_ts in pending.items():
+                    index["last_seen"].set(user_id_str, seen_ts)
+        except Exception:
+            # Re-queue anything that wasn't superseded while we were writing, then let the caller know
+            requeue = self._pending_last_seen.setdefault(guild_id, {})
+            for user_id_str, seen_ts in pending.items():
+                requeue.setdefault(user_id_str, seen_ts)
+            raise
+
+    async def _flush_all_activity(self):
+        """Flushes the write-behind queue for every guild."""
+        for guild_id in list(self._pending_last_seen):
+            try:
+                await self._flush_guild_activity(guild_id)
+            except Exception as e:
+                log.error(f"ActivityTracker: Failed to flush activity for guild {guild_id}: {e}", exc_info=True)
+
+    async def _get_activity_index(self, guild: discord.Guild) -> Dict[str, TimestampIndex]:
+        """Returns the ordered last_seen/last_poked/last_summoned indexes for a guild, building them on first use."""
+        await self._flush_guild_activity(guild.id)
+        index = self._activity_index.get(guild.id)
+        if index is None:
+            data = await self.config.guild(guild).all()
+            index = {key: TimestampIndex(data[key]) for key in ("last_seen", "last_poked", "last_summoned")}
+            self._activity_index[guild.id] = index
+        return index
+
+    def _invalidate_activity_index(self, guild: discord.Guild):
+        """Drops the indexes after a bulk rewrite of the timestamp maps; they are rebuilt on next use."""
+        self._activity_index.pop(guild.id, None)
+
     def _is_valid_gif_url(self, url: str) -> bool:
         """Simple check if the URL looks like a GIF link or page."""
         return re.match(r'^https?://[^\s/$.?#].[^\s]*\.(gif|webp|mp4|mov)(\?.*)?$', url, re.IGNORECASE) is not None or "tenor.com" in url or "giphy.com" in url
 
-    def _get_inactivity_cutoff(self, days: int) -> datetime:
-        """Calculates the ISO datetime cutoff point for inactivity."""
-        return datetime.now(timezone.utc) - timedelta(days=days)
+    def _get_inactivity_cutoff(self, days: int) -> int:
+        """Calculates the epoch-seconds cutoff point for inactivity."""
+        return int(time.time()) - days * 86400
 
     def _is_excluded(self, member: discord.Member, excluded_roles: List[int]) -> bool:
         """Checks if the member has any role that is in the hibernating (excluded) list."""
@@ -319,39 +553,26 @@ class ActivityTracker(commands.Cog):
         Gets a list of members eligible for action, prioritized by whether they have been acted upon.
         Returns: (priority_1_members, priority_2_members)
         """
-        cutoff_dt = self._get_inactivity_cutoff(days_inactive)
+        cutoff_ts = self._get_inactivity_cutoff(days_inactive)
         
-        data = await self.config.guild(guild).all()
-        last_seen_data = data["last_seen"]
-        last_action_data = data[last_action_key]
-        excluded_roles = data["excluded_roles"]
+        index = await self._get_activity_index(guild)
+        last_action_index = index[last_action_key]
+        excluded_roles = (await self._get_cached_settings(guild)).excluded_roles
         
         priority_1: List[discord.Member] = []
-        priority_2: List[Tuple[discord.Member, datetime]] = []
+        priority_2: List[Tuple[discord.Member, int]] = []
         
-        for user_id_str, last_seen_dt_str in last_seen_data.items():
-            user_id = int(user_id_str)
-            member = guild.get_member(user_id)
-            
+        # Range query: only members last seen before the cutoff are visited
+        for _, user_id_str in index["last_seen"].before(cutoff_ts):
+            member = guild.get_member(int(user_id_str))
             if member is None or member.bot or self._is_excluded(member, excluded_roles):
                 continue
 
-            try:
-                last_seen_dt = datetime.fromisoformat(last_seen_dt_str).replace(tzinfo=timezone.utc)
-            except ValueError:
-                continue
-
-            if last_seen_dt < cutoff_dt:
-                last_action_dt_str = last_action_data.get(user_id_str)
-                
-                if last_action_dt_str is None:
-                    priority_1.append(member)
-                else:
-                    try:
-                        last_action_dt = datetime.fromisoformat(last_action_dt_str).replace(tzinfo=timezone.utc)
-                        priority_2.append((member, last_action_dt))
-                    except ValueError:
-                        priority_1.append(member)
+            last_action_ts = last_action_index.get(user_id_str)
+            if last_action_ts is None:
+                priority_1.append(member)
+            else:
+                priority_2.append((member, last_action_ts))
 
         priority_2_members = [
             member for member, dt in sorted(priority_2, key=lambda x: x[1])
@@ -359,6 +580,88 @@ class ActivityTracker(commands.Cog):
         
         return priority_1, priority_2_members
     
+    def _snapshot_levelup_levels(self, levelup_cog, guild: discord.Guild, members: List[discord.Member]) -> Optional[Dict[int, int]]:
+        """
+        Reads the stored levels of `members` straight from LevelUp's in-memory DB (levelup.db.get_conf(guild).users).
+        Members without a profile are omitted. Returns None if this LevelUp version doesn't expose that structure.
+        """
+        try:
+            users = levelup_cog.db.get_conf(guild).users
+            levels = {}
+            for member in members:
+                # Profiles are keyed by int in current LevelUp releases, by str in older ones
+                profile = users.get(member.id) or users.get(str(member.id))
+                if profile is not None:
+                    levels[member.id] = int(getattr(profile, "level", 0))
+            return levels
+        except Exception:
+            return None
+
+    async def _get_levels(self, guild: discord.Guild, members: List[discord.Member]) -> Dict[int, int]:
+        """
+        Resolves LevelUp levels for many members at once. Returns {member_id: level}.
+        
+        Cached levels are reused for LEVEL_CACHE_TTL seconds. Misses are read directly from LevelUp's
+        in-memory data when possible, otherwise via get_level with bounded concurrency.
+        """
+        levelup_cog = self.bot.get_cog("LevelUp")
+        if not levelup_cog:
+            return {}
+
+        now = time.monotonic()
+        cache = self._level_cache.setdefault(guild.id, {})
+        levels: Dict[int, int] = {}
+        missing: List[discord.Member] = []
+        
+        for member in members:
+            cached = cache.get(member.id)
+            if cached and cached[0] > now:
+                levels[member.id] = cached[1]
+            else:
+                missing.append(member)
+
+        if not missing:
+            return levels
+
+        snapshot = self._snapshot_levelup_levels(levelup_cog, guild, missing)
+        if snapshot is not None:
+            # Members without a LevelUp profile have never earned XP
+            fetched = {member.id: snapshot.get(member.id, 0) for member in missing}
+        else:
+            semaphore = asyncio.Semaphore(self.LEVEL_LOOKUP_CONCURRENCY)
+            
+            async def fetch(member: discord.Member) -> int:
+                async with semaphore:
+                    return await levelup_cog.get_level(member)
+            
+            results = await asyncio.gather(*(fetch(m) for m in missing), return_exceptions=True)
+            fetched = {}
+            for member, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    log.debug(f"ActivityTracker: LevelUp lookup failed for {member.id}: {result}")
+                    continue
+                fetched[member.id] = result
+
+        expires_at = now + self.LEVEL_CACHE_TTL
+        for member_id, level in fetched.items():
+            cache[member_id] = (expires_at, level)
+        levels.update(fetched)
+        return levels
+
+    async def _get_level(self, member: discord.Member) -> Optional[int]:
+        """Cached single-member LevelUp lookup. Returns None if LevelUp is unavailable."""
+        return (await self._get_levels(member.guild, [member])).get(member.id)
+
+    def _invalidate_level(self, guild_id: int, member_id: int):
+        cache = self._level_cache.get(guild_id)
+        if cache:
+            cache.pop(member_id, None)
+
+    async def _has_live_level0(self, member: discord.Member) -> bool:
+        """Re-reads a member's level, bypassing the cache, before a punitive Level 0 action."""
+        self._invalidate_level(member.guild.id, member.id)
+        return await self._get_level(member) == 0
+
     async def _get_level0_candidates(self, guild: discord.Guild, settings: ActivitySettings, check_type: str) -> List[discord.Member]:
         """
         Retrieves a list of members who are eligible for Level 0 Warning or Kick.
@@ -368,6 +671,7 @@ class ActivityTracker(commands.Cog):
         if not levelup_cog:
             return []
 
+        await self._flush_guild_activity(guild.id)
         warned_users = await self.config.guild(guild).warned_users()
         excluded_roles = await self.config.guild(guild).excluded_roles()
         now = datetime.now(timezone.utc)
@@ -378,8 +682,8 @@ class ActivityTracker(commands.Cog):
         if threshold_days <= 0:
             return []
             
-        # Optimization: We have to iterate members, which can be slow on huge servers.
-        # But this is inside a background task, so acceptable.
+        # Cheap filters first, then resolve levels for the survivors in one bulk lookup
+        flag_key = "level0_warn" if check_type == "warn" else "level0_kick"
         for member in guild.members:
             if member.bot or self._is_excluded(member, excluded_roles):
                 continue
@@ -387,75 +691,49 @@ class ActivityTracker(commands.Cog):
             days_joined = (now - member.joined_at.replace(tzinfo=timezone.utc)).days
             
             if days_joined >= threshold_days:
-                user_id_str = str(member.id)
-                user_warnings = warned_users.get(user_id_str, {})
-                
                 # Filter out those already processed for this specific action type
-                flag_key = "level0_warn" if check_type == "warn" else "level0_kick"
-                if flag_key in user_warnings:
+                if flag_key in warned_users.get(str(member.id), {}):
                     continue
-
-                # Async check level
-                level = await levelup_cog.get_level(member)
-                if level == 0:
-                    candidates.append(member)
-                    
-        return candidates
+                candidates.append(member)
+        
+        levels = await self._get_levels(guild, candidates)
+        return [member for member in candidates if levels.get(member.id) == 0]
 
     async def _filter_spam_protected(self, guild: discord.Guild, members: List[discord.Member]) -> List[discord.Member]:
         """
         Filters out members who have been poked OR summoned in the last 14 days.
         """
-        data = await self.config.guild(guild).all()
-        last_poked = data.get("last_poked", {})
-        last_summoned = data.get("last_summoned", {})
+        index = await self._get_activity_index(guild)
+        safe_cutoff = self._get_inactivity_cutoff(14)
         
-        safe_cutoff = datetime.now(timezone.utc) - timedelta(days=14)
-        filtered_members = []
+        # Range query on the action indexes for everyone acted upon since the cutoff
+        recently_acted = {uid for _, uid in index["last_poked"].after(safe_cutoff)}
+        recently_acted.update(uid for _, uid in index["last_summoned"].after(safe_cutoff))
         
-        for member in members:
-            uid = str(member.id)
-            poked_ts = last_poked.get(uid)
-            summoned_ts = last_summoned.get(uid)
-            
-            recent_activity = False
-            
-            if poked_ts:
-                try:
-                    dt = datetime.fromisoformat(poked_ts).replace(tzinfo=timezone.utc)
-                    if dt > safe_cutoff: recent_activity = True
-                except ValueError: pass
-            
-            if not recent_activity and summoned_ts:
-                try:
-                    dt = datetime.fromisoformat(summoned_ts).replace(tzinfo=timezone.utc)
-                    if dt > safe_cutoff: recent_activity = True
-                except ValueError: pass
-                
-            if not recent_activity:
-                filtered_members.append(member)
-                
-        return filtered_members
+        return [member for member in members if str(member.id) not in recently_acted]
     
     async def _set_last_action_time(self, guild: discord.Guild, user_id: int, key: str):
         """Updates the last_poked or last_summoned time for a user."""
         user_id_str = str(user_id)
-        current_time_utc = datetime.now(timezone.utc).isoformat()
+        now_ts = int(time.time())
+        
+        async with self.config.guild(guild).get_attr(key)() as data:
+            data[user_id_str] = now_ts
         
-        data = await self.config.guild(guild).get_attr(key)()
-        data[user_id_str] = current_time_utc
-        await self.config.guild(guild).get_attr(key).set(data)
+        index = self._activity_index.get(guild.id)
+        if index is not None:
+            index[key].set(user_id_str, now_ts)
 
-    def _format_date_diff(self, dt_str: Union[str, None]) -> str:
-        """Helper function for formatting ISO dates into 'X days ago' or 'Never'."""
-        if dt_str:
-            try:
-                dt = datetime.fromisoformat(dt_str).replace(tzinfo=timezone.utc)
-                diff = datetime.now(timezone.utc) - dt
-                return f"{diff.days} days ago"
-            except ValueError:
-                return "Invalid Date"
-        return "Never"
+    @staticmethod
+    def _days_since(ts: int) -> int:
+        """Whole days elapsed since an epoch-seconds timestamp."""
+        return (int(time.time()) - ts) // 86400
+
+    def _format_date_diff(self, ts: Optional[int]) -> str:
+        """Helper function for formatting epoch timestamps into 'X days ago' or 'Never'."""
+        if ts is None:
+            return "Never"
+        return f"{self._days_since(ts)} days ago"
         
     async def _schedule_next_auto_event(self, guild: discord.Guild):
         """Schedules the next auto event for ~24 hours from now with randomness."""
@@ -465,71 +743,103 @@ class ActivityTracker(commands.Cog):
         next_run = base_time + timedelta(seconds=variance)
         
         await self.config.guild(guild).next_auto_event.set(next_run.isoformat())
+        self._next_auto_event[guild.id] = next_run
         return next_run
 
     # --- Automated Task Loop ---
 
-    @tasks.loop(minutes=5)
+    @tasks.loop(seconds=30)
     async def auto_poke_loop(self):
-        """Background loop to handle automatic pokes, summons, and automated policing."""
+        """
+        Background loop to handle automatic pokes, summons, and automated policing.
+        
+        Each guild is given a fixed slot inside GUILD_RUN_INTERVAL (by hash of its ID) so work is spread
+        across the interval instead of every guild running back to back. Each tick only runs guilds
+        whose slot has come up, with at most GUILD_RUN_CONCURRENCY running at once.
+        """
+        now = time.time()
+        due = []
         for guild in self.bot.guilds:
+            next_run = self._guild_next_run.get(guild.id)
+            if next_run is None:
+                next_run = self._guild_next_run[guild.id] = self._get_guild_slot(guild.id, now)
+            if next_run <= now:
+                due.append(guild)
+                # Keep the guild on its slot; if we overran, skip to the next slot in the future
+                next_run += self.GUILD_RUN_INTERVAL
+                if next_run <= now:
+                    next_run = self._get_guild_slot(guild.id, now)
+                self._guild_next_run[guild.id] = next_run
+        
+        if not due:
+            return
+        
+        semaphore = asyncio.Semaphore(self.GUILD_RUN_CONCURRENCY)
+        
+        async def run(guild: discord.Guild):
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    await self._run_guild_tick(guild)
+                except Exception as e:
+                    log.error(f"Error in auto_poke_loop for guild {guild.id}: {e}", exc_info=True)
+                finally:
+                    self._guild_run_stats[guild.id] = (time.time(), time.monotonic() - started)
+        
+        await asyncio.gather(*(run(guild) for guild in due))
+
+    def _get_guild_slot(self, guild_id: int, now: float) -> float:
+        """Returns the next epoch time (after `now`) at which this guild's slot in the interval comes up."""
+        offset = zlib.crc32(str(guild_id).encode()) % self.GUILD_RUN_INTERVAL
+        slot = now - (now % self.GUILD_RUN_INTERVAL) + offset
+        if slot <= now:
+            slot += self.GUILD_RUN_INTERVAL
+        return slot
+
+    def _get_guild_run_stats(self, guild: discord.Guild) -> str:
+        """Formats the last scheduled run of this guild for display."""
+        stats = self._guild_run_stats.get(guild.id)
+        if stats is None:
+            return "Auto loop: not run yet"
+        finished_at, duration = stats
+        next_run = self._guild_next_run.get(guild.id)
+        next_str = f" | next in {max(0, int(next_run - time.time()))}s" if next_run else ""
+        return f"Auto loop: last run {int(time.time() - finished_at)}s ago, took {duration * 1000:.0f} ms{next_str}"
+
+    async def _run_guild_tick(self, guild: discord.Guild):
+        """One scheduled pass for a guild: automated policing and the daily lottery."""
+        # 1. Check if configured
+        settings = (await self._get_cached_settings(guild)).settings
+
+        # Run Automated Checks (Warnings, No Intro, Level 0)
+        await self._process_automated_checks(guild, settings)
+
+        # 2. Check Auto Poke Schedule (kept in memory after the first read)
+        now = datetime.now(timezone.utc)
+        next_run_dt = self._next_auto_event.get(guild.id)
+        
+        if next_run_dt is None:
+            next_run_str = await self.config.guild(guild).next_auto_event()
+            if not next_run_str:
+                # First time init: Schedule for random time in next 24h
+                await self._schedule_next_auto_event(guild)
+                return
             try:
-                # 1. Check if configured
-                settings_data = await self.config.guild(guild).activity_settings()
-                settings = ActivitySettings(**settings_data)
-                
-                # --- Periodic Voice Activity Check ---
-                # This ensures users currently in long voice sessions are marked active
-                # without needing to disconnect first.
-                if settings.voice_req_minutes > 0:
-                    for vc in guild.voice_channels:
-                        # "with at least one more user" => Total >= voice_req_users
-                        if len(vc.members) >= settings.voice_req_users:
-                            now = datetime.now(timezone.utc)
-                            for member in vc.members:
-                                if member.bot: continue
-                                
-                                # We use the tracking dict to see how long they've been here
-                                start_time = self.voice_connect_times.get(member.id)
-                                if start_time:
-                                    duration = now - start_time
-                                    if duration >= timedelta(minutes=settings.voice_req_minutes):
-                                        # They have been in the channel long enough.
-                                        await self._update_last_seen(guild, member.id)
-
-                # Run Automated Checks (Warnings, No Intro, Level 0)
-                await self._process_automated_checks(guild, settings)
-
-                # 2. Check Auto Poke Schedule
-                next_run_str = await self.config.guild(guild).next_auto_event()
-                now = datetime.now(timezone.utc)
-                
-                should_run = False
-                
-                if not next_run_str:
-                    # First time init: Schedule for random time in next 24h
-                    await self._schedule_next_auto_event(guild)
-                    continue
-                else:
-                    try:
-                        next_run_dt = datetime.fromisoformat(next_run_str).replace(tzinfo=timezone.utc)
-                        if now >= next_run_dt:
-                            should_run = True
-                    except ValueError:
-                        await self._schedule_next_auto_event(guild)
-                        continue
-                
-                if should_run:
-                    # Execute logic
-                    if settings.auto_channel_id:
-                        channel = guild.get_channel(settings.auto_channel_id)
-                        if channel and channel.permissions_for(guild.me).send_messages:
-                            await self._run_daily_lottery(guild, channel, settings)
-                    
-                    # Schedule next run regardless of success to prevent loop spam
-                    await self._schedule_next_auto_event(guild)
-            except Exception as e:
-                log.error(f"Error in auto_poke_loop for guild {guild.id}: {e}", exc_info=True)
+                next_run_dt = datetime.fromisoformat(next_run_str).replace(tzinfo=timezone.utc)
+            except ValueError:
+                await self._schedule_next_auto_event(guild)
+                return
+            self._next_auto_event[guild.id] = next_run_dt
+        
+        if now >= next_run_dt:
+            # Execute logic
+            if settings.auto_channel_id:
+                channel = guild.get_channel(settings.auto_channel_id)
+                if channel and channel.permissions_for(guild.me).send_messages:
+                    await self._run_daily_lottery(guild, channel, settings)
+            
+            # Schedule next run regardless of success to prevent loop spam
+            await self._schedule_next_auto_event(guild)
 
     async def _process_automated_checks(self, guild: discord.Guild, settings: ActivitySettings, ignore_cooldown: bool = False):
         """
@@ -553,12 +863,14 @@ class ActivityTracker(commands.Cog):
         if not levelup_cog:
             log.warning("ActivityTracker: LevelUp cog not loaded. Level 0 checks will be skipped.")
         
+        await self._flush_guild_activity(guild.id)
         data = await self.config.guild(guild).all()
         last_seen_data = data["last_seen"]
         warned_users = data["warned_users"]
         excluded_roles = data["excluded_roles"]
         
         now = datetime.now(timezone.utc)
+        now_ts = int(now.timestamp())
         
         # Pre-fetch role object for No Intro
         nointro_role = guild.get_role(settings.nointro_role_id) if settings.nointro_role_id else None
@@ -583,20 +895,15 @@ class ActivityTracker(commands.Cog):
         def has_recent_warning(warnings):
             check_keys = ["nointro", "level0_warn"]
             for k in check_keys:
-                if k in warnings:
-                    try:
-                        last_ts = datetime.fromisoformat(warnings[k]).replace(tzinfo=timezone.utc)
-                        if (now - last_ts) < timedelta(days=7):
-                            return True
-                    except ValueError:
-                        continue
+                if k in warnings and (now_ts - warnings[k]) < 7 * 86400:
+                    return True
             return False
 
+        members = [m for m in guild.members if not m.bot and not self._is_excluded(m, excluded_roles)]
+        levels = await self._get_levels(guild, members) if levelup_cog else {}
+
         # Iterate over MEMBERS in the guild to cover "No Intro" and "Level 0" logic
-        for member in guild.members:
-            if member.bot or self._is_excluded(member, excluded_roles):
-                continue
-            
+        for member in members:
             user_id_str = str(member.id)
             user_warnings = warned_users.get(user_id_str, {})
             has_changes = False
@@ -612,14 +919,14 @@ class ActivityTracker(commands.Cog):
                                 try:
                                     msg = settings.nointro_message.replace("{mention}", member.mention)
                                     await nointro_channel.send(msg)
-                                    user_warnings["nointro"] = now.isoformat()
+                                    user_warnings["nointro"] = now_ts
                                     has_changes = True
                                 except discord.Forbidden:
                                     log.warning(f"ActivityTracker: Forbidden to send No Intro message in {nointro_channel.name}")
 
             # --- B. LEVEL 0 CHECKS ---
             if levelup_cog:
-                level = await levelup_cog.get_level(member)
+                level = levels.get(member.id)
                 
                 # Only log debug if user is Level 0, to avoid spamming the console for normal users
                 if level == 0:
@@ -632,25 +939,28 @@ class ActivityTracker(commands.Cog):
                     if settings.level0_kick_days > 0 and warn_cog and days_joined >= settings.level0_kick_days:
                         if "level0_kick" not in user_warnings:
                             if allow_level0_action:
-                                try:
-                                    log.info(f"ActivityTracker: ATTEMPTING Level 0 Kick for {member}...")
-                                    # FIXED: Uses 'members' (list) and explicitly passes 'guild'
-                                    await warn_cog.api.warn(
-                                        guild=guild,
-                                        members=[member],
-                                        author=guild.me,
-                                        reason=settings.level0_kick_reason,
-                                        level=3
-                                    )
-                                    user_warnings["level0_kick"] = now.isoformat()
-                                    has_changes = True
-                                    log.info(f"ActivityTracker: SUCCESS Level 0 Kick warning for {member}")
+                                if not await self._has_live_level0(member):
+                                    log.info(f"ActivityTracker: [Level 0 Debug] {member} levelled up since the cached read; skipping kick warning.")
+                                else:
+                                    try:
+                                        log.info(f"ActivityTracker: ATTEMPTING Level 0 Kick for {member}...")
+                                        # FIXED: Uses 'members' (list) and explicitly passes 'guild'
+                                        await warn_cog.api.warn(
+                                            guild=guild,
+                                            members=[member],
+                                            author=guild.me,
+                                            reason=settings.level0_kick_reason,
+                                            level=3
+                                        )
+                                        user_warnings["level0_kick"] = now_ts
+                                        has_changes = True
+                                        log.info(f"ActivityTracker: SUCCESS Level 0 Kick warning for {member}")
                                     
-                                    # Consumed our one action for the 12h window
-                                    await self.config.guild(guild).last_level0_warn_time.set(now.isoformat())
-                                    allow_level0_action = False 
-                                except Exception as e:
-                                    log.error(f"Failed Level 0 kick for {member}: {e}")
+                                        # Consumed our one action for the 12h window
+                                        await self.config.guild(guild).last_level0_warn_time.set(now.isoformat())
+                                        allow_level0_action = False 
+                                    except Exception as e:
+                                        log.error(f"Failed Level 0 kick for {member}: {e}")
                             else:
                                 log.info(f"ActivityTracker: [Level 0 Debug] Kick eligible for {member} but rate limit prevented action.")
                         else:
@@ -667,7 +977,7 @@ class ActivityTracker(commands.Cog):
                                     msg = settings.level0_message.replace("{mention}", member.mention)
                                     await level0_channel.send(msg)
                                     
-                                    user_warnings["level0_warn"] = now.isoformat()
+                                    user_warnings["level0_warn"] = now_ts
                                     has_changes = True
                                     
                                     await self.config.guild(guild).last_level0_warn_time.set(now.isoformat())
@@ -685,50 +995,45 @@ class ActivityTracker(commands.Cog):
 
             # --- C. INACTIVITY CHECKS ---
             if settings.warn_level_1_days > 0 or settings.warn_level_3_days > 0:
-                last_seen_dt_str = last_seen_data.get(user_id_str)
-                if last_seen_dt_str:
-                    try:
-                        last_seen_dt = datetime.fromisoformat(last_seen_dt_str).replace(tzinfo=timezone.utc)
-                        days_inactive = (now - last_seen_dt).days
-                        
-                        # Level 3 (Kick)
-                        if settings.warn_level_3_days > 0 and warn_cog and days_inactive >= settings.warn_level_3_days:
-                            if "level3" not in user_warnings:
-                                try:
-                                    reason = f"Inactive for over {days_inactive} days (Threshold: {settings.warn_level_3_days})."
-                                    # FIXED: Uses 'members' (list) and explicitly passes 'guild'
-                                    await warn_cog.api.warn(
-                                        guild=guild,
-                                        members=[member],
-                                        author=guild.me,
-                                        reason=reason,
-                                        level=3
-                                    )
-                                    user_warnings["level3"] = now.isoformat()
-                                    has_changes = True
-                                except Exception as e:
-                                    log.error(f"Failed L3 Inactivity Warn for {member}: {e}")
-
-                        # Level 1 (Warn)
-                        if settings.warn_level_1_days > 0 and warn_cog and days_inactive >= settings.warn_level_1_days:
-                            if "level1" not in user_warnings:
-                                try:
-                                    reason = f"Inactive for over {days_inactive} days (Threshold: {settings.warn_level_1_days})."
-                                    # FIXED: Uses 'members' (list) and explicitly passes 'guild'
-                                    await warn_cog.api.warn(
-                                        guild=guild,
-                                        members=[member],
-                                        author=guild.me,
-                                        reason=reason,
-                                        level=1
-                                    )
-                                    user_warnings["level1"] = now.isoformat()
-                                    has_changes = True
-                                except Exception as e:
-                                    log.error(f"Failed L1 Inactivity Warn for {member}: {e}")
-
-                    except ValueError:
-                        pass
+                last_seen_ts = last_seen_data.get(user_id_str)
+                if last_seen_ts is not None:
+                    days_inactive = (now_ts - last_seen_ts) // 86400
+                    
+                    # Level 3 (Kick)
+                    if settings.warn_level_3_days > 0 and warn_cog and days_inactive >= settings.warn_level_3_days:
+                        if "level3" not in user_warnings:
+                            try:
+                                reason = f"Inactive for over {days_inactive} days (Threshold: {settings.warn_level_3_days})."
+                                # FIXED: Uses 'members' (list) and explicitly passes 'guild'
+                                await warn_cog.api.warn(
+                                    guild=guild,
+                                    members=[member],
+                                    author=guild.me,
+                                    reason=reason,
+                                    level=3
+                                )
+                                user_warnings["level3"] = now_ts
+                                has_changes = True
+                            except Exception as e:
+                                log.error(f"Failed L3 Inactivity Warn for {member}: {e}")
+
+                    # Level 1 (Warn)
+                    if settings.warn_level_1_days > 0 and warn_cog and days_inactive >= settings.warn_level_1_days:
+                        if "level1" not in user_warnings:
+                            try:
+                                reason = f"Inactive for over {days_inactive} days (Threshold: {settings.warn_level_1_days})."
+                                # FIXED: Uses 'members' (list) and explicitly passes 'guild'
+                                await warn_cog.api.warn(
+                                    guild=guild,
+                                    members=[member],
+                                    author=guild.me,
+                                    reason=reason,
+                                    level=1
+                                )
+                                user_warnings["level1"] = now_ts
+                                has_changes = True
+                            except Exception as e:
+                                log.error(f"Failed L1 Inactivity Warn for {member}: {e}")
             
             if has_changes:
                 warned_users[user_id_str] = user_warnings
@@ -796,6 +1101,7 @@ class ActivityTracker(commands.Cog):
             if candidates:
                 target = random.choice(candidates)
                 # Apply Warning Logic
+                await self._flush_guild_activity(guild.id)
                 warned_users = await self.config.guild(guild).warned_users()
                 user_warnings = warned_users.get(str(target.id), {})
                 
@@ -807,7 +1113,7 @@ class ActivityTracker(commands.Cog):
                         msg = settings.level0_message.replace("{mention}", target.mention)
                         await l0_chan.send(msg)
                         
-                        user_warnings["level0_warn"] = datetime.now(timezone.utc).isoformat()
+                        user_warnings["level0_warn"] = int(time.time())
                         warned_users[str(target.id)] = user_warnings
                         await self.config.guild(guild).warned_users.set(warned_users)
                         
@@ -826,6 +1132,8 @@ class ActivityTracker(commands.Cog):
             
             if candidates and warn_cog:
                 target = random.choice(candidates)
+                if not await self._has_live_level0(target):
+                    return f"🎲 Roll: {roll:.3f} (< {l0_kick_threshold:.2f}) -> Level 0 Kick triggered, but {target.display_name} has levelled up since."
                 try:
                     # Apply Kick Logic (Warn Level 3)
                     await warn_cog.api.warn(
@@ -837,9 +1145,10 @@ class ActivityTracker(commands.Cog):
                     )
                     
                     # Update DB
+                    await self._flush_guild_activity(guild.id)
                     warned_users = await self.config.guild(guild).warned_users()
                     user_warnings = warned_users.get(str(target.id), {})
-                    user_warnings["level0_kick"] = datetime.now(timezone.utc).isoformat()
+                    user_warnings["level0_kick"] = int(time.time())
                     warned_users[str(target.id)] = user_warnings
                     await self.config.guild(guild).warned_users.set(warned_users)
                     
@@ -870,6 +1179,45 @@ class ActivityTracker(commands.Cog):
     async def before_auto_poke_loop(self):
         await self.bot.wait_until_ready()
 
+    @tasks.loop(seconds=60)
+    async def activity_flush_loop(self):
+        """Background loop that writes queued last_seen updates to Config."""
+        await self._flush_all_activity()
+
+    @activity_flush_loop.before_loop
+    async def before_activity_flush_loop(self):
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(minutes=10)
+    async def burst_sweep_loop(self):
+        """Evicts burst counters for users who have stopped talking, and expired LevelUp level cache entries."""
+        now = time.time()
+        evicted = 0
+        for guild_id in list(self.recent_activity_cache):
+            counters = self.recent_activity_cache[guild_id]
+            idle = [user_id for user_id, counter in counters.items() if counter.is_idle(now)]
+            for user_id in idle:
+                del counters[user_id]
+            evicted += len(idle)
+            if not counters:
+                del self.recent_activity_cache[guild_id]
+        self._last_sweep_evicted = evicted
+        
+        mono_now = time.monotonic()
+        for guild_id in list(self._level_cache):
+            cache = self._level_cache[guild_id]
+            for member_id in [mid for mid, (expires_at, _) in cache.items() if expires_at <= mono_now]:
+                del cache[member_id]
+            if not cache:
+                del self._level_cache[guild_id]
+
+    def _get_burst_cache_stats(self, guild: discord.Guild) -> str:
+        """Formats the burst counter cache size for display."""
+        guild_count = len(self.recent_activity_cache.get(guild.id, {}))
+        total_count = sum(len(counters) for counters in self.recent_activity_cache.values())
+        approx_kb = total_count * BurstCounter.size_bytes() / 1024
+        return f"Burst cache: {guild_count} here / {total_count} total users (~{approx_kb:.1f} KB) | Last sweep evicted {self._last_sweep_evicted}"
+
     # --- PUBLIC API FOR EXTERNAL COGS ---
     
     async def get_member_activity_state(self, member: discord.Member) -> Dict[str, Union[str, bool, int, None]]:
@@ -877,8 +1225,9 @@ class ActivityTracker(commands.Cog):
         Public API method to retrieve the status of a specific member.
         """
         if member.bot:
-            return {"status": "unknown", "is_hibernating": True, "days_inactive": None, "last_seen": None}
+            return {"status": "unknown", "is_hibernating": True, "days_inactive": None, "last_seen": None, "level": None}
 
+        await self._flush_guild_activity(member.guild.id)
         data = await self.config.guild(member.guild).all()
         settings = ActivitySettings(**data["activity_settings"])
         
@@ -886,36 +1235,33 @@ class ActivityTracker(commands.Cog):
         is_hibernating = self._is_excluded(member, data["excluded_roles"])
         
         # 2. Get Timing Data
-        last_seen_str = data["last_seen"].get(str(member.id))
+        last_seen_ts = data["last_seen"].get(str(member.id))
         
         days_inactive = None
         last_seen_dt = None
         status = "unknown"
 
-        if last_seen_str:
-            try:
-                last_seen_dt = datetime.fromisoformat(last_seen_str).replace(tzinfo=timezone.utc)
-                days_inactive = (datetime.now(timezone.utc) - last_seen_dt).days
-                
-                # 3. Determine Status
-                poke_cutoff = self._get_inactivity_cutoff(settings.poke_days)
-                summon_cutoff = self._get_inactivity_cutoff(settings.summon_days)
-                
-                if last_seen_dt >= poke_cutoff:
-                    status = "active"
-                elif last_seen_dt >= summon_cutoff:
-                    status = "poke_eligible"
-                else:
-                    status = "summon_eligible"
-                    
-            except ValueError:
-                status = "unknown"
+        if last_seen_ts is not None:
+            last_seen_dt = datetime.fromtimestamp(last_seen_ts, tz=timezone.utc)
+            days_inactive = self._days_since(last_seen_ts)
+            
+            # 3. Determine Status
+            poke_cutoff = self._get_inactivity_cutoff(settings.poke_days)
+            summon_cutoff = self._get_inactivity_cutoff(settings.summon_days)
+            
+            if last_seen_ts >= poke_cutoff:
+                status = "active"
+            elif last_seen_ts >= summon_cutoff:
+                status = "poke_eligible"
+            else:
+                status = "summon_eligible"
         
         return {
             "status": status,
             "is_hibernating": is_hibernating,
             "days_inactive": days_inactive,
-            "last_seen": last_seen_dt
+            "last_seen": last_seen_dt,
+            "level": await self._get_level(member), # Cached LevelUp level, None if LevelUp isn't loaded
         }
 
     # --- End Public API ---
@@ -923,6 +1269,7 @@ class ActivityTracker(commands.Cog):
     async def _get_all_eligible_member_data(self, ctx: commands.Context) -> List[dict]:
         """Retrieves comprehensive data for all members who meet EITHER the poke or summon inactivity criteria."""
         guild = ctx.guild
+        await self._flush_guild_activity(guild.id)
         data = await self.config.guild(guild).all()
         
         settings = ActivitySettings(**data["activity_settings"])
@@ -936,32 +1283,22 @@ class ActivityTracker(commands.Cog):
         
         eligible_list = []
         
-        for user_id_str, last_seen_dt_str in last_seen_data.items():
+        for user_id_str, last_seen_ts in last_seen_data.items():
             user_id = int(user_id_str)
             member = guild.get_member(user_id)
             
             if member is None or member.bot or self._is_excluded(member, excluded_roles):
                 continue
-            
-            try:
-                last_seen_dt = datetime.fromisoformat(last_seen_dt_str).replace(tzinfo=timezone.utc)
-            except ValueError:
-                continue
 
-            is_poke_eligible = last_seen_dt < poke_cutoff
-            is_summon_eligible = last_seen_dt < summon_cutoff
+            is_poke_eligible = last_seen_ts < poke_cutoff
+            is_summon_eligible = last_seen_ts < summon_cutoff
             
             if is_poke_eligible or is_summon_eligible:
-                last_poked_str = last_poked_data.get(user_id_str)
-                last_summoned_str = last_summoned_data.get(user_id_str)
-                
-                last_seen_diff = (datetime.now(timezone.utc) - last_seen_dt).days
-                
                 eligible_list.append({
                     "member": member,
-                    "last_seen_days": last_seen_diff,
-                    "last_poked": self._format_date_diff(last_poked_str),
-                    "last_summoned": self._format_date_diff(last_summoned_str),
+                    "last_seen_days": self._days_since(last_seen_ts),
+                    "last_poked": self._format_date_diff(last_poked_data.get(user_id_str)),
+                    "last_summoned": self._format_date_diff(last_summoned_data.get(user_id_str)),
                     "eligible_for": ("Poke" if is_poke_eligible else "") + (" & Summon" if is_poke_eligible and is_summon_eligible else "Summon" if is_summon_eligible else "")
                 })
 
@@ -971,6 +1308,7 @@ class ActivityTracker(commands.Cog):
     async def _get_all_hibernating_member_data(self, ctx: commands.Context) -> List[dict]:
         """Retrieves data for ALL members who are excluded by role (Hibernating), regardless of activity."""
         guild = ctx.guild
+        await self._flush_guild_activity(guild.id)
         data = await self.config.guild(guild).all()
         settings = ActivitySettings(**data["activity_settings"])
         last_seen_data = data["last_seen"]
@@ -987,24 +1325,20 @@ class ActivityTracker(commands.Cog):
             if self._is_excluded(member, excluded_roles):
                 # Calculate status
                 user_id_str = str(member.id)
-                last_seen_dt_str = last_seen_data.get(user_id_str)
+                last_seen_ts = last_seen_data.get(user_id_str)
                 
                 days_diff = 0
                 status_str = "Unknown"
                 
-                if last_seen_dt_str:
-                    try:
-                        last_seen_dt = datetime.fromisoformat(last_seen_dt_str).replace(tzinfo=timezone.utc)
-                        days_diff = (datetime.now(timezone.utc) - last_seen_dt).days
-                        
-                        if last_seen_dt < summon_cutoff:
-                            status_str = "Summon Eligible"
-                        elif last_seen_dt < poke_cutoff:
-                            status_str = "Poke Eligible"
-                        else:
-                            status_str = "Active"
-                    except ValueError:
-                        pass
+                if last_seen_ts is not None:
+                    days_diff = self._days_since(last_seen_ts)
+                    
+                    if last_seen_ts < summon_cutoff:
+                        status_str = "Summon Eligible"
+                    elif last_seen_ts < poke_cutoff:
+                        status_str = "Poke Eligible"
+                    else:
+                        status_str = "Active"
                 
                 excluded_names = self._get_excluded_role_names(member, excluded_roles)
                 
@@ -1028,52 +1362,51 @@ class ActivityTracker(commands.Cog):
 
     # --- Listeners (Event Handlers) ---
     
+    @commands.Cog.listener()
+    async def on_member_levelup(self, guild: discord.Guild, member: discord.Member, *args, **kwargs):
+        """Drops the cached level when LevelUp reports a level change."""
+        self._invalidate_level(guild.id, member.id)
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Updates activity based on configured thresholds (messages/time/length/channel)."""
         if message.guild is None or message.author.bot or message.webhook_id:
             return
         
-        # Ignore valid commands
-        ctx = await self.bot.get_context(message)
-        if ctx.command:
-            return
-        
         guild = message.guild
         user_id = message.author.id
 
-        # 1. Check Excluded Channels
-        excluded_channels = await self.config.guild(guild).excluded_channels()
-        if message.channel.id in excluded_channels:
-            return
+        # 1. Fetch Settings (cached, no Config I/O after the first message)
+        cached = await self._get_cached_settings(guild)
+        settings = cached.settings
 
-        # 2. Fetch Settings
-        settings_data = await self.config.guild(guild).activity_settings()
-        settings = ActivitySettings(**settings_data)
+        # 2. Check Excluded Channels
+        if message.channel.id in cached.excluded_channels:
+            return
 
         # 3. Check Message Length
         if settings.min_message_length > 0 and len(message.content) < settings.min_message_length:
             return
 
+        # Ignore valid commands (done after the cheap filters, as building a context is expensive)
+        ctx = await self.bot.get_context(message)
+        if ctx.command:
+            return
+
         # 4. Check Burst Activity (X messages in Y hours)
         should_update = False
         
         if settings.required_messages <= 1 or settings.required_window_hours <= 0:
             should_update = True
         else:
-            now = datetime.now(timezone.utc)
-            if user_id not in self.recent_activity_cache:
-                self.recent_activity_cache[user_id] = []
-            
-            self.recent_activity_cache[user_id].append(now)
-            window_delta = timedelta(hours=settings.required_window_hours)
-            min_time = now - window_delta
-            
-            self.recent_activity_cache[user_id] = [
-                t for t in self.recent_activity_cache[user_id] if t > min_time
-            ]
-            
-            if len(self.recent_activity_cache[user_id]) >= settings.required_messages:
+            width = settings.required_window_hours * 3600 / BurstCounter.BUCKETS
+            counters = self.recent_activity_cache.setdefault(guild.id, {})
+            counter = counters.get(user_id)
+            if counter is None or counter.width != width:
+                # New talker, or the window was reconfigured
+                counter = counters[user_id] = BurstCounter(width)
+            
+            if counter.add(time.time()) >= settings.required_messages:
                 should_update = True
 
         # 5. Update if criteria met
@@ -1086,51 +1419,97 @@ class ActivityTracker(commands.Cog):
         if member.bot:
             return
         
+        if str(member.id) in self._pending_last_seen.get(member.guild.id, {}):
+            return
+        
         data = await self.config.guild(member.guild).last_seen()
         if str(member.id) not in data:
             await self._update_last_seen(member.guild, member.id)
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
-        """Tracks voice channel connection duration and participation."""
+        """Drives the voice session state machines for the member and everyone sharing their old/new channel."""
         if member.bot:
             return
         
-        guild = member.guild
-        excluded_channels = await self.config.guild(guild).excluded_channels()
-        settings = await self._get_settings(guild)
-        member_id = member.id
-        now = datetime.now(timezone.utc)
+        cached = await self._get_cached_settings(member.guild)
+        self._evaluate_voice_member(member, cached)
+        
+        # Joins and leaves change the population of both channels, which can start or stop other members' sessions
+        if before.channel != after.channel:
+            for channel in (before.channel, after.channel):
+                if channel is None:
+                    continue
+                for other in channel.members:
+                    if other.id != member.id and not other.bot:
+                        self._evaluate_voice_member(other, cached)
+
+    def _evaluate_voice_member(self, member: discord.Member, cached: CachedGuildSettings):
+        """Moves a member's voice session to the state matching their current voice state."""
+        settings = cached.settings
+        sessions = self.voice_sessions.setdefault(member.guild.id, {})
+        session = sessions.get(member.id)
+        voice = member.voice
+        channel = voice.channel if voice else None
+        
+        # Left voice, or in a channel we don't track: end the session
+        if channel is None or channel.id in cached.excluded_channels:
+            if session is not None:
+                self._end_voice_stretch(member.guild, member.id, session)
+                del sessions[member.id]
+            return
+        
+        # Joined or switched channel: a fresh session
+        if session is None or session.channel_id != channel.id:
+            if session is not None:
+                self._end_voice_stretch(member.guild, member.id, session)
+            session = sessions[member.id] = VoiceSession(channel.id)
+        
+        # Ignore muted/deafened users to prevent AFK farming. "with at least one more user" => Total >= voice_req_users
+        qualifies = (
+            not (voice.self_mute or voice.self_deaf or voice.mute or voice.deaf)
+            and len(channel.members) >= settings.voice_req_users
+        )
+        
+        if qualifies and session.qualifying_since is None:
+            session.qualifying_since = time.time()
+            self._arm_voice_timer(member.guild, member.id, session, settings.voice_req_minutes * 60)
+        elif not qualifies and session.qualifying_since is not None:
+            self._end_voice_stretch(member.guild, member.id, session)
 
-        # --- A. HANDLE LEAVING/SWITCHING (Session End) ---
-        # If user was in a channel before (before.channel is not None), they are leaving it (or switching)
-        if before.channel is not None:
-            # We only credit if they had an open session tracker
-            if member_id in self.voice_connect_times:
-                start_time = self.voice_connect_times.pop(member_id)
-                duration = now - start_time
-                
-                # Condition 1: Duration check
-                if duration >= timedelta(minutes=settings.voice_req_minutes):
-                    # Condition 2: Population check (User + at least one more = Total >= voice_req_users)
-                    # We check the channel they just LEFT.
-                    # Note: When this event fires, the user has already left/switched in terms of Discord state?
-                    # Actually, for 'before', it represents the state immediately prior.
-                    # So 'len(before.channel.members)' includes the user.
-                    if len(before.channel.members) >= settings.voice_req_users:
-                        await self._update_last_seen(guild, member_id)
-
-        # --- B. HANDLE JOINING/SWITCHING (Session Start) ---
-        # If user is now in a channel
-        if after.channel is not None:
-            # Exclusion Check
-            if after.channel.id in excluded_channels:
-                return # Do not track excluded channels
-            
-            # (Optional) We can filter deafened users if desired, but user didn't explicitly ask for it.
-            # Sticking to previous pattern of ignoring deafened users to prevent AFK farming.
-            if not after.self_mute and not after.self_deaf and not after.mute and not after.deaf:
-                self.voice_connect_times[member_id] = now
+    def _arm_voice_timer(self, guild: discord.Guild, member_id: int, session: VoiceSession, delay: float):
+        session.timer = self.bot.loop.call_later(delay, self._credit_voice_session, guild, member_id, session, delay)
+
+    def _credit_voice_session(self, guild: discord.Guild, member_id: int, session: VoiceSession, delay: float):
+        """
+        Timer callback: the stretch has qualified for long enough, so mark the member active.
+        The timer is re-armed so members staying in voice longer than the inactivity window keep being refreshed.
+        """
+        if self.voice_sessions.get(guild.id, {}).get(member_id) is not session:
+            return
+        session.credited = True
+        self._arm_voice_timer(guild, member_id, session, delay)
+        self.bot.loop.create_task(self._update_last_seen(guild, member_id))
+
+    def _end_voice_stretch(self, guild: discord.Guild, member_id: int, session: VoiceSession):
+        """Stops a qualifying stretch; one that was already credited is credited again for the time since."""
+        if session.credited:
+            session.credited = False
+            self.bot.loop.create_task(self._update_last_seen(guild, member_id))
+        session.stop_qualifying()
+
+    async def _recover_voice_sessions(self):
+        """Rebuilds voice sessions from current voice states after a (re)load, as no events are replayed."""
+        await self.bot.wait_until_ready()
+        for guild in self.bot.guilds:
+            try:
+                cached = await self._get_cached_settings(guild)
+                for channel in guild.voice_channels:
+                    for member in channel.members:
+                        if not member.bot:
+                            self._evaluate_voice_member(member, cached)
+            except Exception as e:
+                log.error(f"ActivityTracker: Failed to recover voice sessions for guild {guild.id}: {e}", exc_info=True)
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
@@ -1144,7 +1523,7 @@ class ActivityTracker(commands.Cog):
         if len(before.roles) <= len(after.roles):
             return
 
-        excluded_role_ids = await self.config.guild(after.guild).excluded_roles()
+        excluded_role_ids = (await self._get_cached_settings(after.guild)).excluded_roles
         if not excluded_role_ids:
             return
         
@@ -1154,7 +1533,7 @@ class ActivityTracker(commands.Cog):
         removed_ids = before_ids - after_ids
         
         # Check intersection
-        if not removed_ids.isdisjoint(set(excluded_role_ids)):
+        if not removed_ids.isdisjoint(excluded_role_ids):
             # A hibernating role was removed.
             # We reset their timer to ensure they start at 0.
             await self._update_last_seen(after.guild, after.id)
@@ -1383,6 +1762,7 @@ class ActivityTracker(commands.Cog):
         async with ctx.typing():
             guild = ctx.guild
             settings = await self._get_settings(guild)
+            await self._flush_guild_activity(guild.id)
             data = await self.config.guild(guild).all()
             
             warned_users = data["warned_users"]
@@ -1404,10 +1784,11 @@ class ActivityTracker(commands.Cog):
             
             action_list = [] # List of tuples: (Member, ActionString)
             
-            for member in list(guild.members):
-                if member.bot or self._is_excluded(member, excluded_roles):
-                    continue
-                    
+            members = [m for m in guild.members if not m.bot and not self._is_excluded(m, excluded_roles)]
+            levels = await self._get_levels(guild, members) if levelup_cog else {}
+            
+            for member in members:
+
                 user_id_str = str(member.id)
                 user_warnings = warned_users.get(user_id_str, {})
                 
@@ -1423,8 +1804,7 @@ class ActivityTracker(commands.Cog):
 
                 # B. Level 0 Checks
                 if levelup_cog:
-                    # FIX: Await the async function
-                    level = await levelup_cog.get_level(member)
+                    level = levels.get(member.id)
                     
                     if level == 0:
                         days_joined = (now - member.joined_at.replace(tzinfo=timezone.utc)).days
@@ -1441,24 +1821,20 @@ class ActivityTracker(commands.Cog):
 
                 # C. Inactivity Checks
                 if settings.warn_level_1_days > 0 or settings.warn_level_3_days > 0:
-                    last_seen_dt_str = last_seen_data.get(user_id_str)
-                    if last_seen_dt_str:
-                        try:
-                            last_seen_dt = datetime.fromisoformat(last_seen_dt_str).replace(tzinfo=timezone.utc)
-                            days_inactive = (now - last_seen_dt).days
-                            
-                            # L3 Kick
-                            if settings.warn_level_3_days > 0 and days_inactive >= settings.warn_level_3_days:
-                                if "level3" not in user_warnings:
-                                    actions.append(f"🔴 **Inactivity KICK** (Inactive {days_inactive}d)")
-                            
-                            # L1 Warn (only if not getting kicked, usually)
-                            # But technically the system might do both if configured poorly, so show both.
-                            if settings.warn_level_1_days > 0 and days_inactive >= settings.warn_level_1_days:
-                                if "level1" not in user_warnings:
-                                    actions.append(f"🟠 **Inactivity Warning** (Inactive {days_inactive}d)")
-                        except ValueError:
-                            pass
+                    last_seen_ts = last_seen_data.get(user_id_str)
+                    if last_seen_ts is not None:
+                        days_inactive = self._days_since(last_seen_ts)
+                        
+                        # L3 Kick
+                        if settings.warn_level_3_days > 0 and days_inactive >= settings.warn_level_3_days:
+                            if "level3" not in user_warnings:
+                                actions.append(f"🔴 **Inactivity KICK** (Inactive {days_inactive}d)")
+                        
+                        # L1 Warn (only if not getting kicked, usually)
+                        # But technically the system might do both if configured poorly, so show both.
+                        if settings.warn_level_1_days > 0 and days_inactive >= settings.warn_level_1_days:
+                            if "level1" not in user_warnings:
+                                actions.append(f"🟠 **Inactivity Warning** (Inactive {days_inactive}d)")
 
                 if actions:
                     action_list.append((member, "\n".join(actions)))
@@ -1504,6 +1880,7 @@ class ActivityTracker(commands.Cog):
         async with ctx.typing():
             guild = ctx.guild
             settings = await self._get_settings(guild)
+            await self._flush_guild_activity(guild.id)
             data = await self.config.guild(guild).all()
             
             warned_users = data["warned_users"]
@@ -1531,8 +1908,7 @@ class ActivityTracker(commands.Cog):
             
             # 2. Level Up Check
             if levelup_cog:
-                # FIX: Await the async function
-                level = await levelup_cog.get_level(member)
+                level = await self._get_level(member)
                 embed.add_field(name="Current Level", value=f"{level}", inline=True)
                 
                 if level == 0:
@@ -1923,6 +2299,7 @@ class ActivityTracker(commands.Cog):
             if channel.id in channels:
                 return await ctx.send("Channel is already excluded.")
             channels.append(channel.id)
+        self._invalidate_settings_cache(ctx.guild)
         await ctx.send(f"Channel {channel.mention} added to exclusions.")
 
     @activityset_excludechannel.command(name="remove")
@@ -1932,6 +2309,7 @@ class ActivityTracker(commands.Cog):
             if channel.id not in channels:
                 return await ctx.send("Channel is not excluded.")
             channels.remove(channel.id)
+        self._invalidate_settings_cache(ctx.guild)
         await ctx.send(f"Channel {channel.mention} removed from exclusions.")
 
     # --- Hibernating (Excluded) Roles Management ---
@@ -1964,6 +2342,7 @@ class ActivityTracker(commands.Cog):
             if role.id in excluded_roles:
                 return await ctx.send(f"The role **{role.name}** is already set to Hibernate.")
             excluded_roles.append(role.id)
+        self._invalidate_settings_cache(ctx.guild)
         
         await ctx.send(f"Added role **{role.name}** to the Hibernating list. Members with this role will no longer be poked or summoned.")
 
@@ -1974,6 +2353,7 @@ class ActivityTracker(commands.Cog):
             if role.id not in excluded_roles:
                 return await ctx.send(f"The role **{role.name}** was not found in the Hibernating list.")
             excluded_roles.remove(role.id)
+        self._invalidate_settings_cache(ctx.guild)
             
         await ctx.send(f"Removed role **{role.name}** from the Hibernating list. Members with this role may now be poked or summoned if they meet the inactivity criteria.")
 
@@ -2062,6 +2442,7 @@ class ActivityTracker(commands.Cog):
         """
         async with ctx.typing():
             settings = await self._get_settings(ctx.guild)
+            await self._flush_guild_activity(ctx.guild.id)
             data = await self.config.guild(ctx.guild).all()
             last_seen_data = data["last_seen"]
             excluded_roles = data["excluded_roles"]
@@ -2079,7 +2460,7 @@ class ActivityTracker(commands.Cog):
                 if member.bot:
                     continue
                 
-                last_seen_str = last_seen_data.get(str(member.id))
+                last_seen_ts = last_seen_data.get(str(member.id))
                 
                 # Determine exclusion FIRST to override icons
                 is_hibernating = self._is_excluded(member, excluded_roles)
@@ -2088,26 +2469,19 @@ class ActivityTracker(commands.Cog):
                 days_ago_str = "Never"
                 sort_val = float('inf') # Infinity for sorting 'Never' at the end of their group
                 
-                if last_seen_str:
-                    try:
-                        last_seen_dt = datetime.fromisoformat(last_seen_str).replace(tzinfo=timezone.utc)
-                        diff_days = (datetime.now(timezone.utc) - last_seen_dt).days
-                        days_ago_str = f"{diff_days} days ago"
-                        sort_val = diff_days
-                        
-                        if not is_hibernating:
-                            # Determine normal status based on thresholds
-                            if last_seen_dt >= poke_cutoff:
-                                icon = "✅" # Active
-                            elif last_seen_dt >= summon_cutoff:
-                                icon = "👉" # Inactive enough for poke, but not summon
-                            elif last_seen_dt < summon_cutoff:
-                                icon = "👻" # Inactive enough for summon 
-                            else:
-                                icon = "❓" # Unknown data
-                            
-                    except ValueError:
-                        pass
+                if last_seen_ts is not None:
+                    diff_days = self._days_since(last_seen_ts)
+                    days_ago_str = f"{diff_days} days ago"
+                    sort_val = diff_days
+                    
+                    if not is_hibernating:
+                        # Determine normal status based on thresholds
+                        if last_seen_ts >= poke_cutoff:
+                            icon = "✅" # Active
+                        elif last_seen_ts >= summon_cutoff:
+                            icon = "👉" # Inactive enough for poke, but not summon
+                        else:
+                            icon = "👻" # Inactive enough for summon 
                 
                 if is_hibernating:
                     icon = "💤"
@@ -2150,7 +2524,8 @@ class ActivityTracker(commands.Cog):
                 return await ctx.send("No pages to display.")
 
             # Launch View
-            view = ActivityStatusView(ctx, pages)
+            stats = f"{self._get_burst_cache_stats(ctx.guild)}\n{self._get_guild_run_stats(ctx.guild)}"
+            view = ActivityStatusView(ctx, pages, stats=stats)
             embed = await view.get_embed()
             view.message = await ctx.send(embed=embed, view=view)
 
@@ -2223,6 +2598,32 @@ class ActivityTracker(commands.Cog):
         await self._set_settings(ctx.guild, settings)
         await ctx.send("Removed.")
 
+    @activityset.command(name="flushinterval")
+    @checks.is_owner()
+    async def activityset_flushinterval(self, ctx: commands.Context, seconds: int, max_pending: Optional[int] = None):
+        """
+        [OWNER] Sets how often queued activity updates are written to storage.
+        
+        Args:
+            seconds: Interval between flushes (10-3600).
+            max_pending: Optional. Number of queued users in one guild that forces an immediate flush.
+        
+        Together these bound how much activity can be lost if the bot stops unexpectedly.
+        """
+        if seconds < 10 or seconds > 3600:
+            return await ctx.send("Interval must be between 10 and 3600 seconds.")
+        if max_pending is not None and max_pending < 1:
+            return await ctx.send("Max pending updates must be >= 1.")
+        
+        await self.config.flush_interval_seconds.set(seconds)
+        self.activity_flush_loop.change_interval(seconds=seconds)
+        
+        if max_pending is not None:
+            await self.config.max_pending_updates.set(max_pending)
+            self._max_pending_updates = max_pending
+        
+        await ctx.send(f"Activity updates will be flushed every **{seconds}** seconds or once **{self._max_pending_updates}** users are queued in a guild.")
+
     # --- Override/Reset ---
 
     @activityset.command(name="backfill")
@@ -2236,9 +2637,9 @@ class ActivityTracker(commands.Cog):
         if days_ago < 0: return await ctx.send("Days must be >= 0.")
         
         async with ctx.typing():
-            target_dt = datetime.now(timezone.utc) - timedelta(days=days_ago)
-            target_str = target_dt.isoformat()
+            target_ts = int(time.time()) - days_ago * 86400
             
+            await self._flush_guild_activity(ctx.guild.id)
             async with self.config.guild(ctx.guild).last_seen() as data:
                 count = 0
                 for member in ctx.guild.members:
@@ -2246,8 +2647,9 @@ class ActivityTracker(commands.Cog):
                         continue
                     
                     if str(member.id) not in data:
-                        data[str(member.id)] = target_str
+                        data[str(member.id)] = target_ts
                         count += 1
+            self._invalidate_activity_index(ctx.guild)
                         
         await ctx.send(f"✅ Initialized data for **{count}** members. They are now marked as active **{days_ago} days ago**.")
 
@@ -2256,11 +2658,13 @@ class ActivityTracker(commands.Cog):
         """Overrides the last active date for all members of a given role."""
         if days_ago < 0: return await ctx.send("Days must be >= 0.")
         async with ctx.typing():
-            target_dt = datetime.now(timezone.utc) - timedelta(days=days_ago)
+            target_ts = int(time.time()) - days_ago * 86400
+            await self._flush_guild_activity(ctx.guild.id)
             data = await self.config.guild(ctx.guild).last_seen()
             for member in role.members:
-                if not member.bot: data[str(member.id)] = target_dt.isoformat()
+                if not member.bot: data[str(member.id)] = target_ts
             await self.config.guild(ctx.guild).last_seen.set(data)
+            self._invalidate_activity_index(ctx.guild)
         await ctx.send(f"Set **{len(role.members)}** members to **{days_ago} days ago**.")
         # Trigger warn check next loop
 
@@ -2281,10 +2685,12 @@ class ActivityTracker(commands.Cog):
         
         This effectively makes them eligible for pokes, summons, or kicks immediately on the next loop.
         """
-        one_year_ago = datetime.now(timezone.utc) - timedelta(days=365)
+        one_year_ago = int(time.time()) - 365 * 86400
         
+        await self._flush_guild_activity(ctx.guild.id)
         async with self.config.guild(ctx.guild).last_seen() as data:
-            data[str(member.id)] = one_year_ago.isoformat()
+            data[str(member.id)] = one_year_ago
+        self._invalidate_activity_index(ctx.guild)
             
         await ctx.send(f"💤 **{member.display_name}** has been marked as inactive (Last seen set to 1 year ago).")
 
@@ -2295,10 +2701,12 @@ class ActivityTracker(commands.Cog):
         await ctx.send("Are you sure? Type `yes`.")
         try:
             if (await self.bot.wait_for('message', check=lambda m: m.author==ctx.author and m.content.lower()=='yes', timeout=30)):
+                self._pending_last_seen.pop(ctx.guild.id, None)
                 await self.config.guild(ctx.guild).last_seen.set({})
                 await self.config.guild(ctx.guild).last_poked.set({})
                 await self.config.guild(ctx.guild).last_summoned.set({})
                 await self.config.guild(ctx.guild).warned_users.set({})
+                self._invalidate_activity_index(ctx.guild)
                 await ctx.send("Data reset.")
         except TimeoutError:
             await ctx.send("Cancelled.")
@@ -2308,6 +2716,7 @@ class ActivityTracker(commands.Cog):
     @activityset.command(name="export")
     async def activityset_export(self, ctx: commands.Context):
         """Exports all settings and user activity data to a JSON file."""
+        await self._flush_guild_activity(ctx.guild.id)
         data = await self.config.guild(ctx.guild).all()
         
         # Convert to JSON
@@ -2348,7 +2757,15 @@ class ActivityTracker(commands.Cog):
             except TimeoutError:
                 return await ctx.send("Import cancelled.")
             
+            # Older exports store ISO strings; convert them so the imported data matches the current schema
+            self._normalize_timestamps(data)
+            
+            # Drop queued updates so they don't overwrite the imported history on the next flush
+            self._pending_last_seen.pop(ctx.guild.id, None)
             await self.config.guild(ctx.guild).set(data)
+            self._invalidate_settings_cache(ctx.guild)
+            self._invalidate_activity_index(ctx.guild)
+            self._next_auto_event.pop(ctx.guild.id, None)
             await ctx.send("✅ Data imported successfully.")
             
         except json.JSONDecodeError:
@@ -0,0 +1,38 @@
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+
+class TimestampIndex:
+    """
+    Per-guild ordered index of {user_id_str: epoch_ts}, kept sorted by timestamp.
+    Lets "everyone last seen before X" be answered with a binary search instead of a full scan.
+    """
+    __slots__ = ("_by_user", "_ordered")
+
+    def __init__(self, data: Dict[str, int]):
+        self._by_user: Dict[str, int] = dict(data)
+        self._ordered: List[Tuple[int, str]] = sorted((ts, uid) for uid, ts in data.items())
+
+    def __len__(self) -> int:
+        return len(self._by_user)
+
+    def get(self, user_id_str: str) -> Optional[int]:
+        return self._by_user.get(user_id_str)
+
+    def set(self, user_id_str: str, ts: int):
+        """Inserts or moves a user to their new position."""
+        old = self._by_user.get(user_id_str)
+        if old == ts:
+            return
+        if old is not None:
+            del self._ordered[bisect.bisect_left(self._ordered, (old, user_id_str))]
+        self._by_user[user_id_str] = ts
+        bisect.insort(self._ordered, (ts, user_id_str))
+
+    def before(self, cutoff: int) -> List[Tuple[int, str]]:
+        """All (ts, user_id_str) with ts < cutoff, oldest first."""
+        return self._ordered[:bisect.bisect_left(self._ordered, (cutoff, ""))]
+
+    def after(self, cutoff: int) -> List[Tuple[int, str]]:
+        """All (ts, user_id_str) with ts > cutoff, oldest first."""
+        return self._ordered[bisect.bisect_right(self._ordered, (cutoff, "\uffff")):]
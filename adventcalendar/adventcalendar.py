@@ -156,7 +156,7 @@ class AdventCalendar(Cog):
         tz = None
         if timezone_cog:
             try:
-                tz = await timezone_cog.get_user_timezone(member.id)
+                tz = (await timezone_cog.get_user_timezones([member.id])).get(member.id)
             except Exception:
                 pass
         
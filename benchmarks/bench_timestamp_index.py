@@ -0,0 +1,112 @@
+"""
+Benchmark for ActivityTracker's candidate selection (activitytracker/index.py).
+
+Compares the old path of _get_eligible_members (copy the guild blob out of Config,
+scan every last_seen entry, sort the previously actioned members) with the
+TimestampIndex range query that replaced it. Pure Python; Red is not needed.
+
+    python benchmarks/bench_timestamp_index.py [--members 100000] [--repeat 5]
+"""
+import argparse
+import copy
+import importlib.util
+import random
+import time
+from pathlib import Path
+
+_INDEX_PATH = Path(__file__).resolve().parent.parent / "activitytracker" / "index.py"
+# Loaded by path so the package __init__ (which imports redbot) isn't executed
+_spec = importlib.util.spec_from_file_location("activitytracker_index", _INDEX_PATH)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+TimestampIndex = _module.TimestampIndex
+
+DAY = 86400
+
+
+def make_guild(members: int, now: int, seed: int = 0) -> dict:
+    """last_seen uniform over 90 days; a third of the members were poked at some point."""
+    rng = random.Random(seed)
+    last_seen = {str(10**17 + i): now - rng.randrange(90 * DAY) for i in range(members)}
+    last_poked = {uid: now - rng.randrange(180 * DAY) for uid in last_seen if rng.random() < 1 / 3}
+    return {"last_seen": last_seen, "last_poked": last_poked, "excluded_roles": []}
+
+
+def select_scan(config_data: dict, members: dict, cutoff: int):
+    data = copy.deepcopy(config_data) # Config.guild(guild).all() hands out a copy
+    last_action = data["last_poked"]
+    priority_1, priority_2 = [], []
+    for user_id_str, last_seen_ts in data["last_seen"].items():
+        if last_seen_ts >= cutoff:
+            continue
+        member = members.get(int(user_id_str))
+        if member is None:
+            continue
+        last_action_ts = last_action.get(user_id_str)
+        if last_action_ts is None:
+            priority_1.append(member)
+        else:
+            priority_2.append((member, last_action_ts))
+    return priority_1, [m for m, _ in sorted(priority_2, key=lambda x: x[1])]
+
+
+def select_index(index: dict, members: dict, cutoff: int):
+    last_action = index["last_poked"]
+    priority_1, priority_2 = [], []
+    for _, user_id_str in index["last_seen"].before(cutoff):
+        member = members.get(int(user_id_str))
+        if member is None:
+            continue
+        last_action_ts = last_action.get(user_id_str)
+        if last_action_ts is None:
+            priority_1.append(member)
+        else:
+            priority_2.append((member, last_action_ts))
+    return priority_1, [m for m, _ in sorted(priority_2, key=lambda x: x[1])]
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = int(time.time())
+    data = make_guild(args.members, now)
+    members = {int(uid): uid for uid in data["last_seen"]} # Stand-in for guild.get_member
+
+    start = time.perf_counter()
+    index = {key: TimestampIndex(data[key]) for key in ("last_seen", "last_poked")}
+    build_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{args.members} members, best of {args.repeat}")
+    for days in (30, 60, 85):
+        cutoff = now - days * DAY
+        # Same members selected; priority 1 order differs (Config order vs oldest first)
+        old_p1, old_p2 = select_scan(data, members, cutoff)
+        new_p1, new_p2 = select_index(index, members, cutoff)
+        assert sorted(old_p1) == sorted(new_p1) and sorted(old_p2) == sorted(new_p2)
+        matches = len(index["last_seen"].before(cutoff))
+        scan_ms = best_of(args.repeat, select_scan, data, members, cutoff)
+        index_ms = best_of(args.repeat, select_index, index, members, cutoff)
+        print(f"  {days}-day cutoff ({matches} matches): scan {scan_ms:.1f} ms -> index {index_ms:.1f} ms")
+
+    uids = list(data["last_seen"])
+    start = time.perf_counter()
+    for i in range(1000):
+        index["last_seen"].set(uids[i * 7 % len(uids)], now + i)
+    update_ms = (time.perf_counter() - start) * 1000
+    print(f"  index build: {build_ms:.1f} ms, 1000 incremental updates: {update_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
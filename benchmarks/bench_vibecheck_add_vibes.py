@@ -0,0 +1,114 @@
+"""
+Micro-benchmark for VibeCheck._add_vibes against Red's JSON Config backend.
+
+Runs good and bad vibes between a pool of members in one guild and reports calls/second.
+Requires Red-DiscordBot; Config data is written to a temporary directory.
+
+    python benchmarks/bench_vibecheck_add_vibes.py [--calls 2000] [--users 100] [--concurrency 10]
+
+It can also be run as `pytest benchmarks/bench_vibecheck_add_vibes.py`, which skips it when redbot is missing.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _use_json_backend(data_path: str):
+    """Points Red's data manager at data_path with the JSON driver, like an instance set up with redbot-setup."""
+    from redbot.core import data_manager
+
+    data_manager.basic_config = {
+        **data_manager.basic_config_default,
+        "DATA_PATH": data_path,
+        "STORAGE_TYPE": "JSON",
+        "STORAGE_DETAILS": {},
+    }
+
+
+def _make_bot(guild):
+    async def wait_until_red_ready():
+        return None
+
+    return SimpleNamespace(
+        loop=asyncio.get_running_loop(),
+        guilds=[guild],
+        get_guild=lambda guild_id: guild if guild_id == guild.id else None,
+        get_cog=lambda name: None,
+        add_view=lambda view: None,
+        remove_view=lambda view: None,
+        wait_until_red_ready=wait_until_red_ready,
+    )
+
+
+async def measure(calls: int, users: int, concurrency: int, seed: int = 0) -> float:
+    """Returns _add_vibes calls per second. Red's data manager must already be configured."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    from vibecheck.vibecheck import VibeCheck
+
+    guild = SimpleNamespace(id=1)
+    members = {
+        user_id: SimpleNamespace(id=user_id, name=f"user{user_id}", guild=guild, joined_at=None, bot=False)
+        for user_id in range(1000, 1000 + users)
+    }
+    guild.members = list(members.values())
+    guild.get_member = members.get
+
+    cog = VibeCheck(_make_bot(guild))
+    # Keep a random walk of scores from tripping WarnSystem or kick votes
+    guild_conf = cog.conf.guild(guild)
+    await guild_conf.warn_threshold.set(None)
+    await guild_conf.kick_threshold.set(None)
+    await guild_conf.ban_threshold.set(None)
+    await cog.cog_load()
+    await cog._member_index_task
+
+    rng = random.Random(seed)
+    pairs = [tuple(rng.sample(guild.members, 2)) + (rng.random() < 0.5,) for _ in range(calls)]
+
+    start = time.perf_counter()
+    for i in range(0, calls, concurrency):
+        await asyncio.gather(*(
+            cog._add_vibes(giver, receiver, 1 if is_good else -1, is_good)
+            for giver, receiver, is_good in pairs[i:i + concurrency]
+        ))
+    elapsed = time.perf_counter() - start
+    cog.cog_unload()
+    return calls / elapsed
+
+
+def test_add_vibes_throughput(tmp_path):
+    import pytest
+
+    pytest.importorskip("redbot")
+    _use_json_backend(str(tmp_path))
+    assert asyncio.run(measure(calls=200, users=20, concurrency=10)) > 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    try:
+        import redbot  # noqa: F401
+    except ImportError:
+        sys.exit("Red-DiscordBot is not installed; this benchmark needs redbot.core.Config.")
+
+    with tempfile.TemporaryDirectory() as data_path:
+        _use_json_backend(data_path)
+        rate = asyncio.run(measure(args.calls, args.users, args.concurrency))
+    print(f"{args.calls} calls, {args.users} users, concurrency {args.concurrency}: {rate:.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
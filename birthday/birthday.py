@@ -1,7 +1,11 @@
 import discord
 import re
 import asyncio
-from datetime import datetime, time
+import functools
+import heapq
+import itertools
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
 import pytz
 import io
 from typing import Optional, List, Dict, Union
@@ -10,6 +14,14 @@ from redbot.core import commands, Config, checks
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import box, pagify
 
+# Upper bound on how long the scheduler sleeps without re-checking
+MAX_SCHEDULER_SLEEP = 3600
+
+@functools.lru_cache(maxsize=512)
+def get_zone(name: str) -> pytz.BaseTzInfo:
+    """Constructs (once) the pytz zone for a timezone name. Raises pytz.UnknownTimeZoneError."""
+    return pytz.timezone(name)
+
 # --- UI CLASSES ---
 
 class BirthdayModal(discord.ui.Modal, title="Set Your Birthday"):
@@ -80,6 +92,7 @@ class BirthdayModal(discord.ui.Modal, title="Set Your Birthday"):
         await self.cog.config.user(interaction.user).month.set(m_val)
         await self.cog.config.user(interaction.user).day.set(d_val)
         await self.cog.config.user(interaction.user).year.set(y_val)
+        await self.cog.refresh_user(interaction.user.id)
 
         msg = f"Birthday set to: {self.cog.month_names.get(m_val)} {d_val}"
         if y_val:
@@ -110,6 +123,7 @@ class TimezoneModal(discord.ui.Modal, title="Set Timezone"):
             )
 
         await self.cog.config.user(interaction.user).timezone.set(tz_input)
+        await self.cog.refresh_user(interaction.user.id)
         await interaction.response.send_message(f"Timezone set to `{tz_input}`.", ephemeral=True)
 
 
@@ -129,6 +143,7 @@ class BirthdayView(discord.ui.View):
     @discord.ui.button(label="Remove Data", style=discord.ButtonStyle.danger, emoji="🗑️")
     async def remove_data(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self.cog.config.user(interaction.user).clear()
+        await self.cog.refresh_user(interaction.user.id)
         await interaction.response.edit_message(
             content="Your birthday and timezone data have been removed. Use the buttons to set new data.", 
             embed=None, 
@@ -162,6 +177,17 @@ class Birthday(commands.Cog):
 
         self.config.register_guild(**default_guild)
         self.config.register_user(**default_user)
+
+        # Scheduler state, see the SCHEDULER section
+        self.users: Dict[int, dict] = {}
+        self.birthday_index = defaultdict(set)
+        self.guild_times: Dict[int, tuple] = {}
+        self.buckets: Dict[tuple, dict] = {}
+        self.schedule_heap: List[tuple] = []
+        self._event_seq = itertools.count()
+        self.next_window_ts = None
+        self.celebrated: Dict[tuple, set] = {}
+        self.wakeup = asyncio.Event()
         
         self.loop_task = self.bot.loop.create_task(self.birthday_loop())
         
@@ -205,119 +231,324 @@ class Birthday(commands.Cog):
         Attempts to get the timezone from the external Timezone cog.
         Falls back to local config, then UTC.
         """
-        # Try External Cog First
+        return (await self.get_user_tzs({user_id: u_conf}))[user_id]
+
+    async def get_user_tzs(self, users: Dict[int, dict]) -> dict:
+        """Resolves {user_id: u_conf} to {user_id: tz} with a single lookup in the external Timezone cog."""
+        external = {}
         timezone_cog = self.bot.get_cog("Timezone")
         if timezone_cog:
             try:
-                # API Integration per user instructions
-                tz_data = await timezone_cog.get_user_timezone(user_id)
-                if tz_data:
-                    # Assuming API returns a string or something capable of initializing pytz
-                    return pytz.timezone(str(tz_data))
+                # Cached pytz zones (no Config read); None for users who haven't set one there
+                external = await timezone_cog.get_user_timezones(list(users))
             except Exception:
-                # Fail silently if user not found in external cog or API differs
+                # Fail silently if the external cog's API differs
                 pass
-        
-        # Fallback to internal config
-        tz_name = u_conf.get("timezone", "UTC")
-        try:
-            return pytz.timezone(tz_name)
-        except pytz.UnknownTimeZoneError:
-            return pytz.UTC
 
-    # --- LOOPS ---
+        resolved = {}
+        for user_id, u_conf in users.items():
+            tz = external.get(user_id)
+            if not tz:
+                # Fallback to internal config
+                try:
+                    tz = get_zone(u_conf.get("timezone", "UTC"))
+                except pytz.UnknownTimeZoneError:
+                    tz = pytz.UTC
+            resolved[user_id] = tz
+        return resolved
+
+    # --- SCHEDULER ---
+    # Birthdays are indexed by (month, day). Around each UTC day only the users whose birthday
+    # falls in the window are bucketed by (timezone, guild, local date, announce time); each bucket
+    # is one heap entry that fires when that local announcement time arrives. Role removal is its
+    # own timed event at the end of the member's local birthday.
+
+    async def build_index(self):
+        """(Re)loads all user birthdays into the (month, day) index."""
+        self.users = {}
+        self.birthday_index = defaultdict(set)
+        for user_id, u_conf in (await self.config.all_users()).items():
+            self._index_user(int(user_id), u_conf)
+
+    def _index_user(self, user_id: int, u_conf: Optional[dict]):
+        old = self.users.pop(user_id, None)
+        if old:
+            self.birthday_index[(old["month"], old["day"])].discard(user_id)
+        if u_conf and u_conf.get("month") and u_conf.get("day"):
+            self.users[user_id] = u_conf
+            self.birthday_index[(u_conf["month"], u_conf["day"])].add(user_id)
+
+    async def refresh_user(self, user_id: int):
+        """Call after a user's birthday or timezone changed."""
+        u_conf = await self.config.user_from_id(user_id).all()
+        self._index_user(user_id, u_conf)
+        await self.schedule_user(user_id)
+        self.wakeup.set()
+
+    async def reschedule(self):
+        """Call after birthdays were bulk-changed or a guild's announcement settings changed."""
+        await self.schedule_window()
+        self.wakeup.set()
+
+    def _push_event(self, due_ts: float, kind: str, payload):
+        heapq.heappush(self.schedule_heap, (due_ts, next(self._event_seq), kind, payload))
+
+    @staticmethod
+    def _window_dates(now_utc: datetime) -> List[date]:
+        # Local dates anywhere on earth are within a day of the UTC date
+        today = now_utc.date()
+        return [today + timedelta(days=offset) for offset in (-1, 0, 1)]
+
+    async def schedule_window(self):
+        """Buckets every birthday in the current window and queues the next window refresh."""
+        now_utc = datetime.now(pytz.UTC)
+        guilds_config = await self.config.all_guilds()
+        self.guild_times = {
+            int(guild_id): tuple(g_conf.get("announce_time", [0, 0]))
+            for guild_id, g_conf in guilds_config.items()
+        }
 
-    async def birthday_loop(self):
-        await self.bot.wait_until_ready()
-        while True:
-            try:
-                # Run logic every 5 minutes to be more accurate with time settings
-                await self.check_birthdays()
-                await asyncio.sleep(300) 
-            except Exception as e:
-                print(f"Error in birthday loop: {e}")
-                await asyncio.sleep(60)
+        window = self._window_dates(now_utc)
+        # Forget buckets for dates that can no longer be anyone's birthday
+        for key in [k for k in self.buckets if k[2] < window[0]]:
+            del self.buckets[key]
+        oldest = window[0].strftime("%Y-%m-%d")
+        for key in [k for k in self.celebrated if k[1] < oldest]:
+            del self.celebrated[key]
+
+        user_ids = {user_id for day in window for user_id in self.birthday_index.get((day.month, day.day), ())}
+        zones = await self.get_user_tzs({user_id: self.users[user_id] for user_id in user_ids if user_id in self.users})
+        for user_id, tz in zones.items():
+            await self.schedule_user(user_id, now_utc, tz)
+
+        next_window = datetime.combine(window[1] + timedelta(days=1), time(0), tzinfo=pytz.UTC).timestamp()
+        if self.next_window_ts != next_window:
+            self.next_window_ts = next_window
+            self._push_event(next_window, "window", None)
+
+    async def schedule_user(self, user_id: int, now_utc: datetime = None, tz=None):
+        """
+        Adds a user to the announcement bucket(s) of their birthday, if it falls in the window.
+        Pass tz when it was already resolved in bulk.
+        """
+        u_conf = self.users.get(user_id)
+        if not u_conf:
+            return
+
+        now_utc = now_utc or datetime.now(pytz.UTC)
+        days = [d for d in self._window_dates(now_utc) if (d.month, d.day) == (u_conf["month"], u_conf["day"])]
+        if not days:
+            return
+
+        # RESOLVE TIMEZONE (External -> Internal -> UTC)
+        if tz is None:
+            tz = await self.get_user_tz(user_id, u_conf)
+        now_ts = now_utc.timestamp()
+
+        for guild_id, (t_hour, t_min) in self.guild_times.items():
+            guild = self.bot.get_guild(guild_id)
+            if not guild or not guild.get_member(user_id):
+                continue
 
-    async def check_birthdays(self):
-        guilds_config = await self.config.all_guilds()
-        all_users = await self.config.all_users()
+            for day in days:
+                end_ts = tz.localize(datetime.combine(day + timedelta(days=1), time(0))).timestamp()
+                if end_ts <= now_ts:
+                    continue # Their birthday is already over locally
+
+                key = (tz.zone, guild_id, day, (t_hour, t_min))
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    # users: waiting for the next firing; announced: already handled by an earlier one
+                    bucket = self.buckets[key] = {"users": set(), "announced": set(), "fired": False}
+                    bucket["due"] = tz.localize(datetime.combine(day, time(t_hour, t_min))).timestamp()
+                    self._push_event(bucket["due"], "announce", key)
+                elif user_id in bucket["announced"]:
+                    continue
+                elif bucket["fired"]:
+                    # Joined a bucket that already went off; fire again for the newcomer
+                    bucket["fired"] = False
+                    self._push_event(bucket["due"], "announce", key)
+                bucket["users"].add(user_id)
+
+    async def run_due_events(self):
+        now_ts = datetime.now(pytz.UTC).timestamp()
+        while self.schedule_heap and self.schedule_heap[0][0] <= now_ts:
+            due_ts, _, kind, payload = heapq.heappop(self.schedule_heap)
+            if kind == "window":
+                if due_ts != self.next_window_ts:
+                    continue # Superseded by a reschedule() that already moved on to a later window
+                self.next_window_ts = None
+                await self.schedule_window()
+            elif kind == "announce":
+                await self.announce_bucket(payload)
+            elif kind == "remove":
+                await self.remove_birthday_role(*payload)
+
+    async def announce_bucket(self, key):
+        bucket = self.buckets.get(key)
+        if not bucket or bucket["fired"]:
+            return
+        bucket["fired"] = True
+        user_ids, bucket["users"] = bucket["users"], set()
+
+        tz_name, guild_id, day, announce_time = key
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return
+
+        g_conf = await self.config.guild(guild).all()
+        if tuple(g_conf.get("announce_time", [0, 0])) != announce_time:
+            return # Announcement time changed since; the new bucket covers it
+
+        role_id = g_conf.get("birthday_role")
+        role = guild.get_role(role_id) if role_id else None
+        
+        channel_id = g_conf.get("announce_channel")
+        channel = guild.get_channel(channel_id) if channel_id else None
+
+        today_str = day.strftime("%Y-%m-%d")
+        zones = await self.get_user_tzs({user_id: self.users[user_id] for user_id in user_ids if user_id in self.users})
+
+        for user_id in user_ids:
+            member = guild.get_member(user_id)
+            u_conf = self.users.get(user_id)
+            if not member or not u_conf or (u_conf["month"], u_conf["day"]) != (day.month, day.day):
+                continue
+            bucket["announced"].add(user_id)
 
-        for guild_id, g_conf in guilds_config.items():
-            guild = self.bot.get_guild(int(guild_id))
-            if not guild:
+            tz = zones[user_id]
+            if tz.zone != tz_name:
+                # Timezone changed since bucketing; move them to the right bucket
+                await self.schedule_user(user_id)
                 continue
 
-            role_id = g_conf.get("birthday_role")
-            role = guild.get_role(role_id) if role_id else None
-            
-            channel_id = g_conf.get("announce_channel")
-            channel = guild.get_channel(channel_id) if channel_id else None
+            celebrated = self.celebrated.setdefault((user_id, today_str), set())
+            # last_celebrated is per user, so only trust it across restarts; this session tracks guilds
+            if guild_id in celebrated or (u_conf.get("last_celebrated") == today_str and not celebrated):
+                continue
 
-            # Get target time for this guild
-            t_hour, t_min = g_conf.get("announce_time", [0, 0])
+            # Mark as celebrated
+            celebrated.add(guild_id)
+            u_conf["last_celebrated"] = today_str
+            await self.config.user(member).last_celebrated.set(today_str)
+            
+            # Add Role, removed when their local birthday ends
+            if role:
+                try:
+                    await member.add_roles(role, reason="Birthday!")
+                except discord.Forbidden:
+                    pass
+                end_ts = tz.localize(datetime.combine(day + timedelta(days=1), time(0))).timestamp()
+                self._push_event(end_ts, "remove", (guild_id, user_id))
+
+            # Send Message
+            if channel:
+                ordinal_str = ""
+                has_year = bool(u_conf.get("year"))
+                
+                if has_year:
+                    age = day.year - u_conf["year"]
+                    ordinal_str = self.get_ordinal(age)
+                    msg_template = g_conf.get("announce_message_year", "Happy {ordinal} birthday, {mention}! 🎉")
+                else:
+                    msg_template = g_conf.get("announce_message_no_year", "Happy Birthday {mention}! 🎉")
 
-            for user_id, u_conf in all_users.items():
-                member = guild.get_member(int(user_id))
-                if not member:
-                    continue
+                try:
+                    msg = msg_template.replace("{mention}", member.mention)
+                    msg = msg.replace("{ordinal}", ordinal_str)
+                    await channel.send(msg)
+                except discord.Forbidden:
+                    pass
+
+    async def remove_birthday_role(self, guild_id: int, user_id: int):
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return
+        role_id = await self.config.guild(guild).birthday_role()
+        role = guild.get_role(role_id) if role_id else None
+        member = guild.get_member(user_id)
+        if not role or not member or role not in member.roles:
+            return
+
+        u_conf = self.users.get(user_id)
+        if u_conf:
+            tz = await self.get_user_tz(user_id, u_conf)
+            now_in_tz = datetime.now(tz)
+            if (now_in_tz.month, now_in_tz.day) == (u_conf["month"], u_conf["day"]):
+                return # Still (or again) their birthday
 
-                if not u_conf.get("month") or not u_conf.get("day"):
-                    continue
+        try:
+            await member.remove_roles(role, reason="Birthday over")
+        except discord.Forbidden:
+            pass
 
-                # RESOLVE TIMEZONE (External -> Internal -> UTC)
-                tz = await self.get_user_tz(user_id, u_conf)
+    async def sweep_birthday_roles(self):
+        """
+        On startup, clears birthday roles whose birthday ended while we were offline
+        and schedules the removal for those still celebrating.
+        """
+        for guild_id, g_conf in (await self.config.all_guilds()).items():
+            guild = self.bot.get_guild(int(guild_id))
+            role_id = g_conf.get("birthday_role")
+            role = guild.get_role(role_id) if guild and role_id else None
+            if not role:
+                continue
 
+            members = [member for member in role.members if member.id in self.users]
+            zones = await self.get_user_tzs({member.id: self.users[member.id] for member in members})
+            for member in members:
+                u_conf = self.users[member.id]
+                tz = zones[member.id]
                 now_in_tz = datetime.now(tz)
-                today_str = now_in_tz.strftime("%Y-%m-%d")
-                
-                is_day = (now_in_tz.month == u_conf["month"]) and (now_in_tz.day == u_conf["day"])
-                
-                # Check if we have passed the specific announcement time
-                # We use simple comparison: current hour/min >= target hour/min
-                is_time = (now_in_tz.hour > t_hour) or (now_in_tz.hour == t_hour and now_in_tz.minute >= t_min)
-
-                # 1. ANNOUNCEMENTS & ROLE ADDITION
-                if is_day and is_time:
-                    last_celeb = u_conf.get("last_celebrated")
-                    
-                    if last_celeb != today_str:
-                        # Mark as celebrated
-                        await self.config.user(member).last_celebrated.set(today_str)
-                        
-                        # Add Role
-                        if role:
-                            try:
-                                await member.add_roles(role, reason="Birthday!")
-                            except discord.Forbidden:
-                                pass
-
-                        # Send Message
-                        if channel:
-                            ordinal_str = ""
-                            has_year = bool(u_conf.get("year"))
-                            
-                            if has_year:
-                                age = now_in_tz.year - u_conf["year"]
-                                ordinal_str = self.get_ordinal(age)
-                                msg_template = g_conf.get("announce_message_year", "Happy {ordinal} birthday, {mention}! 🎉")
-                            else:
-                                msg_template = g_conf.get("announce_message_no_year", "Happy Birthday {mention}! 🎉")
-
-                            try:
-                                msg = msg_template.replace("{mention}", member.mention)
-                                msg = msg.replace("{ordinal}", ordinal_str)
-                                await channel.send(msg)
-                            except discord.Forbidden:
-                                pass
-
-                # 2. ROLE REMOVAL (24 hours later logic)
-                if role and role in member.roles:
-                    # If it is NOT the birthday day anymore, remove role.
-                    if not is_day:
-                        try:
-                            await member.remove_roles(role, reason="Birthday over")
-                        except discord.Forbidden:
-                            pass
+                if (now_in_tz.month, now_in_tz.day) == (u_conf["month"], u_conf["day"]):
+                    end_ts = tz.localize(datetime.combine(now_in_tz.date() + timedelta(days=1), time(0))).timestamp()
+                    self._push_event(end_ts, "remove", (guild.id, member.id))
+                else:
+                    try:
+                        await member.remove_roles(role, reason="Birthday over")
+                    except discord.Forbidden:
+                        pass
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if member.id in self.users:
+            await self.schedule_user(member.id)
+            self.wakeup.set()
+
+    # --- LOOPS ---
+
+    async def birthday_loop(self):
+        await self.bot.wait_until_ready()
+        started = False
+
+        while True:
+            try:
+                if not started:
+                    # Retried every minute until it succeeds; without the index nothing gets scheduled
+                    try:
+                        await self.build_index()
+                        await self.schedule_window()
+                        await self.sweep_birthday_roles()
+                    except Exception as e:
+                        print(f"Error starting birthday scheduler, retrying in 60s: {e}")
+                        await asyncio.sleep(60)
+                        continue
+                    started = True
+
+                await self.run_due_events()
+
+                # Sleep until the next announcement/removal/window, or until data changes
+                delay = MAX_SCHEDULER_SLEEP
+                if self.schedule_heap:
+                    delay = min(delay, max(self.schedule_heap[0][0] - datetime.now(pytz.UTC).timestamp(), 0))
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            except Exception as e:
+                print(f"Error in birthday loop: {e}")
+                await asyncio.sleep(60)
 
     # --- USER COMMANDS ---
 
@@ -475,6 +706,8 @@ class Birthday(commands.Cog):
         else:
             await self.config.guild(ctx.guild).announce_channel.set(None)
             await ctx.send("Announcements disabled.")
+        # The guild may have just become (or stopped being) configured
+        await self.reschedule()
 
     @bset.command(name="time")
     async def bset_time(self, ctx, hour: int, minute: int = 0):
@@ -486,6 +719,7 @@ class Birthday(commands.Cog):
             return await ctx.send("Invalid time. Hour must be 0-23 and minute 0-59.")
         
         await self.config.guild(ctx.guild).announce_time.set([hour, minute])
+        await self.reschedule()
         await ctx.send(f"I will now greet users at **{hour:02d}:{minute:02d}** (their local time).")
 
     @bset.command(name="messagesimple")
@@ -509,6 +743,7 @@ class Birthday(commands.Cog):
         else:
             await self.config.guild(ctx.guild).birthday_role.set(None)
             await ctx.send("Birthday role disabled.")
+        await self.reschedule()
 
     @bset.command(name="listall")
     async def bset_listall(self, ctx):
@@ -521,6 +756,11 @@ class Birthday(commands.Cog):
         output.append("-" * 40)
         
         found_count = 0
+        listed = {
+            user_id: u_data for user_id, u_data in all_users_data.items()
+            if u_data["month"] and u_data["day"] and ctx.guild.get_member(user_id)
+        }
+        zones = await self.get_user_tzs(listed)
         
         for user_id, u_data in all_users_data.items():
             if not u_data["month"] or not u_data["day"]:
@@ -538,7 +778,7 @@ class Birthday(commands.Cog):
                 date_str += f", {u_data['year']}"
             
             # Show resolved timezone
-            tz_obj = await self.get_user_tz(user_id, u_data)
+            tz_obj = zones[user_id]
             tz_str = str(tz_obj)
 
             line = f"{member.display_name} (ID: {user_id}): {date_str} | TZ: {tz_str}"
@@ -676,4 +916,6 @@ class Birthday(commands.Cog):
             else:
                 errors += 1
 
+        await self.build_index()
+        await self.reschedule()
         await ctx.send(f"Import complete. Processed {total_lines} data lines. Imported: {imported_count}. Skipped/Errors: {errors}.")
\ No newline at end of file
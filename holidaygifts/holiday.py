@@ -108,10 +108,9 @@ class HolidayGifts(commands.Cog):
         tz_cog = self.bot.get_cog("Timezone")
         if tz_cog:
             try:
-                # Assuming standard v3 Timezone cog method
-                tz = await tz_cog.timezone_for_user(user)
+                tz = (await tz_cog.get_user_timezones([user.id])).get(user.id)
                 if tz:
-                    # tz is usually a pytz object or timezone info
+                    # Cached pytz zone object
                     return datetime.datetime.now(tz)
             except AttributeError:
                 pass # Method might differ slightly depending on version
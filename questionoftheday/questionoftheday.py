@@ -1,14 +1,15 @@
 import asyncio
+import hashlib
+import heapq
 import json
 import logging
 import random
 import uuid
-from datetime import datetime, timedelta, timezone, time
+from datetime import date, datetime, timedelta, timezone, time
 from typing import Dict, List, Literal, Optional, Set, Union, Callable, Awaitable
 from pathlib import Path
 
 import discord
-from discord.ext import tasks 
 from redbot.core import commands, Config, app_commands, bank
 from redbot.core.bot import Red
 from redbot.core.data_manager import cog_data_path
@@ -54,6 +55,129 @@ class QuestionData(BaseModel):
 
 log = getLogger("red.qotd")
 
+# --- Question Index ---
+
+def _timestamp(value) -> float:
+    """ISO string / datetime / None -> epoch seconds (None sorts as oldest)."""
+    if not value:
+        return 0.0
+    try:
+        dt = datetime.fromisoformat(value) if isinstance(value, str) else value
+    except ValueError:
+        return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+def _question_hash(text) -> str:
+    """Hash of a question's text, ignoring case and whitespace differences."""
+    normalized = " ".join(str(text).casefold().split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+class QuestionIndex:
+    """
+    In-memory index of the global `questions` dict, grouped by list:
+    - not asked: a list + position map, so a random pick and removal are O(1).
+    - asked: a min-heap of (last_asked, qid), so the oldest asked question is O(log n).
+    Stale heap entries are skipped lazily and compacted when they pile up.
+    Also tracks normalized question-text hashes per list for duplicate detection.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}  # qid -> (list_id, status, last_asked_ts)
+        self._hashes: Dict[str, str] = {}  # qid -> text hash
+        self._hash_counts: Dict[tuple, int] = {}  # (list_id, text hash) -> questions with that text
+        self._not_asked: Dict[str, List[str]] = {}
+        self._not_asked_pos: Dict[str, int] = {}
+        self._asked: Dict[str, List[tuple]] = {}
+        self._totals: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, qid: str) -> bool:
+        return qid in self._entries
+
+    def rebuild(self, questions: Dict[str, dict]):
+        for container in (self._entries, self._hashes, self._hash_counts, self._not_asked, self._not_asked_pos, self._asked, self._totals):
+            container.clear()
+        for qid, qdata in questions.items():
+            self.add(qid, qdata)
+
+    def add(self, qid: str, qdata: dict):
+        """Adds or updates a question (raw dict or serialized QuestionData)."""
+        list_id = qdata.get("list_id")
+        status = qdata.get("status")
+        last_asked = _timestamp(qdata.get("last_asked"))
+        text_hash = _question_hash(qdata.get("question", ""))
+        if self._entries.get(qid) == (list_id, status, last_asked) and self._hashes.get(qid) == text_hash:
+            return
+        self.remove(qid)
+        self._entries[qid] = (list_id, status, last_asked)
+        self._hashes[qid] = text_hash
+        hash_key = (list_id, text_hash)
+        self._hash_counts[hash_key] = self._hash_counts.get(hash_key, 0) + 1
+        self._totals[list_id] = self._totals.get(list_id, 0) + 1
+
+        if status == "not asked":
+            bucket = self._not_asked.setdefault(list_id, [])
+            self._not_asked_pos[qid] = len(bucket)
+            bucket.append(qid)
+        elif status == "asked":
+            heap = self._asked.setdefault(list_id, [])
+            heapq.heappush(heap, (last_asked, qid))
+            # Compact once stale entries outnumber live ones
+            if len(heap) > 64 and len(heap) > 2 * self._totals[list_id]:
+                self._asked[list_id] = [item for item in heap if self._is_live(list_id, item)]
+                heapq.heapify(self._asked[list_id])
+
+    def remove(self, qid: str):
+        entry = self._entries.pop(qid, None)
+        if entry is None:
+            return
+        list_id, status, _ = entry
+        hash_key = (list_id, self._hashes.pop(qid))
+        self._hash_counts[hash_key] -= 1
+        if not self._hash_counts[hash_key]:
+            del self._hash_counts[hash_key]
+        self._totals[list_id] -= 1
+        if not self._totals[list_id]:
+            del self._totals[list_id]
+
+        if status == "not asked":
+            # Swap-remove keeps the bucket dense
+            bucket = self._not_asked[list_id]
+            pos = self._not_asked_pos.pop(qid)
+            last = bucket.pop()
+            if last != qid:
+                bucket[pos] = last
+                self._not_asked_pos[last] = pos
+        # Asked heap entries are dropped lazily in oldest_asked()
+
+    def _is_live(self, list_id: str, item: tuple) -> bool:
+        entry = self._entries.get(item[1])
+        return entry is not None and entry == (list_id, "asked", item[0])
+
+    def random_not_asked(self, list_id: str) -> Optional[str]:
+        bucket = self._not_asked.get(list_id)
+        return random.choice(bucket) if bucket else None
+
+    def oldest_asked(self, list_id: str) -> Optional[str]:
+        heap = self._asked.get(list_id)
+        while heap:
+            if self._is_live(list_id, heap[0]):
+                return heap[0][1]
+            heapq.heappop(heap)
+        return None
+
+    def has_text_hash(self, list_id: str, text_hash: str) -> bool:
+        """True if the list already holds a question with this normalized text."""
+        return (list_id, text_hash) in self._hash_counts
+
+    def counts(self, list_id: str) -> tuple:
+        """Returns (total, not asked) for a list."""
+        return self._totals.get(list_id, 0), len(self._not_asked.get(list_id, ()))
+
 # --- Custom Views ---
 
 class SuggestionModal(discord.ui.Modal, title="Submit a Question of the Day"):
@@ -225,11 +349,25 @@ class QuestionOfTheDay(commands.Cog):
             "approval_reward": 0,
         }
         self.config.register_global(**default_global)
-        self.qotd_poster.start()
+        self.question_index = QuestionIndex()
+        
+        # Scheduler state: validated schedules + min-heap of (next_run_ts, schedule_id)
+        self._schedules: Dict[str, Schedule] = {}
+        self._schedule_heap: List[tuple] = []
+        self._schedule_wakeup = asyncio.Event()
+        self._poster_task: Optional[asyncio.Task] = None
         self.bot.add_view(SuggestionButton(self, [])) 
 
+    async def cog_load(self):
+        self.question_index.rebuild(await self.config.questions())
+        log.debug(f"Question index built with {len(self.question_index)} questions.")
+        for schedule_id, schedule_dict in (await self.config.schedules()).items():
+            self._cache_schedule(schedule_id, schedule_dict)
+        self._poster_task = self.bot.loop.create_task(self.qotd_poster())
+
     def cog_unload(self):
-        self.qotd_poster.cancel()
+        if self._poster_task:
+            self._poster_task.cancel()
 
     async def red_delete_data_for_user(self, *, requester: Literal["discord", "owner", "admin", "user"], user_id: int):
         async with self.config.questions() as questions:
@@ -239,6 +377,7 @@ class QuestionOfTheDay(commands.Cog):
             ]
             for key in keys_to_delete:
                 del questions[key]
+                self.question_index.remove(key)
 
     async def _attempt_deposit(self, member: discord.Member, amount: int) -> bool:
         if amount <= 0: return False
@@ -260,47 +399,118 @@ class QuestionOfTheDay(commands.Cog):
                 l_dict['priority_rules'] = new_rules
         return l_dict
 
-    @tasks.loop(minutes=1)
-    async def qotd_poster(self):
+    # --- Scheduler ---
+
+    MAX_SCHEDULER_SLEEP = 3600 # Re-check at least hourly to absorb clock drift
+    SCHEDULE_RETRY_DELAY = 60 # Seconds before retrying a schedule whose next run couldn't be advanced
+
+    def _parse_schedule(self, schedule_id: str, schedule_dict: dict) -> Optional[Schedule]:
+        """Validates a stored schedule dict, fixing up ISO dates. Returns None if it's corrupt."""
+        schedule_dict = dict(schedule_dict)
+        try:
+            # 1. Date Fix
+            next_run_time_data = schedule_dict.get('next_run_time')
+            if isinstance(next_run_time_data, str):
+                dt_obj = datetime.fromisoformat(next_run_time_data)
+                if dt_obj.tzinfo is None:
+                    dt_obj = dt_obj.replace(tzinfo=timezone.utc)
+                schedule_dict['next_run_time'] = dt_obj
+            
+            # 1b. Start Date Fix
+            start_date_data = schedule_dict.get('start_date')
+            if isinstance(start_date_data, str):
+                dt_obj = datetime.fromisoformat(start_date_data)
+                if dt_obj.tzinfo is None:
+                    dt_obj = dt_obj.replace(tzinfo=timezone.utc)
+                schedule_dict['start_date'] = dt_obj
+
+            # 2. Cleanup
+            schedule_dict.pop('list_id', None) # Legacy cleanup
+            
+            # 3. Validation
+            schedule = Schedule.model_validate(schedule_dict)
+        except (ValidationError, ValueError) as e:
+            log.error(f"Failed to validate schedule {schedule_id}: {e}")
+            return None
+
+        if schedule.next_run_time.tzinfo is None:
+            schedule.next_run_time = schedule.next_run_time.replace(tzinfo=timezone.utc)
+        return schedule
+
+    def _cache_schedule(self, schedule_id: str, schedule_dict: Optional[dict]):
+        """Updates (or with None, drops) the cached schedule and re-arms the poster."""
+        schedule = self._parse_schedule(schedule_id, schedule_dict) if schedule_dict is not None else None
+        if schedule is None:
+            self._schedules.pop(schedule_id, None)
+        else:
+            self._schedules[schedule_id] = schedule
+            heapq.heappush(self._schedule_heap, (schedule.next_run_time.timestamp(), schedule_id))
+        self._schedule_wakeup.set()
+
+    def _pop_due_schedules(self, now_ts: float) -> List[str]:
+        """Pops every schedule due at now_ts. Heap entries that no longer match the cache are discarded."""
+        due = []
+        heap = self._schedule_heap
+        while heap and heap[0][0] <= now_ts:
+            run_ts, schedule_id = heapq.heappop(heap)
+            schedule = self._schedules.get(schedule_id)
+            if schedule and schedule.next_run_time.timestamp() == run_ts and schedule_id not in due:
+                due.append(schedule_id)
+        return due
+
+    def _requeue_schedule(self, schedule_id: str, schedule: Schedule):
+        """
+        Puts a popped schedule back on the heap at its current next_run_time so it isn't lost.
+        A run time that is already due is pushed back by SCHEDULE_RETRY_DELAY to avoid a tight retry loop.
+        """
+        if self._schedules.get(schedule_id) is not schedule:
+            return # Removed or replaced meanwhile; _cache_schedule already queued the new version
         now_utc = datetime.now(timezone.utc)
-        schedules_data = await self.config.schedules()
-        
-        for schedule_id, schedule_dict in schedules_data.items():
-            schedule = None
+        if schedule.next_run_time <= now_utc:
+            schedule.next_run_time = now_utc + timedelta(seconds=self.SCHEDULE_RETRY_DELAY)
+        heapq.heappush(self._schedule_heap, (schedule.next_run_time.timestamp(), schedule_id))
+
+    def _seconds_until_next_run(self, now_ts: float) -> float:
+        heap = self._schedule_heap
+        while heap:
+            run_ts, schedule_id = heap[0]
+            schedule = self._schedules.get(schedule_id)
+            if schedule and schedule.next_run_time.timestamp() == run_ts:
+                return min(max(run_ts - now_ts, 0), self.MAX_SCHEDULER_SLEEP)
+            heapq.heappop(heap)
+        return self.MAX_SCHEDULER_SLEEP
+
+    async def qotd_poster(self):
+        """Sleeps until the earliest schedule is due (or the schedules change), then posts."""
+        await self.bot.wait_until_red_ready()
+        while True:
             try:
-                # 1. Date Fix
-                next_run_time_data = schedule_dict.get('next_run_time')
-                if isinstance(next_run_time_data, str):
-                    dt_obj = datetime.fromisoformat(next_run_time_data)
-                    if dt_obj.tzinfo is None:
-                        dt_obj = dt_obj.replace(tzinfo=timezone.utc)
-                    schedule_dict['next_run_time'] = dt_obj
+                self._schedule_wakeup.clear()
+                now_utc = datetime.now(timezone.utc)
                 
-                # 1b. Start Date Fix
-                start_date_data = schedule_dict.get('start_date')
-                if isinstance(start_date_data, str):
-                    dt_obj = datetime.fromisoformat(start_date_data)
-                    if dt_obj.tzinfo is None:
-                        dt_obj = dt_obj.replace(tzinfo=timezone.utc)
-                    schedule_dict['start_date'] = dt_obj
-
-                # 2. Cleanup
-                schedule_dict.pop('list_id', None) # Legacy cleanup
-                
-                # 3. Validation
-                schedule = Schedule.model_validate(schedule_dict)
-
-            except (ValidationError, ValueError) as e:
-                log.error(f"Failed to validate schedule {schedule_id}: {e}")
-                continue
+                for schedule_id in self._pop_due_schedules(now_utc.timestamp()):
+                    schedule = self._schedules[schedule_id]
+                    log.debug(f"Schedule '{schedule_id}' is triggered to run.")
+                    try:
+                        await self._post_scheduled_question(schedule_id, schedule)
+                    except Exception as e:
+                        log.exception(f"Critical error during _post_scheduled_question for {schedule_id}: {e}")
+                        try:
+                            await self._update_schedule_next_run(schedule_id, schedule, now_utc)
+                        except Exception as e:
+                            log.exception(f"Failed to advance schedule {schedule_id} after a posting error: {e}")
+                            self._requeue_schedule(schedule_id, schedule)
 
-            if schedule and now_utc >= schedule.next_run_time:
-                log.debug(f"Schedule '{schedule_id}' is triggered to run.")
+                delay = self._seconds_until_next_run(datetime.now(timezone.utc).timestamp())
                 try:
-                    await self._post_scheduled_question(schedule_id, schedule)
-                except Exception as e:
-                    log.exception(f"Critical error during _post_scheduled_question for {schedule_id}: {e}")
-                    await self._update_schedule_next_run(schedule_id, schedule, now_utc)
+                    await asyncio.wait_for(self._schedule_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.exception(f"Error in QOTD scheduler: {e}")
+                await asyncio.sleep(60)
 
     def _is_date_in_range(self, check_date: datetime, start_md: str, end_md: str) -> bool:
         """Checks if a date falls within MM-DD range, handling year wrap."""
@@ -313,20 +523,17 @@ class QuestionOfTheDay(commands.Cog):
         except ValueError:
             return False
 
-    async def _resolve_list_priority(self, list_obj: QuestionList, now_utc: datetime) -> int:
-        """
-        Determines the priority of a list for the given date.
-        Returns:
-            int: The priority number (1 is highest).
-            0: Explicitly excluded.
-            999: No specific rule found (Default/Low priority).
-        """
+    def _priority_for_md(self, rules: List[ListPriorityRule], current_md: str) -> int:
+        """Resolves a list's priority for a MM-DD string (see _resolve_list_priority)."""
         best_priority = 999 
         
-        has_match = False
-        for rule in list_obj.priority_rules:
-            if self._is_date_in_range(now_utc, rule.start_md, rule.end_md):
-                has_match = True
+        for rule in rules:
+            if rule.start_md <= rule.end_md:
+                matched = rule.start_md <= current_md <= rule.end_md
+            else:
+                # Handles wrap around (e.g. 12-25 to 01-05)
+                matched = current_md >= rule.start_md or current_md <= rule.end_md
+            if matched:
                 if rule.priority == 0:
                     return 0 # Explicit exclusion overrides everything
                 if rule.priority < best_priority:
@@ -335,6 +542,79 @@ class QuestionOfTheDay(commands.Cog):
         # If no date rules matched, it defaults to 999 (available but low priority)
         return best_priority
 
+    async def _resolve_list_priority(self, list_obj: QuestionList, now_utc: datetime) -> int:
+        """
+        Determines the priority of a list for the given date.
+        Returns:
+            int: The priority number (1 is highest).
+            0: Explicitly excluded.
+            999: No specific rule found (Default/Low priority).
+        """
+        return self._priority_for_md(list_obj.priority_rules, now_utc.strftime("%m-%d"))
+
+    # --- Upcoming Projection ---
+
+    @staticmethod
+    def _day_of_year_index(dt: datetime) -> int:
+        """0-365 index of a date's MM-DD within a leap year, so Feb 29 has its own slot."""
+        return date(2024, dt.month, dt.day).timetuple().tm_yday - 1
+
+    def _compile_priority_table(self, list_obj: QuestionList) -> List[int]:
+        """Precomputes a list's priority for every day of the (leap) year."""
+        if not list_obj.priority_rules:
+            return [999] * 366
+        day = date(2024, 1, 1)
+        return [
+            self._priority_for_md(list_obj.priority_rules, (day + timedelta(days=i)).strftime("%m-%d"))
+            for i in range(366)
+        ]
+
+    def _compile_schedule_table(self, schedule: Schedule, lists: Dict[str, QuestionList]) -> List[Optional[tuple]]:
+        """
+        For each day of the year, the (priority, list name) that would win for this schedule,
+        or None if every linked list is excluded. Ties go to the first linked list.
+        """
+        tables = [
+            (self._compile_priority_table(lists[l_id]), lists[l_id].name)
+            for l_id in schedule.lists if l_id in lists
+        ]
+        winners: List[Optional[tuple]] = []
+        for day in range(366):
+            best = None
+            for table, name in tables:
+                prio = table[day]
+                if prio > 0 and (best is None or prio < best[0]):
+                    best = (prio, name)
+            winners.append(best)
+        return winners
+
+    def _project_schedule(self, schedule: Schedule, winners: List[Optional[tuple]], now_utc: datetime, end_time: datetime):
+        """
+        Yields (run_time, priority, list_name) for each post in (now_utc, end_time].
+        Runs are next_run_time + k * interval; days where every list is excluded are jumped over.
+        """
+        delta = self._parse_frequency(schedule.frequency)
+        if delta is None or delta.total_seconds() <= 0:
+            return
+
+        first = schedule.next_run_time
+        k = 0
+        if first <= now_utc:
+            k = int((now_utc - first) // delta) + 1
+
+        while True:
+            run_time = first + delta * k
+            if run_time > end_time:
+                return
+            winner = winners[self._day_of_year_index(run_time)]
+            if winner is not None:
+                yield run_time, winner[0], winner[1]
+                k += 1
+            else:
+                # Skip straight to the first run on the next day
+                next_day = datetime.combine(run_time.date() + timedelta(days=1), time(0), tzinfo=run_time.tzinfo)
+                k += max(1, -(-(next_day - run_time) // delta))
+
     async def _post_scheduled_question(self, schedule_id: str, schedule: Schedule):
         now_utc = datetime.now(timezone.utc)
         
@@ -345,7 +625,6 @@ class QuestionOfTheDay(commands.Cog):
             return
 
         lists_data = await self.config.lists()
-        questions_data = await self.config.questions()
 
         # 1. Filter Lists: Only look at lists LINKED to this schedule
         candidates = []
@@ -387,54 +666,37 @@ class QuestionOfTheDay(commands.Cog):
         for prio, target_list in candidates:
             log.debug(f"Schedule '{schedule_id}': Checking list '{target_list.name}' (Priority {prio})")
             
-            eligible_q_data = {
-                qid: qdata
-                for qid, qdata in questions_data.items()
-                if qdata.get("list_id") == target_list.id and qdata.get("status") in ("not asked", "asked")
-            }
-            
-            if not eligible_q_data:
-                log.debug(f"Schedule '{schedule_id}': List '{target_list.name}' has no eligible questions. Skipping.")
-                continue 
+            # Unasked questions first (random); once exhausted, recycle the oldest asked question
+            # to maximize time between repeats. Corrupt entries are dropped from the index and skipped.
+            while selected_q is None:
+                qid = self.question_index.random_not_asked(target_list.id)
+                is_new = qid is not None
+                if not is_new:
+                    qid = self.question_index.oldest_asked(target_list.id)
+                if qid is None:
+                    break
 
-            eligible_q_objs = []
-            for qid, qdata in eligible_q_data.items():
                 try:
-                    qdata_copy = qdata.copy()
-                    qdata_copy['added_on'] = datetime.fromisoformat(qdata['added_on'])
-                    qdata_copy['last_asked'] = datetime.fromisoformat(qdata['last_asked']) if qdata['last_asked'] else None
-                    qdata_copy['id'] = qid
-                    eligible_q_objs.append(QuestionData.model_validate(qdata_copy))
-                except (ValidationError, ValueError):
+                    qdata = await self.config.questions.get_raw(qid)
+                    qdata = dict(qdata, id=qid)
+                    qdata['added_on'] = datetime.fromisoformat(qdata['added_on'])
+                    qdata['last_asked'] = datetime.fromisoformat(qdata['last_asked']) if qdata.get('last_asked') else None
+                    selected_q = QuestionData.model_validate(qdata)
+                except (KeyError, ValidationError, ValueError):
+                    self.question_index.remove(qid)
                     continue
 
-            if not eligible_q_objs:
-                continue
+                selected_qid = qid
+                if is_new:
+                    not_asked_remaining = self.question_index.counts(target_list.id)[1] - 1
+                    log.debug(f"Schedule '{schedule_id}': Selected NEW unasked question '{selected_qid}' from '{target_list.name}'. Remaining unasked: {not_asked_remaining}")
+                else:
+                    not_asked_remaining = 0
+                    log.debug(f"Schedule '{schedule_id}': Fallback selected question '{selected_qid}' last asked on {selected_q.last_asked}.")
 
-            not_asked = [q for q in eligible_q_objs if q.status == "not asked"]
-            not_asked_remaining = len(not_asked)
-            
-            if not_asked:
-                selected_q = random.choice(not_asked)
-                selected_qid = selected_q.id
-                not_asked_remaining -= 1
-                log.debug(f"Schedule '{schedule_id}': Selected NEW unasked question '{selected_qid}' from '{target_list.name}'. Remaining unasked: {not_asked_remaining}")
-            else:
-                log.debug(f"Schedule '{schedule_id}': No new questions in '{target_list.name}'. Falling back to absolutely oldest asked question.")
-                # Recycle the absolute oldest asked question to maximize time between repeats
-                def sort_key(q):
-                    if q.last_asked is None: 
-                        return 0 # Oldest possible timestamp
-                    if q.last_asked.tzinfo is None:
-                        q.last_asked = q.last_asked.replace(tzinfo=timezone.utc)
-                    return q.last_asked.timestamp()
-                
-                eligible_q_objs.sort(key=sort_key, reverse=False)
-                
-                # Pick absolute oldest
-                selected_q = eligible_q_objs[0]
-                selected_qid = selected_q.id
-                log.debug(f"Schedule '{schedule_id}': Fallback selected question '{selected_qid}' last asked on {selected_q.last_asked}.")
+            if selected_q is None:
+                log.debug(f"Schedule '{schedule_id}': List '{target_list.name}' has no eligible questions. Skipping.")
+                continue
 
             if selected_q:
                 selected_list_name = target_list.name
@@ -492,21 +754,28 @@ class QuestionOfTheDay(commands.Cog):
 
         await self._update_schedule_next_run(schedule_id, schedule, now_utc)
 
-    def _calculate_next_run_time(self, schedule: Schedule, last_run: datetime) -> datetime:
-        now_utc = datetime.now(timezone.utc)
-        
-        # Parse Frequency Delta
+    @staticmethod
+    def _parse_frequency(frequency: str) -> Optional[timedelta]:
+        """Parses e.g. '1 day' / '3 hours' into a timedelta. Returns None if invalid."""
         try:
-            time_unit = schedule.frequency.split()
+            time_unit = frequency.split()
             if len(time_unit) != 2: raise ValueError
             amount = int(time_unit[0])
             unit = time_unit[1].lower().rstrip('s')
-            if unit == 'minute': delta = timedelta(minutes=amount)
-            elif unit == 'hour': delta = timedelta(hours=amount)
-            elif unit == 'day': delta = timedelta(days=amount)
-            elif unit == 'week': delta = timedelta(weeks=amount)
+            if unit == 'minute': return timedelta(minutes=amount)
+            elif unit == 'hour': return timedelta(hours=amount)
+            elif unit == 'day': return timedelta(days=amount)
+            elif unit == 'week': return timedelta(weeks=amount)
             else: raise ValueError
-        except (ValueError, IndexError, TypeError):
+        except (ValueError, IndexError, TypeError, AttributeError):
+            return None
+
+    def _calculate_next_run_time(self, schedule: Schedule, last_run: datetime) -> datetime:
+        now_utc = datetime.now(timezone.utc)
+        
+        # Parse Frequency Delta
+        delta = self._parse_frequency(schedule.frequency)
+        if delta is None:
             # Fallback for bad frequency
             return now_utc + timedelta(days=3650) 
             
@@ -553,13 +822,18 @@ class QuestionOfTheDay(commands.Cog):
         
         serialized_schedule = json.loads(schedule.model_dump_json())
         async with self.config.schedules() as schedules:
+            # The schedule may have been removed while it was posting
+            if schedule_id not in schedules:
+                return
             schedules[schedule_id] = serialized_schedule
+        self._cache_schedule(schedule_id, serialized_schedule)
 
     async def add_question_to_data(self, question: QuestionData):
         question_id = question.id 
         serialized_q = json.loads(question.model_dump_json())
         async with self.config.questions() as questions:
             questions[question_id] = serialized_q
+        self.question_index.add(question_id, serialized_q)
         if question.list_id == "suggestions":
             await self._notify_new_suggestion(question_id, question)
 
@@ -567,11 +841,13 @@ class QuestionOfTheDay(commands.Cog):
         serialized_q = json.loads(question.model_dump_json())
         async with self.config.questions() as questions:
             questions[qid] = serialized_q
+        self.question_index.add(qid, serialized_q)
 
     async def delete_question_by_id(self, qid: str):
         async with self.config.questions() as questions:
             if qid in questions:
                 del questions[qid]
+        self.question_index.remove(qid)
         
     async def _notify_new_suggestion(self, qid: str, question: QuestionData):
         approval_channel_id = await self.config.approval_channel()
@@ -644,7 +920,6 @@ class QuestionOfTheDay(commands.Cog):
 
         # 2. Lists Code-Block Table using Red's formatting tools
         lists_data = await self.config.lists()
-        all_questions = await self.config.questions()
         
         if not lists_data:
             list_text = "No lists defined."
@@ -654,9 +929,7 @@ class QuestionOfTheDay(commands.Cog):
             list_lines.append("-" * 47)
             for lid, ldata in lists_data.items():
                 ldata = self._migrate_list_dict(ldata) 
-                list_qs = [q for q in all_questions.values() if q.get('list_id') == lid]
-                count = len(list_qs)
-                new_count = sum(1 for q in list_qs if q.get('status') == 'not asked')
+                count, new_count = self.question_index.counts(lid)
                 list_lines.append(f"{lid[:12]:<12} | {ldata['name'][:18]:<18} | {count:<4} | {new_count:<4}")
             
             list_text = box("\n".join(list_lines)[:1000], lang="text")
@@ -975,6 +1248,7 @@ class QuestionOfTheDay(commands.Cog):
             for qid in keys_to_move:
                 questions[qid]['list_id'] = "unassigned"
                 questions[qid]['status'] = "not asked" 
+                self.question_index.add(qid, questions[qid])
                 questions_moved += 1
 
         async with self.config.lists() as lists:
@@ -985,6 +1259,7 @@ class QuestionOfTheDay(commands.Cog):
              for s_id, s_data in schedules.items():
                  if 'lists' in s_data and list_id in s_data['lists']:
                      s_data['lists'].remove(list_id)
+                     self._cache_schedule(s_id, s_data)
 
         await ctx.send(success(f"List **{list_name}** removed. **{questions_moved}** questions moved to **Unassigned**."))
 
@@ -992,7 +1267,6 @@ class QuestionOfTheDay(commands.Cog):
     async def qotd_list_view(self, ctx: commands.Context):
         """Displays all available question lists."""
         lists_data = await self.config.lists()
-        all_questions = await self.config.questions()
         
         if not lists_data:
             return await ctx.send(info("No lists configured."))
@@ -1003,8 +1277,7 @@ class QuestionOfTheDay(commands.Cog):
 
         for lid, ldata in lists_data.items():
             ldata = self._migrate_list_dict(ldata)
-            count = sum(1 for q in all_questions.values() if q.get('list_id') == lid)
-            new_count = sum(1 for q in all_questions.values() if q.get('list_id') == lid and q.get('status') == 'not asked')
+            count, new_count = self.question_index.counts(lid)
             
             name_str = ldata['name'][:25]
             id_str = lid[:15]
@@ -1048,6 +1321,7 @@ class QuestionOfTheDay(commands.Cog):
             for qid in keys:
                 questions[qid]['list_id'] = "unassigned"
                 questions[qid]['status'] = "not asked"
+                self.question_index.add(qid, questions[qid])
                 questions_moved += 1
         await ctx.send(success(f"Moved **{questions_moved}** questions to Unassigned."))
 
@@ -1200,6 +1474,7 @@ class QuestionOfTheDay(commands.Cog):
         serialized_schedule = json.loads(new_schedule.model_dump_json())
         async with self.config.schedules() as schedules:
             schedules[schedule_id] = serialized_schedule
+        self._cache_schedule(schedule_id, serialized_schedule)
         
         msg = f"Added new schedule **{name}** in {channel.mention}.\nNext run: {discord.utils.format_dt(initial_next_run, 'f')} ({discord.utils.format_dt(initial_next_run, 'R')})."
         if anchor_dt:
@@ -1214,6 +1489,7 @@ class QuestionOfTheDay(commands.Cog):
         if schedule_id not in schedules_data: return await ctx.send(warning(f"Schedule ID `{schedule_id}` not found."))
         async with self.config.schedules() as schedules:
             del schedules[schedule_id]
+        self._cache_schedule(schedule_id, None)
         await ctx.send(f"Successfully removed schedule **`{schedule_id}`**.")
 
     @qotd_schedule_management.command(name="link")
@@ -1242,6 +1518,7 @@ class QuestionOfTheDay(commands.Cog):
                 
             schedule_dict['lists'].append(list_id)
             schedules[schedule_id] = schedule_dict
+        self._cache_schedule(schedule_id, schedule_dict)
             
         await ctx.send(success(f"Linked list **{lists_data[list_id]['name']}** to schedule **{schedule_id}**."))
 
@@ -1263,6 +1540,7 @@ class QuestionOfTheDay(commands.Cog):
                 
             schedule_dict['lists'].remove(list_id)
             schedules[schedule_id] = schedule_dict
+        self._cache_schedule(schedule_id, schedule_dict)
             
         await ctx.send(success(f"Unlinked list `{list_id}` from schedule **{schedule_id}**."))
 
@@ -1273,24 +1551,8 @@ class QuestionOfTheDay(commands.Cog):
         if schedule_id not in schedules_data:
             return await ctx.send(warning(f"Schedule `{schedule_id}` not found."))
 
-        schedule_dict = schedules_data[schedule_id]
-        
-        try:
-            if isinstance(schedule_dict.get('next_run_time'), str):
-                schedule_dict['next_run_time'] = datetime.fromisoformat(schedule_dict['next_run_time'])
-            if schedule_dict['next_run_time'].tzinfo is None:
-                schedule_dict['next_run_time'] = schedule_dict['next_run_time'].replace(tzinfo=timezone.utc)
-                
-            start_date_data = schedule_dict.get('start_date')
-            if isinstance(start_date_data, str):
-                dt_obj = datetime.fromisoformat(start_date_data)
-                if dt_obj.tzinfo is None:
-                    dt_obj = dt_obj.replace(tzinfo=timezone.utc)
-                schedule_dict['start_date'] = dt_obj
-                
-            schedule = Schedule.model_validate(schedule_dict)
-        except (ValidationError, ValueError) as e:
-            log.error(f"Failed to validate schedule {schedule_id}: {e}")
+        schedule = self._schedules.get(schedule_id)
+        if schedule is None:
             return await ctx.send(error("Schedule data is corrupted. Check logs."))
 
         await ctx.send(info(f"Forcing schedule `{schedule_id}` to run now..."))
@@ -1313,184 +1575,211 @@ class QuestionOfTheDay(commands.Cog):
         await self.qotd_set_view(ctx)
 
     @qotd_schedule_management.command(name="upcoming")
-    async def qotd_schedule_upcoming(self, ctx: commands.Context):
-        """Shows the projected schedule for the next 7 days."""
-        schedules_data = await self.config.schedules()
+    async def qotd_schedule_upcoming(self, ctx: commands.Context, days: int = 7):
+        """
+        Shows the projected schedule for the next few days (default 7, max 366).
+        """
+        if not 1 <= days <= 366:
+            return await ctx.send(warning("Days must be between 1 and 366."))
+
         lists_data = await self.config.lists()
         
-        if not schedules_data:
+        if not self._schedules:
             return await ctx.send("No schedules configured.")
 
-        events = []
-        now_utc = datetime.now(timezone.utc)
-        end_time = now_utc + timedelta(days=7)
-        
-        for schedule_id, schedule_dict in schedules_data.items():
+        lists: Dict[str, QuestionList] = {}
+        for l_id, l_data in lists_data.items():
             try:
-                if isinstance(schedule_dict.get('next_run_time'), str):
-                    schedule_dict['next_run_time'] = datetime.fromisoformat(schedule_dict['next_run_time'])
-                
-                if schedule_dict['next_run_time'].tzinfo is None:
-                    schedule_dict['next_run_time'] = schedule_dict['next_run_time'].replace(tzinfo=timezone.utc)
-
-                # Validation
-                schedule = Schedule.model_validate(schedule_dict)
-
-            except (ValidationError, ValueError):
+                lists[l_id] = QuestionList.model_validate(self._migrate_list_dict(l_data))
+            except ValidationError:
                 continue
-                
-            if not schedule.lists: continue
 
-            sim_time = schedule.next_run_time
-            safety_count = 0 
-            
-            while sim_time <= end_time and safety_count < 1000:
-                safety_count += 1
-                
-                if sim_time > now_utc:
-                    # Logic to find which list would win
-                    best_list = "None"
-                    best_prio = 999
-                    
-                    # Simulation Logic: Check only linked lists
-                    linked_lists = schedule.lists
-                    
-                    for l_id in linked_lists:
-                        if l_id not in lists_data: continue
-                        
-                        try:
-                            l_data = self._migrate_list_dict(lists_data[l_id])
-                            l_obj = QuestionList.model_validate(l_data)
-                            
-                            has_match = False
-                            prio = 999
-                            for rule in l_obj.priority_rules:
-                                current_md = sim_time.strftime("%m-%d")
-                                if rule.start_md <= rule.end_md:
-                                    if rule.start_md <= current_md <= rule.end_md: has_match = True
-                                else:
-                                    if current_md >= rule.start_md or current_md <= rule.end_md: has_match = True
-                                
-                                if has_match:
-                                    if rule.priority == 0: prio = 0
-                                    elif rule.priority < prio: prio = rule.priority
-                                    break 
-                            
-                            if prio > 0:
-                                if prio < best_prio:
-                                    best_prio = prio
-                                    best_list = l_obj.name
-                                elif prio == best_prio and best_list == "None":
-                                    best_list = l_obj.name
-                        except: continue
-
-                    if best_list != "None":
-                        channel = self.bot.get_channel(schedule.channel_id)
-                        channel_name = channel.mention if channel else f"<#{schedule.channel_id}>"
-                        
-                        events.append({
-                            "time": sim_time,
-                            "list": f"{best_list} (Prio {best_prio})",
-                            "channel": channel_name,
-                            "schedule_id": schedule_id
-                        })
-                
-                next_sim = self._calculate_next_run_time(schedule, sim_time)
-                if next_sim <= sim_time:
-                    break
-                sim_time = next_sim
+        now_utc = datetime.now(timezone.utc)
+        end_time = now_utc + timedelta(days=days)
 
-        if not events:
-            return await ctx.send("No posts scheduled for the next 7 days.")
+        # Each projection yields in time order, so merging them gives a sorted stream we can stop early
+        projections = []
+        for schedule_id, schedule in self._schedules.items():
+            if not schedule.lists: continue
+            winners = self._compile_schedule_table(schedule, lists)
+            channel = self.bot.get_channel(schedule.channel_id)
+            channel_name = channel.mention if channel else f"<#{schedule.channel_id}>"
+            projections.append(
+                ((run_time, prio, list_name, channel_name) for run_time, prio, list_name in self._project_schedule(schedule, winners, now_utc, end_time))
+            )
 
-        events.sort(key=lambda x: x['time'])
-        
-        embed = discord.Embed(title="📅 Upcoming QOTD Posts (Next 7 Days)", color=discord.Color.blue())
+        embed = discord.Embed(title=f"📅 Upcoming QOTD Posts (Next {days} Days)", color=discord.Color.blue())
         
         description = ""
-        for event in events:
-            ts = discord.utils.format_dt(event['time'], "f")
-            rel = discord.utils.format_dt(event['time'], "R")
-            line = f"• {ts} ({rel})\n  **{event['list']}** in {event['channel']}\n"
+        for run_time, prio, list_name, channel_name in heapq.merge(*projections, key=lambda event: event[0]):
+            ts = discord.utils.format_dt(run_time, "f")
+            rel = discord.utils.format_dt(run_time, "R")
+            line = f"• {ts} ({rel})\n  **{list_name} (Prio {prio})** in {channel_name}\n"
             
             if len(description) + len(line) > 4000:
                 description += "\n...and more."
                 break
             description += line
+
+        if not description:
+            return await ctx.send(f"No posts scheduled for the next {days} days.")
             
         embed.description = description
         await ctx.send(embed=embed)
 
+    # --- Import / Export ---
+
+    IMPORT_BATCH_SIZE = 500 # Questions per Config write
+    EXPORT_YIELD_EVERY = 1000 # Questions serialized between event loop yields
+    PROGRESS_INTERVAL = 5 # Seconds between progress message edits
+    EXPORT_HEADER_KEYS = ["2s5qal", "e8auv2"]
+
+    @staticmethod
+    def _iter_jsonl(path: Path):
+        """Yields one parsed object per non-blank line (None for lines that aren't valid JSON)."""
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    yield None
+
+    def _build_import_question(self, item, list_id: str, author_id: int) -> Optional[QuestionData]:
+        """Turns one imported object into a QuestionData, or None if it holds no question text."""
+        if not isinstance(item, dict):
+            return None
+        q_text = item.get("question")
+        if not q_text:
+            for k, v in item.items():
+                if k not in self.EXPORT_HEADER_KEYS and isinstance(v, str):
+                    q_text = v
+                    break
+        if not q_text:
+            return None
+
+        final_id = item.get("id") or str(uuid.uuid4())
+        if final_id in self.question_index: final_id = str(uuid.uuid4())
+
+        suggested_by = item.get("suggested_by_id")
+        if not isinstance(suggested_by, int): suggested_by = author_id
+        
+        added_on = datetime.now(timezone.utc)
+        if isinstance(item.get("added_on"), str):
+            try: added_on = datetime.fromisoformat(item.get("added_on"))
+            except ValueError: pass
+        
+        return QuestionData(id=final_id, question=q_text, suggested_by=suggested_by, list_id=list_id, status="not asked", added_on=added_on)
+
+    async def _write_question_batch(self, batch: Dict[str, dict]):
+        async with self.config.questions() as questions:
+            questions.update(batch)
+        for qid, qdata in batch.items():
+            self.question_index.add(qid, qdata)
+
     @qotd.command(name="import")
     async def qotd_import(self, ctx: commands.Context, list_id: str):
-        """Imports questions from JSON."""
-        if not ctx.message.attachments: return await ctx.send(warning("Attach a JSON file."))
+        """
+        Imports questions from a JSON or JSON-lines attachment.
+
+        `.json` files hold a list of question objects; `.jsonl` files hold one object per line.
+        Questions whose ID or text (ignoring case and spacing) already exist are skipped as duplicates.
+        """
+        if not ctx.message.attachments: return await ctx.send(warning("Attach a JSON or JSONL file."))
         lists_data = await self.config.lists()
         if list_id not in lists_data: return await ctx.send(warning("List ID not found."))
         file = ctx.message.attachments[0]
-        if not file.filename.endswith('.json'): return await ctx.send(warning("Must be a JSON file."))
-        try:
-            file_data = await file.read()
-            questions_list = json.loads(file_data.decode('utf-8'))
-        except Exception as e: return await ctx.send(warning(f"Error parsing file: {e}"))
-        
-        if not isinstance(questions_list, list): return await ctx.send(warning("JSON must be a list."))
+        is_jsonl = file.filename.endswith((".jsonl", ".ndjson"))
+        if not is_jsonl and not file.filename.endswith('.json'): return await ctx.send(warning("Must be a JSON or JSONL file."))
 
-        imported = 0
-        skipped = 0
-        duplicates = 0
-        IGNORED = ["2s5qal", "e8auv2"]
-        
-        async with self.config.questions() as global_questions:
-            for item in questions_list:
-                if not isinstance(item, dict): 
-                    skipped += 1
-                    continue
-                imported_id = item.get("id")
-                if imported_id and imported_id in global_questions:
+        temp_dir = cog_data_path(self) / "imports"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        path = temp_dir / f"import_{ctx.message.id}{Path(file.filename).suffix}"
+
+        try:
+            await file.save(path)
+            if is_jsonl:
+                items = self._iter_jsonl(path)
+            else:
+                try:
+                    with path.open("r", encoding="utf-8") as f:
+                        items = json.load(f)
+                except Exception as e: return await ctx.send(warning(f"Error parsing file: {e}"))
+                if not isinstance(items, list): return await ctx.send(warning("JSON must be a list."))
+
+            imported = 0
+            skipped = 0
+            duplicates = 0
+            processed = 0
+            batch: Dict[str, dict] = {}
+            batch_hashes: Set[str] = set()
+            progress_msg = await ctx.send(info("Importing questions..."))
+            last_progress = self.bot.loop.time()
+
+            for item in items:
+                processed += 1
+                if isinstance(item, dict) and item.get("id") and (item["id"] in self.question_index or item["id"] in batch):
                     duplicates += 1
                     continue
-                
-                q_text = item.get("question")
-                if not q_text:
-                    for k,v in item.items():
-                        if k not in IGNORED and isinstance(v, str):
-                            q_text = v
-                            break
-                if not q_text:
+
+                new_q = self._build_import_question(item, list_id, ctx.author.id)
+                if new_q is None:
                     skipped += 1
                     continue
 
-                final_id = imported_id if imported_id else str(uuid.uuid4())
-                if final_id in global_questions: final_id = str(uuid.uuid4())
+                text_hash = _question_hash(new_q.question)
+                if text_hash in batch_hashes or self.question_index.has_text_hash(list_id, text_hash):
+                    duplicates += 1
+                    continue
 
-                suggested_by = item.get("suggested_by_id")
-                if not isinstance(suggested_by, int): suggested_by = ctx.author.id
-                
-                added_on = datetime.now(timezone.utc)
-                if isinstance(item.get("added_on"), str):
-                    try: added_on = datetime.fromisoformat(item.get("added_on"))
-                    except ValueError: pass
-                
-                new_q = QuestionData(id=final_id, question=q_text, suggested_by=suggested_by, list_id=list_id, status="not asked", added_on=added_on)
-                global_questions[final_id] = json.loads(new_q.model_dump_json())
+                batch[new_q.id] = json.loads(new_q.model_dump_json())
+                batch_hashes.add(text_hash)
                 imported += 1
-        await ctx.send(f"Imported {imported}. Skipped {skipped}. Duplicates {duplicates}.")
+
+                if len(batch) >= self.IMPORT_BATCH_SIZE:
+                    await self._write_question_batch(batch)
+                    batch = {}
+                    batch_hashes.clear()
+                    await asyncio.sleep(0)
+                    if self.bot.loop.time() - last_progress >= self.PROGRESS_INTERVAL:
+                        last_progress = self.bot.loop.time()
+                        await progress_msg.edit(content=info(f"Importing questions... {processed} processed, {imported} imported so far."))
+
+            if batch:
+                await self._write_question_batch(batch)
+        except Exception as e:
+            log.exception(f"QOTD import into {list_id} failed: {e}")
+            return await ctx.send(warning(f"Import failed: {e}"))
+        finally:
+            path.unlink(missing_ok=True)
+
+        await progress_msg.edit(content=f"Imported {imported}. Skipped {skipped}. Duplicates {duplicates}.")
 
     @qotd.command(name="export")
-    async def qotd_export(self, ctx: commands.Context, list_id: str):
-        """Exports questions to JSON."""
+    async def qotd_export(self, ctx: commands.Context, list_id: str, file_format: str = "json"):
+        """
+        Exports questions to JSON (default) or JSON-lines (`jsonl`).
+        """
+        file_format = file_format.lower()
+        if file_format not in ("json", "jsonl"): return await ctx.send(warning("Format must be `json` or `jsonl`."))
         lists_data = await self.config.lists()
         if list_id not in lists_data: return await ctx.send(warning("List ID not found."))
         all_q = await self.config.questions()
         list_name = lists_data.get(list_id, {}).get('name', 'Unknown')
-        export_data = []
-        export_data.append({"2s5qal": f"Export: {list_name}"})
-        export_data.append({"e8auv2": f"List ID: {list_id}"})
         
-        count = 0
-        for qid, qdict in all_q.items():
-            if qdict.get('list_id') == list_id:
+        filename = f"qotd_{list_id}.{file_format}"
+        temp_dir = cog_data_path(self) / "exports"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        path = temp_dir / filename
+
+        def export_items():
+            yield {"2s5qal": f"Export: {list_name}"}
+            yield {"e8auv2": f"List ID: {list_id}"}
+            for qid, qdict in all_q.items():
+                if qdict.get('list_id') != list_id:
+                    continue
                 s_id = qdict.get('suggested_by')
                 s_name = "System"
                 if s_id:
@@ -1498,25 +1787,32 @@ class QuestionOfTheDay(commands.Cog):
                     if u: s_name = u.display_name
                     else: s_name = f"ID: {s_id}"
                 
-                export_data.append({
+                yield {
                     "id": qid,
                     "question": qdict.get('question'),
                     "suggested_by_id": s_id,
                     "suggested_by_name": s_name,
                     "added_on": qdict.get('added_on'),
                     "last_asked": qdict.get('last_asked')
-                })
-                count += 1
-        
-        if count == 0: return await ctx.send("List is empty.")
-        
-        filename = f"qotd_{list_id}.json"
-        temp_dir = cog_data_path(self) / "exports"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        path = temp_dir / filename
+                }
         
+        count = 0
         try:
-            with path.open("w", encoding="utf-8") as f: json.dump(export_data, f, indent=4)
+            with path.open("w", encoding="utf-8") as f:
+                if file_format == "json": f.write("[\n")
+                for written, item in enumerate(export_items()):
+                    if file_format == "jsonl":
+                        f.write(json.dumps(item) + "\n")
+                    else:
+                        if written: f.write(",\n")
+                        f.write("    " + json.dumps(item, indent=4).replace("\n", "\n    "))
+                    if "id" in item:
+                        count += 1
+                        if count % self.EXPORT_YIELD_EVERY == 0:
+                            await asyncio.sleep(0)
+                if file_format == "json": f.write("\n]\n")
+
+            if count == 0: return await ctx.send("List is empty.")
             await ctx.send(f"Exported {count} questions.", file=discord.File(path))
         except Exception as e:
             await ctx.send(warning(f"Export failed: {e}"))
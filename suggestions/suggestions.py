@@ -3,12 +3,23 @@ from redbot.core import commands, Config, bank
 from redbot.core.utils.chat_formatting import box, humanize_list
 from redbot.core.utils.predicates import MessagePredicate
 import asyncio
+import bisect
 import datetime
+import heapq
 import logging
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
 
 log = logging.getLogger("red.suggestions")
 
+# Seconds a burst of vote clicks is collected before the suggestion message is re-rendered
+VOTE_RENDER_DELAY = 1.5
+# Seconds recorded votes stay in memory before being written to Config
+VOTE_FLUSH_DELAY = 5
+# Seconds dashboard refresh requests are collected before both dashboards are edited
+DASHBOARD_REFRESH_DELAY = 2
+# Max bank deposits in flight at once when paying out a suggestion
+PAYOUT_CONCURRENCY = 5
+
 class SuggestionModal(discord.ui.Modal):
     def __init__(self, cog):
         super().__init__(title="Make a Suggestion")
@@ -97,6 +108,63 @@ class VoteView(discord.ui.View):
             disabled=disabled
         ))
 
+class DashboardModel:
+    """
+    In-memory view of what the dashboards show for one guild:
+    open suggestions ordered by ID and the few most recently approved/rejected ones.
+    """
+    RECENT = 3 # Entries shown per closed status
+
+    def __init__(self, channel_id):
+        self.channel_id = channel_id
+        self.open = {}
+        self.open_ids = []
+        self.recent = {
+            "approved": deque(maxlen=self.RECENT),
+            "rejected": deque(maxlen=self.RECENT),
+        }
+
+    @staticmethod
+    def _entry(data):
+        return {k: data.get(k) for k in ('id', 'title', 'message_id', 'thread_id')}
+
+    @classmethod
+    def from_suggestions(cls, channel_id, suggestions):
+        model = cls(channel_id)
+        for data in suggestions.values():
+            if data['status'] == 'open':
+                model.open[data['id']] = cls._entry(data)
+        model.open_ids = sorted(model.open)
+
+        for status, recent in model.recent.items():
+            closed = (d for d in suggestions.values() if d['status'] == status)
+            newest = heapq.nlargest(cls.RECENT, closed, key=lambda d: d.get('closed_at', d['timestamp']))
+            recent.extend(cls._entry(d) for d in newest)
+        return model
+
+    def update(self, data):
+        """
+        Applies a created/approved/rejected suggestion.
+        Returns False if the model can't follow the change incrementally and must be rebuilt.
+        """
+        s_id = data['id']
+        if s_id in self.open:
+            del self.open[s_id]
+            self.open_ids.pop(bisect.bisect_left(self.open_ids, s_id))
+
+        for recent in self.recent.values():
+            if any(e['id'] == s_id for e in recent):
+                # An older entry would have to move back up; let the caller rebuild
+                return False
+
+        status = data['status']
+        if status == 'open':
+            self.open[s_id] = self._entry(data)
+            bisect.insort(self.open_ids, s_id)
+        elif status in self.recent:
+            self.recent[status].appendleft(self._entry(data))
+        return True
+
 class Suggestions(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -125,8 +193,45 @@ class Suggestions(commands.Cog):
         self.entry_view = EntryView(self)
         self.bot.add_view(self.entry_view)
 
-    def cog_unload(self):
+        # Live vote sets of open suggestions: {(guild_id, suggestion_id): {"up", "down", "status", "message_id"}}
+        self.vote_states = {}
+        # Suggestions whose votes haven't been written to Config yet: {guild_id: {suggestion_id}}
+        self.dirty_votes = defaultdict(set)
+        self.flush_tasks = {}
+        self.render_tasks = {}
+        # Partial messages reused for vote re-renders, so no fetch is needed per edit
+        self.vote_messages = {}
+
+        # Per-guild DashboardModel, built from Config on first use
+        self.dashboard_models = {}
+        self.dashboard_tasks = {}
+        self.dashboard_reposts = set()
+
+        # Thread participation of open suggestions, counted from on_message: {thread_id: Counter(user_id)}
+        self.thread_index = {} # thread_id -> (guild_id, suggestion_id)
+        self.thread_counts = defaultdict(Counter)
+        # thread_id -> snowflake tracking started at, for threads older than this session
+        self.thread_tracked_from = {}
+
+    async def cog_load(self):
+        started = discord.utils.time_snowflake(datetime.datetime.now(datetime.timezone.utc))
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            for s_id, data in guild_data.get('suggestions', {}).items():
+                if data['status'] == 'open' and data.get('thread_id'):
+                    self.track_thread(guild_id, s_id, data['thread_id'], tracked_from=started)
+
+    async def cog_unload(self):
         self.entry_view.stop()
+        for task in self.render_tasks.values():
+            task.cancel()
+        self.render_tasks.clear()
+        for task in self.dashboard_tasks.values():
+            task.cancel()
+        self.dashboard_tasks.clear()
+        for guild_id in list(self.dirty_votes):
+            guild = self.bot.get_guild(guild_id)
+            if guild:
+                await self.flush_votes(guild)
 
     async def get_user_level(self, member: discord.Member) -> int:
         cog = self.bot.get_cog("LevelUp")
@@ -139,22 +244,23 @@ class Suggestions(commands.Cog):
         except TypeError:
             return 0
 
+    async def get_dashboard_model(self, guild):
+        model = self.dashboard_models.get(guild.id)
+        if model is None:
+            channel_id = await self.config.guild(guild).channel_id()
+            data = await self.config.guild(guild).suggestions()
+            model = self.dashboard_models[guild.id] = DashboardModel.from_suggestions(channel_id, data)
+        return model
+
+    def update_dashboard_model(self, guild, data):
+        """Keeps a built DashboardModel in step with a suggestion change."""
+        model = self.dashboard_models.get(guild.id)
+        if model and not model.update(data):
+            del self.dashboard_models[guild.id]
+
     async def generate_dashboard_embed(self, guild, is_overview=False):
         """Generates the embed content based on current suggestions."""
-        data = await self.config.guild(guild).suggestions()
-        
-        # Sort/Filter
-        open_sugs = [v for v in data.values() if v['status'] == 'open']
-        # Sort open by ID (oldest first)
-        open_sugs.sort(key=lambda x: x['id'])
-        
-        approved_sugs = [v for v in data.values() if v['status'] == 'approved']
-        # Sort approved by timestamp descending (newest first)
-        approved_sugs.sort(key=lambda x: x['timestamp'], reverse=True)
-        
-        rejected_sugs = [v for v in data.values() if v['status'] == 'rejected']
-        # Sort rejected by timestamp descending (newest first)
-        rejected_sugs.sort(key=lambda x: x['timestamp'], reverse=True)
+        model = await self.get_dashboard_model(guild)
 
         title = "Suggestions Overview" if is_overview else "Suggestions"
         desc = "Live status of all suggestions." if is_overview else "Have an idea for the server? Click the button below to submit a suggestion!"
@@ -165,36 +271,35 @@ class Suggestions(commands.Cog):
             color=discord.Color.green()
         )
         
-        # Open Suggestions Field
-        if open_sugs:
+        # Open Suggestions Field (oldest first)
+        if model.open_ids:
             lines = []
-            for s in open_sugs:
-                chan_id = await self.config.guild(guild).channel_id()
+            length = 0
+            for s_id in model.open_ids:
+                s = model.open[s_id]
                 # Create a jump link to the message
-                link = f"https://discord.com/channels/{guild.id}/{chan_id}/{s['message_id']}"
-                lines.append(f"• [#{s['id']} {s['title']}]({link})")
+                link = f"https://discord.com/channels/{guild.id}/{model.channel_id}/{s['message_id']}"
+                line = f"• [#{s['id']} {s['title']}]({link})"
+                lines.append(line)
+                length += len(line) + 1
+                if length > 1024:
+                    break # The rest would be cut off anyway
             
             # Prevent hitting character limits
             val = "\n".join(lines)
             if len(val) > 1024:
                 val = val[:1020] + "..."
-            embed.add_field(name=f"Open Suggestions ({len(open_sugs)})", value=val, inline=False)
-
-        # Recently Approved Field
-        if approved_sugs:
-            lines = []
-            for s in approved_sugs[:3]: # Top 3
-                link = f"https://discord.com/channels/{guild.id}/{s['thread_id']}"
-                lines.append(f"• [#{s['id']} {s['title']}]({link})")
-            embed.add_field(name="✅ Recently Approved", value="\n".join(lines), inline=False)
-
-        # Recently Rejected Field
-        if rejected_sugs:
-            lines = []
-            for s in rejected_sugs[:3]: # Top 3
-                link = f"https://discord.com/channels/{guild.id}/{s['thread_id']}"
-                lines.append(f"• [#{s['id']} {s['title']}]({link})")
-            embed.add_field(name="❌ Recently Rejected", value="\n".join(lines), inline=False)
+            embed.add_field(name=f"Open Suggestions ({len(model.open_ids)})", value=val, inline=False)
+
+        # Recently Approved / Rejected Fields (newest first)
+        for status, name in (('approved', "✅ Recently Approved"), ('rejected', "❌ Recently Rejected")):
+            recent = model.recent[status]
+            if recent:
+                lines = []
+                for s in recent:
+                    link = f"https://discord.com/channels/{guild.id}/{s['thread_id']}"
+                    lines.append(f"• [#{s['id']} {s['title']}]({link})")
+                embed.add_field(name=name, value="\n".join(lines), inline=False)
 
         if not is_overview:
             embed.set_footer(text="Please keep titles short and provide details in the description.")
@@ -217,17 +322,8 @@ class Suggestions(commands.Cog):
         msg_id = await self.config.guild(guild).dashboard_msg_id()
         embed = await self.generate_dashboard_embed(guild, is_overview=False)
         
-        msg = None
-        
-        if msg_id:
-            try:
-                msg = await channel.fetch_message(msg_id)
-            except discord.NotFound:
-                msg = None # Need to create new
-            except discord.Forbidden:
-                # If we can't see the message/history, we assume it's lost and try to send a new one
-                # This might cause duplicates if perms are weird (Send = Yes, History = No), but better than no dashboard
-                msg = None 
+        # A partial message is enough to edit/delete; a missing message shows up as NotFound below
+        msg = channel.get_partial_message(msg_id) if msg_id else None
 
         # Sticky Logic:
         # If we found the message, check if it's the last one in the channel.
@@ -257,7 +353,11 @@ class Suggestions(commands.Cog):
             try:
                 await msg.edit(embed=embed, view=self.entry_view)
             except discord.NotFound:
-                msg = None # Edit failed, it was deleted mid-process
+                msg = None # It was deleted, need to create new
+            except discord.Forbidden:
+                # If we can't see the message/history, we assume it's lost and try to send a new one
+                # This might cause duplicates if perms are weird (Send = Yes, History = No), but better than no dashboard
+                msg = None
 
         if msg is None:
             try:
@@ -281,12 +381,7 @@ class Suggestions(commands.Cog):
         msg_id = await self.config.guild(guild).overview_msg_id()
         embed = await self.generate_dashboard_embed(guild, is_overview=True)
         
-        msg = None
-        if msg_id:
-            try:
-                msg = await channel.fetch_message(msg_id)
-            except (discord.NotFound, discord.Forbidden):
-                msg = None
+        msg = channel.get_partial_message(msg_id) if msg_id else None
 
         if msg:
             try:
@@ -301,6 +396,28 @@ class Suggestions(commands.Cog):
             except discord.Forbidden:
                 pass
 
+    def schedule_dashboard_refresh(self, guild, force_repost=False):
+        """Queues a refresh of both dashboards; requests within DASHBOARD_REFRESH_DELAY share one edit."""
+        if force_repost:
+            self.dashboard_reposts.add(guild.id)
+        task = self.dashboard_tasks.get(guild.id)
+        if task and not task.done():
+            return
+        self.dashboard_tasks[guild.id] = self.bot.loop.create_task(self._refresh_dashboards_later(guild))
+
+    async def _refresh_dashboards_later(self, guild):
+        await asyncio.sleep(DASHBOARD_REFRESH_DELAY)
+        self.dashboard_tasks.pop(guild.id, None)
+        force_repost = guild.id in self.dashboard_reposts
+        self.dashboard_reposts.discard(guild.id)
+        try:
+            # Update Sticky Dashboard
+            await self.refresh_dashboard(guild, force_repost=force_repost)
+            # Update Live Overview Dashboard (Edit in place)
+            await self.update_live_overview(guild)
+        except Exception:
+            log.exception(f"Failed to refresh suggestion dashboards in guild {guild.id}")
+
     async def update_suggestion_message(self, guild, data):
         channel_id = await self.config.guild(guild).channel_id()
         channel = guild.get_channel(channel_id)
@@ -355,6 +472,183 @@ class Suggestions(commands.Cog):
         except discord.Forbidden:
             pass
 
+    # --- Vote recording & rendering ---
+    async def get_vote_state(self, guild, suggestion_id):
+        """Returns the in-memory vote state of a suggestion, loading it from Config on first use."""
+        key = (guild.id, suggestion_id)
+        state = self.vote_states.get(key)
+        if state is not None:
+            return state
+
+        try:
+            data = await self.config.guild(guild).suggestions.get_raw(suggestion_id)
+        except KeyError:
+            return None
+
+        loaded = {
+            "up": set(data['upvotes']),
+            "down": set(data['downvotes']),
+            "status": data['status'],
+            "message_id": data['message_id'],
+        }
+        # Another click may have loaded it while we were reading
+        return self.vote_states.setdefault(key, loaded)
+
+    def close_vote_state(self, guild, suggestion_id, status):
+        """
+        Closes live voting on a suggestion and returns its in-memory state (None if it was never loaded).
+        The closed state stays cached so clicks racing the approve/reject still see voting as closed.
+        """
+        key = (guild.id, suggestion_id)
+        task = self.render_tasks.pop(key, None)
+        if task:
+            task.cancel()
+        self.vote_messages.pop(key, None)
+        self.dirty_votes[guild.id].discard(suggestion_id)
+
+        state = self.vote_states.get(key)
+        if state is None:
+            self.vote_states[key] = {"up": set(), "down": set(), "status": status, "message_id": None}
+            return None
+        state['status'] = status
+        return state
+
+    def forget_vote_states(self, guild):
+        for key in [k for k in self.vote_states if k[0] == guild.id]:
+            self.close_vote_state(guild, key[1], None)
+            del self.vote_states[key]
+
+    def schedule_vote_flush(self, guild, suggestion_id):
+        self.dirty_votes[guild.id].add(suggestion_id)
+        if guild.id not in self.flush_tasks:
+            self.flush_tasks[guild.id] = self.bot.loop.create_task(self._flush_votes_later(guild))
+
+    async def _flush_votes_later(self, guild):
+        await asyncio.sleep(VOTE_FLUSH_DELAY)
+        self.flush_tasks.pop(guild.id, None)
+        await self.flush_votes(guild)
+
+    async def flush_votes(self, guild):
+        """Writes all pending votes of a guild to Config in one transaction."""
+        task = self.flush_tasks.pop(guild.id, None)
+        if task:
+            task.cancel()
+
+        dirty = self.dirty_votes.pop(guild.id, None)
+        if not dirty:
+            return
+
+        async with self.config.guild(guild).suggestions() as suggestions:
+            for suggestion_id in dirty:
+                state = self.vote_states.get((guild.id, suggestion_id))
+                if state is None or suggestion_id not in suggestions:
+                    continue
+                suggestions[suggestion_id]['upvotes'] = list(state['up'])
+                suggestions[suggestion_id]['downvotes'] = list(state['down'])
+
+    def schedule_vote_render(self, guild, suggestion_id):
+        key = (guild.id, suggestion_id)
+        task = self.render_tasks.get(key)
+        if task and not task.done():
+            return # The pending render will pick up this vote too
+        self.render_tasks[key] = self.bot.loop.create_task(self._render_votes_later(guild, suggestion_id))
+
+    async def _render_votes_later(self, guild, suggestion_id):
+        await asyncio.sleep(VOTE_RENDER_DELAY)
+        key = (guild.id, suggestion_id)
+        # Clicks arriving while we edit schedule a fresh render
+        self.render_tasks.pop(key, None)
+
+        state = self.vote_states.get(key)
+        if not state or state['status'] != 'open':
+            return
+
+        message = self.vote_messages.get(key)
+        if message is None:
+            channel_id = await self.config.guild(guild).channel_id()
+            channel = guild.get_channel(channel_id)
+            if not channel:
+                return
+            message = self.vote_messages[key] = channel.get_partial_message(state['message_id'])
+
+        emoji_up = await self.config.guild(guild).emoji_up()
+        emoji_down = await self.config.guild(guild).emoji_down()
+        view = VoteView(suggestion_id, len(state['up']), len(state['down']), emoji_up, emoji_down)
+
+        # Only the button counts change while a suggestion is open, so the embed is left untouched
+        try:
+            await message.edit(view=view)
+        except discord.NotFound:
+            self.vote_messages.pop(key, None)
+        except discord.HTTPException:
+            pass
+
+    # --- Thread participation ---
+    def track_thread(self, guild_id, suggestion_id, thread_id, tracked_from=None):
+        self.thread_index[thread_id] = (guild_id, suggestion_id)
+        if tracked_from is not None:
+            self.thread_tracked_from[thread_id] = tracked_from
+
+    def untrack_thread(self, thread_id):
+        self.thread_index.pop(thread_id, None)
+        self.thread_tracked_from.pop(thread_id, None)
+        return self.thread_counts.pop(thread_id, Counter())
+
+    async def take_thread_participation(self, thread):
+        """
+        Returns message counts per user for a suggestion thread and stops tracking it.
+        Only messages from before tracking started (e.g. a bot restart) are read from history, at most 500.
+        """
+        tracked = thread.id in self.thread_index
+        tracked_from = self.thread_tracked_from.get(thread.id)
+        counter = self.untrack_thread(thread.id)
+        if not tracked or tracked_from is not None:
+            before = discord.Object(id=tracked_from) if tracked_from is not None else None
+            async for message in thread.history(limit=500, before=before):
+                if not message.author.bot:
+                    counter[message.author.id] += 1
+        return counter
+
+    async def deposit_payouts(self, payouts):
+        """
+        Makes one bank deposit per member, at most PAYOUT_CONCURRENCY at a time.
+        payouts maps member -> amount. Returns the set of members that were paid.
+        """
+        semaphore = asyncio.Semaphore(PAYOUT_CONCURRENCY)
+
+        async def deposit(member, amount):
+            async with semaphore:
+                await bank.deposit_credits(member, amount)
+
+        members = [m for m, amount in payouts.items() if amount > 0]
+        results = await asyncio.gather(
+            *(deposit(m, payouts[m]) for m in members),
+            return_exceptions=True
+        )
+        paid = set()
+        for member, result in zip(members, results):
+            if isinstance(result, BaseException):
+                log.warning(f"Failed to deposit {payouts[member]} credits for {member.id} in {member.guild.id}: {result}")
+            else:
+                paid.add(member)
+        return paid
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        if message.author.bot or message.channel.id not in self.thread_index:
+            return
+        self.thread_counts[message.channel.id][message.author.id] += 1
+
+    @commands.Cog.listener()
+    async def on_message_delete(self, message):
+        # Messages sent before tracking started were never counted here; they are read from history on close
+        tracked_from = self.thread_tracked_from.get(message.channel.id)
+        if tracked_from is not None and message.id < tracked_from:
+            return
+        counter = self.thread_counts.get(message.channel.id)
+        if counter and counter[message.author.id] > 0:
+            counter[message.author.id] -= 1
+
     async def process_suggestion(self, interaction, channel_id, title, text):
         guild = interaction.guild
         
@@ -413,6 +707,9 @@ class Suggestions(commands.Cog):
         
         async with self.config.guild(guild).suggestions() as s:
             s[str(s_id)] = s_data
+        self.update_dashboard_model(guild, s_data)
+        if thread:
+            self.track_thread(guild.id, str(s_id), thread.id)
 
         # --- ECONOMY: Create Reward ---
         create_amt = await self.config.guild(guild).credits_create()
@@ -431,65 +728,69 @@ class Suggestions(commands.Cog):
         except:
             pass
 
-        # Update Sticky Dashboard (Repost at bottom)
-        await self.refresh_dashboard(guild, force_repost=True)
-        # Update Live Overview Dashboard (Edit in place)
-        await self.update_live_overview(guild)
+        # Update both dashboards (sticky one reposted at bottom)
+        self.schedule_dashboard_refresh(guild, force_repost=True)
 
     async def distribute_rewards(self, guild, data, thread, status):
         """Handles distributing credits for Approval, Voting, and Thread Participation."""
         currency = await bank.get_currency_name(guild)
         logs = []
+        # Everything a member earns is summed and paid in one deposit
+        payouts = Counter()
 
         # 1. Author Reward (ONLY if Approved)
+        author = None
+        author_amt = 0
         if status == 'approved':
             author_amt = await self.config.guild(guild).credits_approve()
             if author_amt > 0:
                 author = guild.get_member(data['author_id'])
                 if author:
-                    try:
-                        await bank.deposit_credits(author, author_amt)
-                        logs.append(f"Author {author.mention}: +{author_amt} {currency} (Approval)")
-                    except: pass
+                    payouts[author] += author_amt
 
         # 2. Voter Reward (Always, if configured)
         vote_amt = await self.config.guild(guild).credits_vote()
+        voters = []
         if vote_amt > 0:
-            voters = set(data['upvotes']) | set(data['downvotes'])
-            for user_id in voters:
-                member = guild.get_member(user_id)
-                if member:
-                    try:
-                        await bank.deposit_credits(member, vote_amt)
-                    except: pass
-            if voters:
-                logs.append(f"{len(voters)} Voters: +{vote_amt} {currency} each")
+            voter_ids = set(data['upvotes']) | set(data['downvotes'])
+            voters = [m for m in map(guild.get_member, voter_ids) if m]
+            for member in voters:
+                payouts[member] += vote_amt
 
         # 3. Thread Participation Reward (Always, if configured)
         thread_amt = await self.config.guild(guild).credits_thread()
         min_msgs = await self.config.guild(guild).thread_min_msgs()
-        
+        chatters = []
+        thread_failed = False
+
         if thread_amt > 0 and thread:
-            counter = Counter()
             try:
-                async for message in thread.history(limit=500):
-                    if not message.author.bot:
-                        counter[message.author.id] += 1
-                
-                paid_chatters = 0
+                counter = await self.take_thread_participation(thread)
                 for user_id, count in counter.items():
                     if count >= min_msgs:
                         member = guild.get_member(user_id)
                         if member:
-                            try:
-                                await bank.deposit_credits(member, thread_amt)
-                                paid_chatters += 1
-                            except: pass
-                
-                if paid_chatters > 0:
-                    logs.append(f"{paid_chatters} Thread Participants: +{thread_amt} {currency} each")
+                            chatters.append(member)
+                            payouts[member] += thread_amt
             except:
-                logs.append("Failed to process thread history for rewards.")
+                thread_failed = True
+        elif thread:
+            self.untrack_thread(thread.id)
+
+        paid = await self.deposit_payouts(payouts)
+
+        if author in paid:
+            logs.append(f"Author {author.mention}: +{author_amt} {currency} (Approval)")
+
+        paid_voters = sum(1 for m in voters if m in paid)
+        if paid_voters > 0:
+            logs.append(f"{paid_voters} Voters: +{vote_amt} {currency} each")
+
+        paid_chatters = sum(1 for m in chatters if m in paid)
+        if paid_chatters > 0:
+            logs.append(f"{paid_chatters} Thread Participants: +{thread_amt} {currency} each")
+        if thread_failed:
+            logs.append("Failed to process thread history for rewards.")
 
         return logs
 
@@ -505,6 +806,8 @@ class Suggestions(commands.Cog):
         await self.config.guild(ctx.guild).channel_id.set(channel.id)
         # Reset current dashboard ID if changing channels
         await self.config.guild(ctx.guild).dashboard_msg_id.set(None)
+        # Jump links in the dashboards point at the suggestions channel
+        self.dashboard_models.pop(ctx.guild.id, None)
         
         await ctx.tick()
         await self.refresh_dashboard(ctx.guild, force_repost=True)
@@ -553,8 +856,7 @@ class Suggestions(commands.Cog):
 
         await self.config.guild(ctx.guild).next_id.set(id_number)
         await ctx.send(f"Next suggestion ID set to `{id_number}`.")
-        await self.refresh_dashboard(ctx.guild, force_repost=False)
-        await self.update_live_overview(ctx.guild)
+        self.schedule_dashboard_refresh(ctx.guild)
 
     @suggestionsset.command(name="levelcreate")
     async def ss_levelcreate(self, ctx, level: int):
@@ -639,6 +941,7 @@ Thread Chat:    {cfg['credits_thread']} (Min Msgs: {cfg['thread_min_msgs']})
     @suggestionsset.command(name="voters")
     async def ss_voters(self, ctx, suggestion_id: str):
         """View who upvoted and downvoted a specific suggestion."""
+        await self.flush_votes(ctx.guild)
         data = await self.config.guild(ctx.guild).suggestions()
         
         if suggestion_id not in data:
@@ -698,9 +1001,15 @@ Thread Chat:    {cfg['credits_thread']} (Min Msgs: {cfg['thread_min_msgs']})
                 return await ctx.send("Suggestion ID not found.")
             
             data = suggestions[suggestion_id]
+            state = self.close_vote_state(ctx.guild, suggestion_id, 'approved')
+            if state:
+                data['upvotes'] = list(state['up'])
+                data['downvotes'] = list(state['down'])
             data['status'] = 'approved'
             data['reason'] = message
+            data['closed_at'] = datetime.datetime.now().timestamp()
             suggestions[suggestion_id] = data
+            self.update_dashboard_model(ctx.guild, data)
             
             await self.update_suggestion_message(ctx.guild, data)
 
@@ -746,10 +1055,8 @@ Thread Chat:    {cfg['credits_thread']} (Min Msgs: {cfg['thread_min_msgs']})
             if reward_logs:
                 await ctx.send(box("\n".join(reward_logs), lang="yaml"))
         
-        # Update sticky dashboard (Edit, no repost)
-        await self.refresh_dashboard(ctx.guild, force_repost=False)
-        # Update live overview
-        await self.update_live_overview(ctx.guild)
+        # Update sticky dashboard (Edit, no repost) and live overview
+        self.schedule_dashboard_refresh(ctx.guild)
 
     @suggestionsset.command(name="reject")
     async def ss_reject(self, ctx, suggestion_id: str, *, message: str):
@@ -759,9 +1066,15 @@ Thread Chat:    {cfg['credits_thread']} (Min Msgs: {cfg['thread_min_msgs']})
                 return await ctx.send("Suggestion ID not found.")
             
             data = suggestions[suggestion_id]
+            state = self.close_vote_state(ctx.guild, suggestion_id, 'rejected')
+            if state:
+                data['upvotes'] = list(state['up'])
+                data['downvotes'] = list(state['down'])
             data['status'] = 'rejected'
             data['reason'] = message
+            data['closed_at'] = datetime.datetime.now().timestamp()
             suggestions[suggestion_id] = data
+            self.update_dashboard_model(ctx.guild, data)
             
             await self.update_suggestion_message(ctx.guild, data)
             
@@ -806,10 +1119,8 @@ Thread Chat:    {cfg['credits_thread']} (Min Msgs: {cfg['thread_min_msgs']})
             if reward_logs:
                 await ctx.send(box("\n".join(reward_logs), lang="yaml"))
 
-        # Update sticky dashboard (Edit)
-        await self.refresh_dashboard(ctx.guild, force_repost=False)
-        # Update live overview
-        await self.update_live_overview(ctx.guild)
+        # Update sticky dashboard (Edit) and live overview
+        self.schedule_dashboard_refresh(ctx.guild)
 
     @suggestionsset.command(name="resetstats")
     async def ss_resetstats(self, ctx):
@@ -822,18 +1133,22 @@ Thread Chat:    {cfg['credits_thread']} (Min Msgs: {cfg['thread_min_msgs']})
             return await ctx.send("Timed out.")
         
         if pred.result:
+            self.forget_vote_states(ctx.guild)
+            for thread_id in [t for t, (g_id, _) in self.thread_index.items() if g_id == ctx.guild.id]:
+                self.untrack_thread(thread_id)
             await self.config.guild(ctx.guild).suggestions.set({})
             await self.config.guild(ctx.guild).next_id.set(1)
+            self.dashboard_models.pop(ctx.guild.id, None)
             await ctx.send("All suggestions and stats reset.")
             # Refresh to clear dashboards
-            await self.refresh_dashboard(ctx.guild, force_repost=False)
-            await self.update_live_overview(ctx.guild)
+            self.schedule_dashboard_refresh(ctx.guild)
         else:
             await ctx.send("Cancelled.")
 
     @suggestionsset.command(name="stats")
     async def ss_stats(self, ctx):
         """View detailed suggestion statistics."""
+        await self.flush_votes(ctx.guild)
         data = await self.config.guild(ctx.guild).suggestions()
         all_sugs = data.values()
         if not all_sugs:
@@ -942,46 +1257,42 @@ Thread Chat:    {cfg['credits_thread']} (Min Msgs: {cfg['thread_min_msgs']})
                         )
                         return
 
-                async with self.config.guild(guild).suggestions() as suggestions:
-                    if suggestion_id not in suggestions:
-                        await interaction.response.send_message("Suggestion not found.", ephemeral=True)
-                        return
-                        
-                    data = suggestions[suggestion_id]
-                    
-                    if data['status'] != 'open':
-                        await interaction.response.send_message("Voting is closed.", ephemeral=True)
-                        return
+                state = await self.get_vote_state(guild, suggestion_id)
+                if state is None:
+                    await interaction.response.send_message("Suggestion not found.", ephemeral=True)
+                    return
 
-                    uid = interaction.user.id
-                    ups = set(data['upvotes'])
-                    downs = set(data['downvotes'])
-                    
-                    msg_txt = "Vote recorded."
-                    
-                    if vote_type == "up":
-                        if uid in ups:
-                            ups.remove(uid)
-                            msg_txt = "Upvote removed."
-                        else:
-                            ups.add(uid)
-                            if uid in downs: downs.remove(uid)
-                            msg_txt = "Upvoted!"
-                    elif vote_type == "down":
-                        if uid in downs:
-                            downs.remove(uid)
-                            msg_txt = "Downvote removed."
-                        else:
-                            downs.add(uid)
-                            if uid in ups: ups.remove(uid)
-                            msg_txt = "Downvoted."
-                            
-                    data['upvotes'] = list(ups)
-                    data['downvotes'] = list(downs)
-                    suggestions[suggestion_id] = data
-
-                    await self.update_suggestion_message(guild, data)
-                    await interaction.response.send_message(msg_txt, ephemeral=True)
+                if state['status'] != 'open':
+                    await interaction.response.send_message("Voting is closed.", ephemeral=True)
+                    return
+
+                uid = interaction.user.id
+                ups = state['up']
+                downs = state['down']
+                
+                msg_txt = "Vote recorded."
+                
+                if vote_type == "up":
+                    if uid in ups:
+                        ups.remove(uid)
+                        msg_txt = "Upvote removed."
+                    else:
+                        ups.add(uid)
+                        downs.discard(uid)
+                        msg_txt = "Upvoted!"
+                elif vote_type == "down":
+                    if uid in downs:
+                        downs.remove(uid)
+                        msg_txt = "Downvote removed."
+                    else:
+                        downs.add(uid)
+                        ups.discard(uid)
+                        msg_txt = "Downvoted."
+
+                # Recording is in memory; Config writes and message edits are coalesced
+                self.schedule_vote_flush(guild, suggestion_id)
+                self.schedule_vote_render(guild, suggestion_id)
+                await interaction.response.send_message(msg_txt, ephemeral=True)
             except Exception as e:
                 # Log actual errors, don't just pass silently if it's a code error
                 # But ignore 404/Unknown Interaction if user clicked too fast
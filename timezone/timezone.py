@@ -1,11 +1,18 @@
 import discord
 import pytz
 import datetime
+import functools
 from dateutil import parser
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from redbot.core import commands, Config, app_commands
 from redbot.core.utils.chat_formatting import box, pagify
 
+@functools.lru_cache(maxsize=512)
+def get_zone(name: str) -> datetime.tzinfo:
+    """Constructs (once) the pytz zone for a timezone name. Raises pytz.UnknownTimeZoneError."""
+    return pytz.timezone(name)
+
+
 class TimezoneView(discord.ui.View):
     """
     A 3-step ephemeral View:
@@ -84,6 +91,7 @@ class TimezoneView(discord.ui.View):
 
     async def finish(self, interaction: discord.Interaction, timezone: str):
         await self.cog.config.user_from_id(self.user_id).timezone.set(timezone)
+        self.cog.user_timezones[self.user_id] = timezone
         for child in self.children:
             child.disabled = True
         await interaction.response.edit_message(
@@ -138,11 +146,38 @@ class Timezone(commands.Cog):
         self.config = Config.get_conf(self, identifier=981234712399, force_registration=True)
         default_user = {"timezone": None}
         self.config.register_user(**default_user)
+        # user_id -> timezone name, mirrored from Config and updated by /mytimezone
+        self.user_timezones: Dict[int, str] = {}
+
+    async def cog_load(self):
+        all_users = await self.config.all_users()
+        self.user_timezones = {
+            int(user_id): data["timezone"]
+            for user_id, data in all_users.items()
+            if data.get("timezone")
+        }
 
     # --- Public API ---
 
     async def get_user_timezone(self, user_id: int) -> Optional[str]:
-        return await self.config.user_from_id(user_id).timezone()
+        return self.user_timezones.get(user_id)
+
+    async def get_user_timezones(self, user_ids: Iterable[int]) -> Dict[int, Optional[datetime.tzinfo]]:
+        """
+        Resolves many users at once without touching Config.
+        Returns user_id -> tz object, or None if the user has no (valid) timezone set.
+        """
+        result = {}
+        for user_id in user_ids:
+            name = self.user_timezones.get(user_id)
+            tz = None
+            if name:
+                try:
+                    tz = get_zone(name)
+                except pytz.UnknownTimeZoneError:
+                    pass
+            result[user_id] = tz
+        return result
 
     # --- Commands ---
 
@@ -163,7 +198,7 @@ class Timezone(commands.Cog):
         Converts a time string (e.g. 5pm) to a Discord timestamp based on your stored timezone.
         """
         # 1. Get User Timezone
-        user_tz_str = await self.config.user_from_id(interaction.user.id).timezone()
+        user_tz_str = self.user_timezones.get(interaction.user.id)
         
         if not user_tz_str:
             await interaction.response.send_message(
@@ -179,7 +214,7 @@ class Timezone(commands.Cog):
             dt = parser.parse(time, fuzzy=True)
             
             # 3. Localize to user's timezone
-            tz = pytz.timezone(user_tz_str)
+            tz = get_zone(user_tz_str)
             
             # Combine 'today' from user's perspective with the parsed 'time'
             now_in_tz = datetime.datetime.now(tz)
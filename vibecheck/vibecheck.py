@@ -1,9 +1,12 @@
 """Module for the VibeCheck cog."""
 import asyncio
+import bisect
+import contextlib
 import logging
 import time
+import weakref
 from collections import namedtuple
-from typing import Tuple, Optional, Union, Dict, List
+from typing import Tuple, Optional, Union, Dict, List, Set
 from datetime import datetime, timedelta, timezone
 
 import discord
@@ -18,6 +21,246 @@ UNIQUE_ID = 0x9C02DCC7
 MemberInfo = namedtuple("MemberInfo", "id name vibes")
 MemberRatioInfo = namedtuple("MemberRatioInfo", "id name ratio")
 
+
+class VibeLeaderboard:
+    """
+    In-memory board of user_id -> value, kept sorted by value.
+    Updated alongside Config so the boards never have to load every user.
+    """
+    __slots__ = ("_entries", "_values")
+
+    def __init__(self):
+        self._entries: List[Tuple[int, int]] = []  # Sorted (value, user_id)
+        self._values: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, user_id: int) -> Optional[int]:
+        return self._values.get(user_id)
+
+    def set(self, user_id: int, value: int):
+        old = self._values.get(user_id)
+        if old == value:
+            return
+        if old is not None:
+            del self._entries[bisect.bisect_left(self._entries, (old, user_id))]
+        self._values[user_id] = value
+        bisect.insort(self._entries, (value, user_id))
+
+    def discard(self, user_id: int):
+        old = self._values.pop(user_id, None)
+        if old is not None:
+            del self._entries[bisect.bisect_left(self._entries, (old, user_id))]
+
+    def clear(self):
+        self._entries.clear()
+        self._values.clear()
+
+    def ranked(self, reverse: bool = True):
+        """Yields (user_id, value) from the top of the board (or the bottom if reverse is False)."""
+        entries = reversed(self._entries) if reverse else iter(self._entries)
+        for value, user_id in entries:
+            yield user_id, value
+
+
+class PeriodStats:
+    """
+    Running report aggregates for one period (monthly, yearly or alltime).
+    Holds a VibeLeaderboard per stat over every user with activity, so winners are a peek at either end.
+    """
+    FIELDS = ("score", "good_sent", "bad_sent", "good_rx", "bad_rx")
+    __slots__ = ("boards",)
+
+    def __init__(self):
+        self.boards: Dict[str, VibeLeaderboard] = {field: VibeLeaderboard() for field in self.FIELDS + ("ratio",)}
+
+    def __len__(self) -> int:
+        return len(self.boards["score"])
+
+    def update(self, user_id: int, bucket: dict):
+        values = {field: bucket.get(field, 0) for field in self.FIELDS}
+        # Skip empty records to avoid cluttering stats with 0s
+        if not any(values.values()):
+            self.discard(user_id)
+            return
+        values["ratio"] = values["good_sent"] - values["bad_sent"]
+        for field, value in values.items():
+            self.boards[field].set(user_id, value)
+
+    def discard(self, user_id: int):
+        for board in self.boards.values():
+            board.discard(user_id)
+
+    def clear(self):
+        for board in self.boards.values():
+            board.clear()
+
+    def highest(self, field: str) -> Tuple[Optional[int], Optional[int]]:
+        return next(self.boards[field].ranked(), (None, None))
+
+    def lowest(self, field: str) -> Tuple[Optional[int], Optional[int]]:
+        return next(self.boards[field].ranked(reverse=False), (None, None))
+
+
+class LevelUpAdapter:
+    """
+    Reads levels/XP from whichever LevelUp build is loaded.
+
+    The storage layout is probed once per LevelUp instance (so reloads are picked up)
+    and level lookups are cached for a short TTL.
+    Supports: Vertyco (DB/Data/API) and Standard Red (Config).
+    """
+    LEVEL_CACHE_TTL = 60  # Seconds a level lookup is reused
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._cog_id: Optional[int] = None
+        self._backend: Optional[str] = None
+        self._level_cache: Dict[int, Dict[int, Tuple[float, int]]] = {}  # guild_id -> {member_id: (expires, level)}
+
+    def _get_cog(self):
+        """Returns the LevelUp cog, re-detecting the backend if the instance changed."""
+        levelup = self.bot.get_cog("LevelUp")
+        if levelup is None:
+            self._cog_id = None
+            self._backend = None
+            return None
+        if id(levelup) != self._cog_id:
+            self._cog_id = id(levelup)
+            self._backend = self._detect_backend(levelup)
+            self._level_cache.clear()
+            log.debug(f"VibeCheck: LevelUp backend detected as '{self._backend}'.")
+        return levelup
+
+    @staticmethod
+    def _detect_backend(levelup) -> Optional[str]:
+        if hasattr(levelup, "db") and hasattr(levelup.db, "get_conf"):
+            return "db"       # Vertyco's Pydantic DB
+        if hasattr(levelup, "data") and isinstance(levelup.data, dict):
+            return "data"     # Vertyco's old data cache
+        if hasattr(levelup, "get_level"):
+            return "api"
+        if hasattr(levelup, "config"):
+            return "config"   # Standard Red Config
+        return None
+
+    @staticmethod
+    def _read_field(user_data, field: str) -> int:
+        # user_data might be an object or dict
+        if isinstance(user_data, dict):
+            return int(user_data.get(field, 0) or 0)
+        return int(getattr(user_data, field, 0) or 0)
+
+    def _snapshot_users(self, levelup, guild: discord.Guild) -> Optional[dict]:
+        """Returns LevelUp's in-memory user map for a guild (db/data backends), or None."""
+        try:
+            if self._backend == "db":
+                conf = levelup.db.get_conf(guild.id)
+                users = getattr(conf, "users", None) if conf else None
+            elif self._backend == "data":
+                g_data = levelup.data.get(guild.id) or levelup.data.get(str(guild.id))
+                users = g_data.get("users") if g_data else None
+            else:
+                return None
+        except Exception as e:
+            log.debug(f"VibeCheck: Failed to read LevelUp {self._backend} data: {e}")
+            return None
+        return users if isinstance(users, dict) else None
+
+    async def _fetch_level(self, levelup, guild: discord.Guild, member_id: int) -> int:
+        """Single-member lookup for the api/config backends."""
+        try:
+            if self._backend == "api":
+                member = guild.get_member(member_id)
+                if member is None:
+                    return 0
+                val = levelup.get_level(member)
+                if asyncio.iscoroutine(val):
+                    val = await val
+                return int(val or 0)
+            if self._backend == "config":
+                return int(await levelup.config.guild(guild).users(str(member_id)).level() or 0)
+        except AttributeError:
+            # If 'users' group doesn't exist or structure is vastly different
+            log.debug("VibeCheck: LevelUp Config structure mismatch.")
+        except Exception as e:
+            log.debug(f"VibeCheck: LevelUp level lookup failed: {e}")
+        return 0
+
+    async def get_levels(self, guild: discord.Guild, member_ids: List[int]) -> Dict[int, int]:
+        """
+        Bulk level lookup. Returns {member_id: level}; members without a profile are level 0.
+        Returns an empty dict if LevelUp isn't loaded.
+        """
+        levelup = self._get_cog()
+        if levelup is None or self._backend is None:
+            return {}
+
+        now = time.monotonic()
+        cache = self._level_cache.setdefault(guild.id, {})
+        levels: Dict[int, int] = {}
+        missing: List[int] = []
+        for member_id in member_ids:
+            cached = cache.get(member_id)
+            if cached and cached[0] > now:
+                levels[member_id] = cached[1]
+            else:
+                missing.append(member_id)
+
+        if not missing:
+            return levels
+
+        users = self._snapshot_users(levelup, guild)
+        fetched: Dict[int, int] = {}
+        for member_id in missing:
+            if users is not None:
+                user_data = users.get(member_id) or users.get(str(member_id))
+                fetched[member_id] = self._read_field(user_data, "level") if user_data else 0
+            else:
+                fetched[member_id] = await self._fetch_level(levelup, guild, member_id)
+
+        expires_at = now + self.LEVEL_CACHE_TTL
+        for member_id, level in fetched.items():
+            cache[member_id] = (expires_at, level)
+        levels.update(fetched)
+        return levels
+
+    async def get_level(self, guild: discord.Guild, member_id: int) -> int:
+        return (await self.get_levels(guild, [member_id])).get(member_id, 0)
+
+    async def get_xp(self, guild: discord.Guild, member_id: int) -> int:
+        """Uncached XP lookup (only used around XP grants)."""
+        levelup = self._get_cog()
+        if levelup is None:
+            return 0
+
+        # Direct API/Cog Method first, regardless of storage layout
+        if hasattr(levelup, "get_xp"):
+            try:
+                val = await levelup.get_xp(guild.id, member_id)
+                if val is not None:
+                    return int(val)
+            except Exception:
+                pass
+
+        users = self._snapshot_users(levelup, guild)
+        if users is not None:
+            user_data = users.get(member_id) or users.get(str(member_id))
+            return self._read_field(user_data, "xp") if user_data else 0
+
+        try:
+            return int(await levelup.config.guild(guild).users(str(member_id)).xp() or 0)
+        except Exception:
+            return 0
+
+    def invalidate(self, guild_id: int, member_id: Optional[int] = None):
+        if member_id is None:
+            self._level_cache.pop(guild_id, None)
+        else:
+            self._level_cache.get(guild_id, {}).pop(member_id, None)
+
+
 class VibeCheckActionView(discord.ui.View):
     """
     Persistent View for VibeCheck voting (Boot vs Wait).
@@ -109,6 +352,11 @@ class VibeCheck(getattr(commands, "Cog", object)):
             yearly_data={"score": 0, "good_sent": 0, "bad_sent": 0, "good_rx": 0, "bad_rx": 0}
         )
         
+        self.conf.register_global(
+            debug_xp_logs=False,  # Re-read XP before/after grants for logging
+            period_generations={"monthly": 0, "yearly": 0},  # Bumped by resetperiod; older buckets read as empty
+        )
+
         # Guild settings
         self.conf.register_guild(
             log_channel_id=None,
@@ -161,11 +409,43 @@ class VibeCheck(getattr(commands, "Cog", object)):
         self.vote_view = VibeCheckActionView(self)
         self.bot.add_view(self.vote_view)
 
+        # In-memory leaderboards (seeded in cog_load, maintained on every write)
+        self.vibe_board_cache = VibeLeaderboard()   # user_id -> vibes (non-zero only)
+        self.ratio_board_cache = VibeLeaderboard()  # user_id -> good sent - bad sent (active senders only)
+
+        # Reverse interaction index: receiver_id -> set of giver_ids (rebuilt in cog_load)
+        self.good_vibe_givers: Dict[int, Set[int]] = {}
+        self.bad_vibe_givers: Dict[int, Set[int]] = {}
+
+        # Per-user locks for _add_vibes (entries drop once no coroutine holds them)
+        self._user_locks = weakref.WeakValueDictionary()
+
+        # Member -> guild index: user_id -> set of guild_ids (seeded once the bot is ready)
+        self.member_guilds: Dict[int, Set[int]] = {}
+        self._member_index_ready = False
+        self._member_index_task = None
+
+        # LevelUp integration (backend detected on first use, levels cached briefly)
+        self.levelup = LevelUpAdapter(bot)
+        self._debug_xp = False
+
+        # Report aggregates per period (seeded in cog_load, maintained on every write)
+        self.period_stats: Dict[str, PeriodStats] = {p: PeriodStats() for p in ("monthly", "yearly", "alltime")}
+        self._period_generations = {"monthly": 0, "yearly": 0}
+
+    async def cog_load(self):
+        self._debug_xp = await self.conf.debug_xp_logs()
+        self._period_generations.update(await self.conf.period_generations())
+        await self._build_indexes()
+        self._member_index_task = self.bot.loop.create_task(self._build_member_index())
+
     def cog_unload(self):
         # Clean up view when cog is unloaded/reloaded
         # Fix: Check if view exists before removing to prevent AttributeError during crashes
         if hasattr(self, "vote_view") and self.vote_view:
             self.bot.remove_view(self.vote_view)
+        if self._member_index_task:
+            self._member_index_task.cancel()
 
     # --- PUBLIC API ---
 
@@ -376,85 +656,24 @@ class VibeCheck(getattr(commands, "Cog", object)):
 
         await ctx.typing()
 
-        # Initialize placeholders for Top 1
+        # Winners are read straight off the running aggregates
         # Tuple format: (user_id, value)
+        aggregates = self.period_stats[period]
+        if not len(aggregates):
+            return await ctx.send(f"No data found for the **{period}** period.")
+
         stats = {
-            "most_good_sent": (None, -1),
-            "most_good_rx": (None, -1),
-            "most_bad_sent": (None, -1),
-            "most_bad_rx": (None, -1),
-            "high_score": (None, float('-inf')),
-            "low_score": (None, float('inf')),
-            "high_ratio": (None, float('-inf')),
-            "low_ratio": (None, float('inf'))
+            "most_good_sent": aggregates.highest("good_sent"),
+            "most_bad_sent": aggregates.highest("bad_sent"),
+            "high_score": aggregates.highest("score"),
+            "low_score": aggregates.lowest("score"),
+            "high_ratio": aggregates.highest("ratio"),
+            "low_ratio": aggregates.lowest("ratio"),
+            # Rx Stats (Only tracked for Monthly/Yearly)
+            "most_good_rx": aggregates.highest("good_rx"),
+            "most_bad_rx": aggregates.highest("bad_rx"),
         }
 
-        all_users = await self.conf.all_users()
-        users_processed = 0
-
-        for uid, data in all_users.items():
-            user_id = int(uid)
-            
-            # Extract data based on period
-            if period == "monthly":
-                d = data.get("monthly_data", {})
-                score = d.get("score", 0)
-                good_sent = d.get("good_sent", 0)
-                bad_sent = d.get("bad_sent", 0)
-                good_rx = d.get("good_rx", 0)
-                bad_rx = d.get("bad_rx", 0)
-            elif period == "yearly":
-                d = data.get("yearly_data", {})
-                score = d.get("score", 0)
-                good_sent = d.get("good_sent", 0)
-                bad_sent = d.get("bad_sent", 0)
-                good_rx = d.get("good_rx", 0)
-                bad_rx = d.get("bad_rx", 0)
-            else: # All Time
-                score = data.get("vibes", 0)
-                good_sent = data.get("good_vibes_sent", 0)
-                bad_sent = data.get("bad_vibes_sent", 0)
-                # For All Time, we don't track RX explicitly in the old schema, 
-                # so we can only show Sent/Score/Ratio for All Time unless we iterate ALL interactions (too slow).
-                good_rx = 0 
-                bad_rx = 0
-
-            # Skip empty records to avoid cluttering stats with 0s if they aren't relevant
-            if score == 0 and good_sent == 0 and bad_sent == 0 and good_rx == 0 and bad_rx == 0:
-                continue
-
-            users_processed += 1
-            ratio = good_sent - bad_sent
-
-            # Update Winners
-            if good_sent > stats["most_good_sent"][1]:
-                stats["most_good_sent"] = (user_id, good_sent)
-            
-            if bad_sent > stats["most_bad_sent"][1]:
-                stats["most_bad_sent"] = (user_id, bad_sent)
-
-            if score > stats["high_score"][1]:
-                stats["high_score"] = (user_id, score)
-            
-            if score < stats["low_score"][1]:
-                stats["low_score"] = (user_id, score)
-
-            if ratio > stats["high_ratio"][1]:
-                stats["high_ratio"] = (user_id, ratio)
-            
-            if ratio < stats["low_ratio"][1]:
-                stats["low_ratio"] = (user_id, ratio)
-
-            # Rx Stats (Only valid for Monthly/Yearly with new schema)
-            if period != "alltime":
-                if good_rx > stats["most_good_rx"][1]:
-                    stats["most_good_rx"] = (user_id, good_rx)
-                if bad_rx > stats["most_bad_rx"][1]:
-                    stats["most_bad_rx"] = (user_id, bad_rx)
-
-        if users_processed == 0:
-            return await ctx.send(f"No data found for the **{period}** period.")
-
         # Formatting Helper
         def fmt_winner(key, label, value_label=""):
             uid, val = stats[key]
@@ -520,21 +739,13 @@ class VibeCheck(getattr(commands, "Cog", object)):
         except asyncio.TimeoutError:
             return await confirmation_msg.edit(content="Reset command timed out.")
 
-        await confirmation_msg.edit(content=f"Resetting {period} stats... please wait.")
-        
-        all_users = await self.conf.all_users()
-        key = f"{period}_data"
-        empty_struct = {"score": 0, "good_sent": 0, "bad_sent": 0, "good_rx": 0, "bad_rx": 0}
-
-        count = 0
-        for uid in all_users:
-            user = self.bot.get_user(int(uid)) or self.bot.get_user(int(uid)) # Try to get user obj
-            if not user:
-                 # If user obj not found, we use config user_from_id context
-                 await self.conf.user_from_id(int(uid)).set_raw(key, value=empty_struct)
-            else:
-                await self.conf.user(user).set_raw(key, value=empty_struct)
-            count += 1
+        # Bumping the generation retires every stored bucket for this period at once;
+        # buckets are reset lazily the next time each user sends or receives vibes.
+        count = len(self.period_stats[period])
+        async with self.conf.period_generations() as generations:
+            generations[period] = generations.get(period, 0) + 1
+            self._period_generations[period] = generations[period]
+        self.period_stats[period].clear()
             
         await ctx.send(f"✅ Reset **{period}** stats for {count} users.")
 
@@ -552,12 +763,9 @@ class VibeCheck(getattr(commands, "Cog", object)):
             reverse = False
             top = -top
         
-        members_sorted = sorted(
-            await self._get_all_members(ctx.bot), key=lambda x: x.vibes, reverse=reverse
-        )
-        if len(members_sorted) < top:
-            top = len(members_sorted)
-        topten = members_sorted[:top]
+        topten = await self._get_all_members(ctx.bot, limit=top, reverse=reverse)
+        if len(topten) < top:
+            top = len(topten)
         highscore = ""
         place = 1
         for member in topten:
@@ -576,10 +784,8 @@ class VibeCheck(getattr(commands, "Cog", object)):
         """
         Displays a table of user vibe ratios (Good Sent - Bad Sent), sorted from highest to lowest.
         """
-        data = await self._get_all_members_ratios(ctx.bot)
-        
-        # Sort by ratio descending
-        data_sorted = sorted(data, key=lambda x: x.ratio, reverse=True)
+        # Already sorted by ratio descending
+        data_sorted = await self._get_all_members_ratios(ctx.bot)
         
         if not data_sorted:
             return await ctx.send("No vibe activity recorded yet.")
@@ -668,22 +874,10 @@ class VibeCheck(getattr(commands, "Cog", object)):
         bad_sent = user_data.get("bad_vibes_sent", 0)
         ratio = good_sent - bad_sent
         
-        # 2. Calculate Unique Incoming Vibes (Iterate all users)
-        # This is required because 'interactions' stores OUTGOING vibes.
-        unique_good_count = 0
-        unique_bad_count = 0
-        target_id_str = str(user.id)
-        
-        all_users = await self.conf.all_users()
-        
-        for giver_id, giver_data in all_users.items():
-            interactions = giver_data.get("interactions", {})
-            if target_id_str in interactions:
-                stats = interactions[target_id_str]
-                if stats.get("good", 0) > 0:
-                    unique_good_count += 1
-                if stats.get("bad", 0) > 0:
-                    unique_bad_count += 1
+        # 2. Unique Incoming Vibes
+        # 'interactions' stores OUTGOING vibes, so we read the reverse index instead.
+        unique_good_count = len(self.good_vibe_givers.get(user.id, ()))
+        unique_bad_count = len(self.bad_vibe_givers.get(user.id, ()))
 
         # 3. Build Embed
         embed = discord.Embed(
@@ -725,6 +919,18 @@ class VibeCheck(getattr(commands, "Cog", object)):
             await self.conf.guild(ctx.guild).req_level_bad.set(level)
             await ctx.send(f"✅ Users now need to be **Level {level}** to send **Bad Vibes**.")
 
+    @vibecheckset.command(name="debugxp")
+    @checks.is_owner()
+    async def set_debug_xp(self, ctx: commands.Context, enabled: bool):
+        """
+        Toggle XP debug logging for new member XP rewards.
+        When on, each grant re-reads the user's XP before and after to log the change.
+        """
+        await self.conf.debug_xp_logs.set(enabled)
+        self._debug_xp = enabled
+        state = "enabled" if enabled else "disabled"
+        await ctx.send(f"XP debug logging has been **{state}**.")
+
     @vibecheckset.command(name="ratiothreshold")
     async def set_ratio_thresholds(self, ctx: commands.Context, soft: int, hard: int):
         """
@@ -1205,6 +1411,8 @@ class VibeCheck(getattr(commands, "Cog", object)):
         await self.conf.user(user).vibes.set(0)
         # Reset new member award flag so testing can happen again
         await self.conf.user(user).new_member_xp_awarded.set(False)
+        self.vibe_board_cache.discard(user.id)
+        self._update_period_stats(user.id, await self.conf.user(user).all())
         await ctx.send("{}'s vibes has been reset to 0.".format(user.name))
         
     @vibecheckset.command(name="resetratio")
@@ -1214,9 +1422,13 @@ class VibeCheck(getattr(commands, "Cog", object)):
         log.debug("Resetting %s's vibe ratio stats", str(user))
         
         # Reset specific fields, keep main score and cooldown timestamps
+        interactions = await self.conf.user(user).interactions()
         await self.conf.user(user).good_vibes_sent.set(0)
         await self.conf.user(user).bad_vibes_sent.set(0)
         await self.conf.user(user).interactions.set({})
+        self._unindex_giver(user.id, interactions)
+        self.ratio_board_cache.discard(user.id)
+        self._update_period_stats(user.id, await self.conf.user(user).all())
         
         await ctx.send("{}'s vibe ratio statistics have been reset.".format(user.name))
 
@@ -1260,6 +1472,8 @@ class VibeCheck(getattr(commands, "Cog", object)):
                 await self.conf.user(user_obj).monthly_data.set({"score": 0, "good_sent": 0, "bad_sent": 0, "good_rx": 0, "bad_rx": 0})
                 await self.conf.user(user_obj).yearly_data.set({"score": 0, "good_sent": 0, "bad_sent": 0, "good_rx": 0, "bad_rx": 0})
                 
+                self._discard_from_leaderboards(user_obj.id)
+                self._unindex_giver(user_obj.id, user_conf.get("interactions", {}))
                 reset_count += 1
                 
         await ctx.send(f"✅ **Success!** Reset data for **{reset_count}** users globally.")
@@ -1287,17 +1501,17 @@ class VibeCheck(getattr(commands, "Cog", object)):
 
         await confirmation_msg.edit(content="Scanning user data and pruning departed members... This may take a moment.")
 
-        all_user_ids = (await self.conf.all_users()).keys()
-        
-        current_member_ids = set()
-        for guild in self.bot.guilds:
-            current_member_ids.update(member.id for member in guild.members)
+        all_user_data = await self.conf.all_users()
+        if not self._member_index_ready:
+            await self._build_member_index()
             
         pruned_count = 0
         
-        for user_id in all_user_ids:
-            if user_id not in current_member_ids:
+        for user_id, user_conf in all_user_data.items():
+            if user_id not in self.member_guilds:
                 await self.conf.user_from_id(user_id).clear()
+                self._discard_from_leaderboards(user_id)
+                self._unindex_giver(user_id, user_conf.get("interactions", {}))
                 pruned_count += 1
                 
         await ctx.send(f"✅ **Cleanup complete!** Successfully pruned vibe scores for **{pruned_count}** departed users.")
@@ -1353,145 +1567,26 @@ class VibeCheck(getattr(commands, "Cog", object)):
             return False, req_level
 
     async def _get_user_level(self, guild: discord.Guild, member: discord.Member) -> int:
-        """
-        Attempts to retrieve a user's level from the LevelUp cog.
-        Supports: Vertyco (Data/DB/API) and Standard Red (Config).
-        """
-        levelup = self.bot.get_cog("LevelUp")
-        if not levelup:
-            return 0
-        
-        # 1. Preferred API Method (Explicitly requested for integration)
-        if hasattr(levelup, "get_level"):
-            try:
-                val = levelup.get_level(member)
-                if asyncio.iscoroutine(val):
-                    val = await val
-                return int(val)
-            except Exception:
-                pass
-        
-        uid_str = str(member.id)
-        gid = guild.id
-        
-        # --- Method 2: Vertyco's New DB Structure (Pydantic) ---
-        # Checks if the cog uses a 'db' object with specific attributes
-        if hasattr(levelup, "db"):
-            try:
-                # Common path: levelup.db.get_conf(guild_id).users[user_id].level
-                if hasattr(levelup.db, "get_conf"):
-                    conf = levelup.db.get_conf(gid)
-                    if conf:
-                        # Pydantic models usually access users via dict-like get or attribute
-                        users = getattr(conf, "users", {})
-                        if isinstance(users, dict):
-                            user_data = users.get(member.id) or users.get(uid_str)
-                            if user_data:
-                                # user_data might be an object or dict
-                                if isinstance(user_data, dict):
-                                    return int(user_data.get("level", 0))
-                                else:
-                                    return int(getattr(user_data, "level", 0))
-            except Exception as e:
-                log.debug(f"VibeCheck: Failed to read Vertyco DB: {e}")
-
-        # --- Method 3: Vertyco's Old Data Cache (Dict) ---
-        # Checks direct dictionary access used in older versions
-        if hasattr(levelup, "data") and isinstance(levelup.data, dict):
-            try:
-                g_data = levelup.data.get(gid) or levelup.data.get(str(gid))
-                if g_data:
-                    users = g_data.get("users", {})
-                    u_data = users.get(member.id) or users.get(uid_str)
-                    if u_data:
-                        return int(u_data.get("level", 0))
-            except Exception as e:
-                log.debug(f"VibeCheck: Failed to access Vertyco LevelUp data: {e}")
-
-        # --- Method 4: Standard Red Config (Fallback) ---
-        # Uses the official async Config API
-        try:
-            # FIX: Use .all() or specific value access, .get() does not exist on Config Group
-            # We try to fetch just the level value directly for efficiency
-            level = await levelup.config.guild(guild).users(uid_str).level()
-            if level:
-                return int(level)
-        except AttributeError:
-            # If 'users' group doesn't exist or structure is vastly different
-            log.debug("VibeCheck: LevelUp Config structure mismatch.")
-        except Exception as e:
-            log.debug(f"VibeCheck: Config access failed: {e}")
-            
-        return 0
+        """Retrieves a user's level from the LevelUp cog (cached, see LevelUpAdapter)."""
+        return await self.levelup.get_level(guild, member.id)
 
     async def _get_user_xp(self, guild: discord.Guild, member: discord.Member) -> int:
-        """
-        Retrieves user XP using multiple potential LevelUp interfaces.
-        Similar to _get_user_level but targets XP specifically.
-        """
-        levelup = self.bot.get_cog("LevelUp")
-        if not levelup:
-            return 0
-        
-        uid_str = str(member.id)
-        gid = guild.id
-
-        # 1. Try Direct API/Cog Method (User suggested 'get_xp')
-        if hasattr(levelup, "get_xp"):
-            try:
-                val = await levelup.get_xp(guild.id, member.id)
-                if val is not None:
-                    return int(val)
-            except Exception:
-                pass
-            
-        # 2. Vertyco DB (Pydantic)
-        if hasattr(levelup, "db"):
-            try:
-                if hasattr(levelup.db, "get_conf"):
-                    conf = levelup.db.get_conf(gid)
-                    if conf:
-                        users = getattr(conf, "users", {})
-                        if isinstance(users, dict):
-                            u = users.get(member.id) or users.get(uid_str)
-                            if u:
-                                return int(getattr(u, "xp", 0) if not isinstance(u, dict) else u.get("xp", 0))
-            except Exception:
-                pass
-
-        # 3. Vertyco Old Data
-        if hasattr(levelup, "data") and isinstance(levelup.data, dict):
-             try:
-                g_data = levelup.data.get(gid) or levelup.data.get(str(gid))
-                if g_data:
-                    users = g_data.get("users", {})
-                    u = users.get(member.id) or users.get(uid_str)
-                    if u:
-                        return int(u.get("xp", 0))
-             except Exception:
-                 pass
-
-        # 4. Red Config (Standard)
-        try:
-             xp = await levelup.config.guild(guild).users(uid_str).xp()
-             if xp:
-                 return int(xp)
-        except Exception:
-             pass
-        
-        return 0
+        """Retrieves a user's XP from the LevelUp cog."""
+        return await self.levelup.get_xp(guild, member.id)
 
     async def _give_levelup_xp(self, guild: discord.Guild, member: discord.Member, amount: int):
         """
-        Attempts to grant XP using the LevelUp cog, with pre/post debug logging.
+        Attempts to grant XP using the LevelUp cog.
+        Pre/post XP reads for debug logging only happen when `[p]vibecheckset debugxp` is on.
         """
         levelup = self.bot.get_cog("LevelUp")
         if not levelup:
             return
 
         # Pre-Check Debug Log
-        old_xp = await self._get_user_xp(guild, member)
-        log.info(f"[VibeCheck Debug] Awarding {amount} XP to {member.name}. Current XP: {old_xp}")
+        if self._debug_xp:
+            old_xp = await self._get_user_xp(guild, member)
+            log.info(f"[VibeCheck Debug] Awarding {amount} XP to {member.name}. Current XP: {old_xp}")
 
         try:
             # Vertyco/Red Modern: add_xp(guild_id, user_id, amount)
@@ -1513,10 +1608,13 @@ class VibeCheck(getattr(commands, "Cog", object)):
         except Exception as e:
             log.error(f"Failed to grant LevelUp XP: {e}")
 
+        # The grant may have changed their level
+        self.levelup.invalidate(guild.id, member.id)
+
         # Post-Check Debug Log
-        # Small delay might be needed for DB commits in some systems, but usually fine here
-        new_xp = await self._get_user_xp(guild, member)
-        log.info(f"[VibeCheck Debug] XP Transaction Complete for {member.name}. New XP: {new_xp} (Change: {new_xp - old_xp})")
+        if self._debug_xp:
+            new_xp = await self._get_user_xp(guild, member)
+            log.info(f"[VibeCheck Debug] XP Transaction Complete for {member.name}. New XP: {new_xp} (Change: {new_xp - old_xp})")
 
     async def _get_active_vote_msg_id(self, guild: discord.Guild, user_id: int) -> Optional[str]:
         """Check if user has an ongoing kick vote."""
@@ -1526,87 +1624,109 @@ class VibeCheck(getattr(commands, "Cog", object)):
                 return msg_id
         return None
 
-    async def _update_stats_bucket(self, user: discord.User, amount: int, bucket_name: str, is_good: bool, is_sender: bool):
-        """Helper to update monthly/yearly buckets."""
-        async with self.conf.user(user).get_attr(bucket_name)() as data:
-            # Update Score
-            if not is_sender: # Receiver gets the score change
-                data["score"] = data.get("score", 0) + amount
+    @staticmethod
+    def _apply_stats_bucket(data: dict, amount: int, is_good: bool, is_sender: bool):
+        """Helper to update a monthly/yearly bucket dict in place."""
+        # Update Score
+        if not is_sender: # Receiver gets the score change
+            data["score"] = data.get("score", 0) + amount
 
-            # Update Counts
-            if is_sender:
-                if is_good:
-                    data["good_sent"] = data.get("good_sent", 0) + 1
-                else:
-                    data["bad_sent"] = data.get("bad_sent", 0) + 1
-            else: # Receiver
-                if is_good:
-                    data["good_rx"] = data.get("good_rx", 0) + 1
-                else:
-                    data["bad_rx"] = data.get("bad_rx", 0) + 1
+        # Update Counts
+        if is_sender:
+            if is_good:
+                data["good_sent"] = data.get("good_sent", 0) + 1
+            else:
+                data["bad_sent"] = data.get("bad_sent", 0) + 1
+        else: # Receiver
+            if is_good:
+                data["good_rx"] = data.get("good_rx", 0) + 1
+            else:
+                data["bad_rx"] = data.get("bad_rx", 0) + 1
+
+    def _current_bucket(self, data: dict, period: str) -> dict:
+        """Returns the user's bucket for a period, starting it fresh if it belongs to a retired generation."""
+        generation = self._period_generations.get(period, 0)
+        bucket = data.setdefault(f"{period}_data", {})
+        if bucket.get("period", 0) != generation:
+            bucket.clear()
+            bucket.update({"score": 0, "good_sent": 0, "bad_sent": 0, "good_rx": 0, "bad_rx": 0, "period": generation})
+        return bucket
+
+    def _get_user_lock(self, user_id: int) -> asyncio.Lock:
+        """Per-user lock serialising read-modify-writes of a user's vibe data."""
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = self._user_locks[user_id] = asyncio.Lock()
+        return lock
 
     async def _add_vibes(self, giver: discord.User, receiver: discord.User, amount: int, is_good: bool):
         """
         Handles the core logic for adding/subtracting vibes and triggering checks.
         """
-        # 1. Update Receiver's Score
-        # We need full data to calculate ratio later
-        receiver_settings = self.conf.user(receiver)
-        async with receiver_settings.all() as r_data:
-            current_vibes = r_data.get("vibes", 0)
-            new_vibes = current_vibes + amount
-            r_data["vibes"] = new_vibes
-            
-            # Needed for Ratio Calculation
-            r_good_sent = r_data.get("good_vibes_sent", 0)
-            r_bad_sent = r_data.get("bad_vibes_sent", 0)
-            receiver_ratio = r_good_sent - r_bad_sent
+        # Lock both users in a stable order so concurrent vibes between the same pair can't deadlock
+        async with contextlib.AsyncExitStack() as stack:
+            for user_id in sorted({giver.id, receiver.id}):
+                await stack.enter_async_context(self._get_user_lock(user_id))
+
+            # 1. Update Receiver (Score + Period Stats) in one write
+            # We need full data to calculate ratio later
+            receiver_settings = self.conf.user(receiver)
+            async with receiver_settings.all() as r_data:
+                current_vibes = r_data.get("vibes", 0)
+                new_vibes = current_vibes + amount
+                r_data["vibes"] = new_vibes
+
+                # Needed for Ratio Calculation
+                r_good_sent = r_data.get("good_vibes_sent", 0)
+                r_bad_sent = r_data.get("bad_vibes_sent", 0)
+                receiver_ratio = r_good_sent - r_bad_sent
+                already_awarded = r_data.get("new_member_xp_awarded", False)
+
+                for period in ("monthly", "yearly"):
+                    bucket = self._current_bucket(r_data, period)
+                    self._apply_stats_bucket(bucket, amount, is_good, is_sender=False)
+            self._update_leaderboards(receiver.id, {"vibes": new_vibes})
+            self._update_period_stats(receiver.id, r_data)
+
+            # 2. Update Giver (Sent Vibes, Interactions + Period Stats) in one write
+            async with self.conf.user(giver).all() as giver_data:
+                if is_good:
+                    giver_data["good_vibes_sent"] = giver_data.get("good_vibes_sent", 0) + 1
+                    interaction_key = "good"
+                else:
+                    giver_data["bad_vibes_sent"] = giver_data.get("bad_vibes_sent", 0) + 1
+                    interaction_key = "bad"
 
-        # 2. Update Giver's Statistics (Sent Vibes & Interactions)
-        async with self.conf.user(giver).all() as giver_data:
-            if is_good:
-                giver_data["good_vibes_sent"] = giver_data.get("good_vibes_sent", 0) + 1
-                interaction_key = "good"
-            else:
-                giver_data["bad_vibes_sent"] = giver_data.get("bad_vibes_sent", 0) + 1
-                interaction_key = "bad"
+                interactions = giver_data.get("interactions", {})
+                receiver_id_str = str(receiver.id)
 
-            interactions = giver_data.get("interactions", {})
-            receiver_id_str = str(receiver.id)
-            
-            if receiver_id_str not in interactions:
-                interactions[receiver_id_str] = {"good": 0, "bad": 0}
-            
-            interactions[receiver_id_str][interaction_key] += 1
-            giver_data["interactions"] = interactions
+                if receiver_id_str not in interactions:
+                    interactions[receiver_id_str] = {"good": 0, "bad": 0}
 
-        # 3. Update Monthly & Yearly Stats (New Logic)
-        # Giver (Sender) updates
-        await self._update_stats_bucket(giver, amount, "monthly_data", is_good, is_sender=True)
-        await self._update_stats_bucket(giver, amount, "yearly_data", is_good, is_sender=True)
-        
-        # Receiver (Recipient) updates
-        await self._update_stats_bucket(receiver, amount, "monthly_data", is_good, is_sender=False)
-        await self._update_stats_bucket(receiver, amount, "yearly_data", is_good, is_sender=False)
+                interactions[receiver_id_str][interaction_key] += 1
+                giver_data["interactions"] = interactions
 
-        # 4. Find the Guild context and Member object for Receiver
-        member_receiver = None
-        target_guild = None
-        
-        for guild in self.bot.guilds:
-            member = guild.get_member(receiver.id)
-            if member:
-                member_receiver = member
-                target_guild = guild
-                break 
+                for period in ("monthly", "yearly"):
+                    bucket = self._current_bucket(giver_data, period)
+                    self._apply_stats_bucket(bucket, amount, is_good, is_sender=True)
+            self._update_leaderboards(giver.id, giver_data)
+            self._update_period_stats(giver.id, giver_data)
+            givers_index = self.good_vibe_givers if is_good else self.bad_vibe_givers
+            givers_index.setdefault(receiver.id, set()).add(giver.id)
+
+        # 3. Find the Guild context and Member object for Receiver
+        member_receiver = self._resolve_member(receiver.id)
+        target_guild = member_receiver.guild if member_receiver else None
 
         if not member_receiver or not target_guild:
             return 
+
+        # Single read of the guild settings for every check below
+        all_guild_settings = await self.conf.guild(target_guild).all()
             
-        # 5. Check for New Member XP Reward (DEBUG ADDED)
+        # 4. Check for New Member XP Reward (DEBUG ADDED)
         if new_vibes > current_vibes: 
-            guild_conf = self.conf.guild(target_guild)
-            xp_minutes = await guild_conf.new_member_xp_minutes()
+            xp_minutes = all_guild_settings.get("new_member_xp_minutes")
             
             if xp_minutes and xp_minutes > 0:
                 if member_receiver.joined_at:
@@ -1617,11 +1737,10 @@ class VibeCheck(getattr(commands, "Cog", object)):
                     age_seconds = (now - joined_at).total_seconds()
                     
                     # Log Check
-                    xp_threshold = await guild_conf.new_member_xp_threshold()
+                    xp_threshold = all_guild_settings.get("new_member_xp_threshold", 10)
                     is_new_user = age_seconds <= (xp_minutes * 60)
                     
                     if is_new_user or (age_seconds < (xp_minutes * 60 * 2)): # Log if new or recently new
-                        already_awarded = await receiver_settings.new_member_xp_awarded()
                         needed = xp_threshold - new_vibes
                         log.info(
                             f"[VibeCheck Debug] {member_receiver.name} Status:\n"
@@ -1632,19 +1751,15 @@ class VibeCheck(getattr(commands, "Cog", object)):
                         )
 
                     if is_new_user and current_vibes < xp_threshold <= new_vibes:
-                        already_awarded = await receiver_settings.new_member_xp_awarded()
                         if not already_awarded:
-                            xp_amount = await guild_conf.new_member_xp_amount()
+                            xp_amount = all_guild_settings.get("new_member_xp_amount", 0)
                             if xp_amount > 0:
                                 await self._give_levelup_xp(target_guild, member_receiver, xp_amount)
                                 await receiver_settings.new_member_xp_awarded.set(True)
                                 log.info(f"[VibeCheck] Awarded {xp_amount} XP to new member {member_receiver.name}")
 
-        # 6. Run WarnSystem Integration Check (With Anti-Spam)
+        # 5. Run WarnSystem Integration Check (With Anti-Spam)
         if new_vibes < current_vibes:
-            guild_conf = self.conf.guild(target_guild)
-            all_guild_settings = await guild_conf.all()
-            
             ban_thresh = all_guild_settings.get('ban_threshold')
             kick_thresh = all_guild_settings.get('kick_threshold')
             warn_thresh = all_guild_settings.get('warn_threshold')
@@ -1721,21 +1836,12 @@ class VibeCheck(getattr(commands, "Cog", object)):
                     await self._trigger_warnsystem(target_guild, member_receiver, warn_author, 1, f"{reason} (Score: {new_vibes})")
                     triggered = True
         
-        # 7. Perform Logging
-        await self._log_vibe_change(target_guild, giver, member_receiver, amount, current_vibes, new_vibes)
+        # 6. Perform Logging
+        await self._log_vibe_change(target_guild, all_guild_settings, giver, member_receiver, amount, current_vibes, new_vibes)
         
     async def _calculate_unique_haters(self, user_id: int) -> int:
         """Count how many unique users have given bad vibes to this user."""
-        all_users = await self.conf.all_users()
-        unique_haters = 0
-        user_id_str = str(user_id)
-        
-        for giver_id, data in all_users.items():
-            interactions = data.get("interactions", {})
-            if user_id_str in interactions:
-                if interactions[user_id_str].get("bad", 0) > 0:
-                    unique_haters += 1
-        return unique_haters
+        return len(self.bad_vibe_givers.get(user_id, ()))
 
     async def _start_kick_vote(self, guild: discord.Guild, member: discord.Member, current_score: int, threshold: int):
         """
@@ -1873,10 +1979,10 @@ class VibeCheck(getattr(commands, "Cog", object)):
         except Exception as e:
             log.error(f"Failed to trigger WarnSystem: {e}")
 
-    async def _log_vibe_change(self, guild: discord.Guild, giver: discord.User, receiver: discord.Member, amount: int, old_vibes: int, new_vibes: int):
-        """Logs the vibe change and threshold breach events to the configured channel."""
+    async def _log_vibe_change(self, guild: discord.Guild, settings: dict, giver: discord.User, receiver: discord.Member, amount: int, old_vibes: int, new_vibes: int):
+        """Logs the vibe change and threshold breach events to the configured channel. settings is the guild's resolved config."""
         
-        log_channel_id = await self.conf.guild(guild).log_channel_id()
+        log_channel_id = settings.get("log_channel_id")
         if log_channel_id is None:
             return
 
@@ -1905,11 +2011,33 @@ class VibeCheck(getattr(commands, "Cog", object)):
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
         """Clears a user's GLOBAL vibes score when they leave a guild."""
-        
-        user_data = await self.conf.user(member).all()
-        if 'vibes' not in user_data or user_data.get('vibes') is None:
+        self._unindex_member(member.id, member.guild.id)
+
+        # The board holds every non-zero score, so anyone missing from it has nothing to clear
+        if self.vibe_board_cache.get(member.id) is None:
             return
         await self.conf.user(member).vibes.set(0)
+        self.vibe_board_cache.discard(member.id)
+        self._update_period_stats(member.id, await self.conf.user(member).all())
+
+    @commands.Cog.listener()
+    async def on_member_levelup(self, guild: discord.Guild, member: discord.Member, *args, **kwargs):
+        """Drops the cached level when LevelUp reports a level change."""
+        self.levelup.invalidate(guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.member_guilds.setdefault(member.id, set()).add(member.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        for member in guild.members:
+            self.member_guilds.setdefault(member.id, set()).add(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        for user_id in list(self.member_guilds):
+            self._unindex_member(user_id, guild.id)
 
     async def cog_command_error(self, ctx: commands.Context, error: commands.CommandError):
         """Handles errors for commands in this cog, specifically custom cooldown messages."""
@@ -1933,13 +2061,124 @@ class VibeCheck(getattr(commands, "Cog", object)):
         else:
             raise error 
                 
-    async def _get_all_members(self, bot):
-        """Get a list of members with vibes."""
-        ret = []
+    async def _build_indexes(self):
+        """Seeds the in-memory boards and the reverse interaction index from Config."""
+        self.vibe_board_cache.clear()
+        self.ratio_board_cache.clear()
+        self.good_vibe_givers.clear()
+        self.bad_vibe_givers.clear()
+        for aggregates in self.period_stats.values():
+            aggregates.clear()
         for user_id, conf in (await self.conf.all_users()).items():
-            vibes = conf.get("vibes")
-            if not vibes:
+            self._update_leaderboards(int(user_id), conf)
+            self._update_period_stats(int(user_id), conf)
+            self._index_giver(int(user_id), conf.get("interactions", {}))
+        log.debug(
+            f"VibeCheck: Indexes built ({len(self.vibe_board_cache)} scores, "
+            f"{len(self.ratio_board_cache)} ratios, {len(self.bad_vibe_givers)} users with bad vibes)."
+        )
+
+    def _index_giver(self, giver_id: int, interactions: dict):
+        """Adds a giver's outgoing interactions to the reverse index."""
+        for target_id_str, stats in interactions.items():
+            try:
+                target_id = int(target_id_str)
+            except (TypeError, ValueError):
+                continue
+            if stats.get("good", 0) > 0:
+                self.good_vibe_givers.setdefault(target_id, set()).add(giver_id)
+            if stats.get("bad", 0) > 0:
+                self.bad_vibe_givers.setdefault(target_id, set()).add(giver_id)
+
+    def _unindex_giver(self, giver_id: int, interactions: dict):
+        """Removes a giver's outgoing interactions from the reverse index."""
+        for target_id_str in interactions:
+            try:
+                target_id = int(target_id_str)
+            except (TypeError, ValueError):
                 continue
+            for index in (self.good_vibe_givers, self.bad_vibe_givers):
+                givers = index.get(target_id)
+                if givers is not None:
+                    givers.discard(giver_id)
+                    if not givers:
+                        del index[target_id]
+
+    def _update_leaderboards(self, user_id: int, data: dict):
+        """Syncs a user's board entries with their (partial) user data."""
+        if "vibes" in data:
+            vibes = data.get("vibes") or 0
+            if vibes:
+                self.vibe_board_cache.set(user_id, vibes)
+            else:
+                self.vibe_board_cache.discard(user_id)
+
+        if "good_vibes_sent" in data or "bad_vibes_sent" in data:
+            good = data.get("good_vibes_sent", 0)
+            bad = data.get("bad_vibes_sent", 0)
+            if good == 0 and bad == 0:
+                self.ratio_board_cache.discard(user_id)
+            else:
+                self.ratio_board_cache.set(user_id, good - bad)
+
+    async def _build_member_index(self):
+        """Seeds the user_id -> guild_ids index from the member cache once the bot is ready."""
+        await self.bot.wait_until_red_ready()
+        member_guilds: Dict[int, Set[int]] = {}
+        for guild in self.bot.guilds:
+            for member in guild.members:
+                member_guilds.setdefault(member.id, set()).add(guild.id)
+        self.member_guilds = member_guilds
+        self._member_index_ready = True
+        log.debug(f"VibeCheck: Member index built ({len(member_guilds)} users).")
+
+    def _unindex_member(self, user_id: int, guild_id: int):
+        guild_ids = self.member_guilds.get(user_id)
+        if guild_ids is not None:
+            guild_ids.discard(guild_id)
+            if not guild_ids:
+                del self.member_guilds[user_id]
+
+    def _resolve_member(self, user_id: int) -> Optional[discord.Member]:
+        """Returns the user's Member object in the first shared guild, or None."""
+        if self._member_index_ready:
+            guild_ids = sorted(self.member_guilds.get(user_id, ()))
+            guilds = (self.bot.get_guild(gid) for gid in guild_ids)
+        else:
+            guilds = self.bot.guilds
+        for guild in guilds:
+            member = guild.get_member(user_id) if guild else None
+            if member:
+                return member
+        return None
+
+    def _update_period_stats(self, user_id: int, data: dict):
+        """Syncs a user's report aggregates with their full user data."""
+        self.period_stats["alltime"].update(user_id, {
+            "score": data.get("vibes", 0),
+            "good_sent": data.get("good_vibes_sent", 0),
+            "bad_sent": data.get("bad_vibes_sent", 0),
+            # For All Time, we don't track RX explicitly in the old schema
+        })
+        for period, generation in self._period_generations.items():
+            bucket = data.get(f"{period}_data") or {}
+            if bucket.get("period", 0) == generation:
+                self.period_stats[period].update(user_id, bucket)
+            else:
+                self.period_stats[period].discard(user_id)
+
+    def _discard_from_leaderboards(self, user_id: int):
+        self.vibe_board_cache.discard(user_id)
+        self.ratio_board_cache.discard(user_id)
+        for aggregates in self.period_stats.values():
+            aggregates.discard(user_id)
+
+    async def _get_all_members(self, bot, limit: Optional[int] = None, reverse: bool = True):
+        """Get a list of members with vibes, sorted by vibes."""
+        ret = []
+        for user_id, vibes in self.vibe_board_cache.ranked(reverse=reverse):
+            if limit is not None and len(ret) >= limit:
+                break
             user = bot.get_user(user_id)
             if user is None:
                 continue
@@ -1947,20 +2186,12 @@ class VibeCheck(getattr(commands, "Cog", object)):
         return ret
     
     async def _get_all_members_ratios(self, bot):
-        """Get a list of members with calculated ratios."""
+        """Get a list of members with calculated ratios, sorted highest first."""
         ret = []
-        for user_id, conf in (await self.conf.all_users()).items():
-            good = conf.get("good_vibes_sent", 0)
-            bad = conf.get("bad_vibes_sent", 0)
-            
-            if good == 0 and bad == 0:
-                continue
-                
-            ratio = good - bad
-            
+        for user_id, ratio in self.ratio_board_cache.ranked():
             user = bot.get_user(user_id)
             if user is None:
                 continue
                 
             ret.append(MemberRatioInfo(id=user_id, name=str(user), ratio=ratio))
-        return ret
\ No newline at end of file
+        return ret